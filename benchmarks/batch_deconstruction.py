@@ -0,0 +1,43 @@
+"""Compares memory and time of `deconstruct_many()` against per-row deconstruction.
+
+Usage: python benchmarks/batch_deconstruction.py [rows]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from batch_generation import build_columns
+
+from virtuaaliviivakoodi import (
+    deconstruct_many,
+    deconstruct_virtuaaliviivakoodi,
+    virtuaaliviivakoodi_many,
+)
+
+
+def measure(function, *args):
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = function(*args)
+    elapsed = time.perf_counter() - started
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, size
+
+
+def main(rows: int) -> None:
+    virtuaaliviivakoodit = virtuaaliviivakoodi_many(*build_columns(rows))
+
+    _, per_row_time, per_row_size = measure(
+        lambda: [deconstruct_virtuaaliviivakoodi(code) for code in virtuaaliviivakoodit]
+    )
+    _, batch_time, batch_size = measure(deconstruct_many, virtuaaliviivakoodit)
+
+    print(f"rows:    {rows}")
+    print(f"per-row: {per_row_time:.3f}s, {per_row_size / rows:.0f} bytes/row")
+    print(f"batch:   {batch_time:.3f}s, {batch_size / rows:.0f} bytes/row")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
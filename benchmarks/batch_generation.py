@@ -0,0 +1,64 @@
+"""Compares `virtuaaliviivakoodi_many()` against calling `virtuaaliviivakoodi()` per row.
+
+Usage: python benchmarks/batch_generation.py [rows]
+"""
+
+import decimal
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+from virtuaaliviivakoodi import virtuaaliviivakoodi, virtuaaliviivakoodi_many
+
+ROUNDS = 3
+
+IBANS = [
+    "FI49 5000 9420 0287 30",
+    "FI7944052020036082",
+    "FI5810171000000122",
+    "FI0250004640001302",
+]
+
+
+def build_columns(rows: int):
+    rng = random.Random(1)
+    first_due_date = date(2024, 1, 1)
+
+    ibans = [rng.choice(IBANS) for _ in range(rows)]
+    references = [str(rng.randrange(1000, 10**19)) for _ in range(rows)]
+    euro_amounts = [
+        decimal.Decimal(rng.randrange(0, 100_000_00)) / 100 for _ in range(rows)
+    ]
+    due_dates = [
+        first_due_date + timedelta(days=rng.randrange(60)) for _ in range(rows)
+    ]
+
+    return ibans, references, euro_amounts, due_dates
+
+
+def main(rows: int) -> None:
+    columns = build_columns(rows)
+
+    per_call = batch = float("inf")
+
+    # Best of several rounds, as single runs vary a lot on busy machines
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        expected = [virtuaaliviivakoodi(*row) for row in zip(*columns)]
+        per_call = min(per_call, time.perf_counter() - started)
+
+        started = time.perf_counter()
+        result = virtuaaliviivakoodi_many(*columns)
+        batch = min(batch, time.perf_counter() - started)
+
+        assert result == expected
+
+    print(f"rows:     {rows}")
+    print(f"per-call: {per_call:.3f}s ({rows / per_call:,.0f} rows/s)")
+    print(f"batch:    {batch:.3f}s ({rows / batch:,.0f} rows/s)")
+    print(f"speedup:  {per_call / batch:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
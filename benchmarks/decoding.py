@@ -0,0 +1,71 @@
+"""Decodes synthetic noisy scanlines of rendered barcodes.
+
+Every scanline has a random module width, ink spread that widens the bars and
+narrows the spaces, and noise in the pixel intensities.
+
+Usage: python benchmarks/decoding.py [scanlines]
+"""
+
+import random
+import sys
+import time
+
+from batch_generation import build_columns
+
+from virtuaaliviivakoodi import virtuaaliviivakoodi_many
+from virtuaaliviivakoodi.decoders import decode_runs, decode_scanlines
+from virtuaaliviivakoodi.renderers import code128c_widths
+
+QUIET_ZONE_PIXELS = 40
+
+
+def build_scanline(virtuaaliviivakoodi: str, rng: random.Random) -> bytes:
+    module_width = rng.uniform(2.0, 4.0)
+    spread = rng.uniform(-0.25, 0.25) * module_width
+    pixels = bytearray()
+    position = 0.0
+
+    for index, width in enumerate(code128c_widths(virtuaaliviivakoodi)):
+        is_bar = index % 2 == 0
+        end = position + int(width) * module_width + (spread if is_bar else -spread)
+        pixels += bytes([40 if is_bar else 220]) * (round(end) - len(pixels))
+        position = end
+
+    row = bytes([220]) * QUIET_ZONE_PIXELS + pixels + bytes([220]) * QUIET_ZONE_PIXELS
+
+    return bytes(min(255, max(0, pixel + int(rng.gauss(0, 25)))) for pixel in row)
+
+
+def main(count: int) -> None:
+    rng = random.Random(1)
+    virtuaaliviivakoodit = virtuaaliviivakoodi_many(*build_columns(count))
+    scanlines = [build_scanline(code, rng) for code in virtuaaliviivakoodit]
+
+    start = time.perf_counter()
+    results = decode_scanlines(scanlines)
+    elapsed = time.perf_counter() - start
+
+    decoded = sum(
+        result == expected for result, expected in zip(results, virtuaaliviivakoodit)
+    )
+    assert all(
+        result in (None, expected)
+        for result, expected in zip(results, virtuaaliviivakoodit)
+    )
+
+    runs = [
+        [int(width) * 3 for width in code128c_widths(code)]
+        for code in virtuaaliviivakoodit
+    ]
+    start = time.perf_counter()
+    for widths in runs:
+        decode_runs(widths)
+    runs_elapsed = time.perf_counter() - start
+
+    print(f"scanlines:   {count / elapsed:10,.0f} scanlines/s")
+    print(f"decoded:     {decoded / count:10.1%}")
+    print(f"run lengths: {count / runs_elapsed:10,.0f} barcodes/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
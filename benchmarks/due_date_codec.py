@@ -0,0 +1,40 @@
+"""Compares the due date codec against `strptime()` and `strftime()`.
+
+Usage: python benchmarks/due_date_codec.py [calls]
+"""
+
+import sys
+import timeit
+from datetime import date, datetime
+
+from virtuaaliviivakoodi.utils import decode_due_date, encode_due_date
+
+DUE_DATE = date(2022, 2, 2)
+ENCODED = "220202"
+
+
+def main(calls: int) -> None:
+    cases = {
+        "decode": (
+            lambda: datetime.strptime(ENCODED, "%y%m%d").date(),
+            lambda: decode_due_date(ENCODED),
+        ),
+        "encode": (
+            lambda: DUE_DATE.strftime("%y%m%d"),
+            lambda: encode_due_date(DUE_DATE),
+        ),
+    }
+
+    for case, (datetime_function, codec_function) in cases.items():
+        assert datetime_function() == codec_function()
+
+        datetime_time = timeit.timeit(datetime_function, number=calls) / calls * 1e9
+        codec_time = timeit.timeit(codec_function, number=calls) / calls * 1e9
+        print(
+            f"{case:8} datetime {datetime_time:6.0f} ns  codec {codec_time:6.0f} ns  "
+            f"{datetime_time / codec_time:4.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,107 @@
+"""Compares per-call latency of the fused engine against the validators/normalizers chain.
+
+Usage: python benchmarks/engine.py [calls]
+"""
+
+import decimal
+import sys
+import timeit
+from datetime import date
+
+from virtuaaliviivakoodi.engine import (
+    prepare_due_date,
+    prepare_euro_amount,
+    prepare_iban,
+    prepare_reference,
+)
+from virtuaaliviivakoodi.normalizers import (
+    normalize_due_date,
+    normalize_euro_amount,
+    normalize_iban,
+    normalize_reference,
+)
+from virtuaaliviivakoodi.utils import detect_symbol_version
+from virtuaaliviivakoodi.validators import (
+    validate_due_date,
+    validate_euro_amount,
+    validate_iban,
+    validate_reference,
+)
+
+IBAN = "FI49 5000 9420 0287 30"
+REFERENCE = "RF92 1234 2345"
+EURO_AMOUNT = decimal.Decimal("2222.55")
+DUE_DATE = date(2020, 12, 12)
+
+
+def chain():
+    validate_iban(IBAN)
+    validate_reference(REFERENCE)
+    validate_euro_amount(EURO_AMOUNT)
+    validate_due_date(DUE_DATE)
+
+    return (
+        detect_symbol_version(REFERENCE).value
+        + normalize_iban(IBAN)
+        + normalize_euro_amount(EURO_AMOUNT)
+        + normalize_reference(REFERENCE)
+        + normalize_due_date(DUE_DATE)
+    )
+
+
+def engine():
+    iban_segment = prepare_iban(IBAN)
+    symbol, reference_segment = prepare_reference(REFERENCE)
+
+    return (
+        symbol
+        + iban_segment
+        + prepare_euro_amount(EURO_AMOUNT)
+        + reference_segment
+        + prepare_due_date(DUE_DATE)
+    )
+
+
+def chain_iban() -> str:
+    validate_iban(IBAN)
+    return normalize_iban(IBAN)
+
+
+def chain_reference() -> str:
+    validate_reference(REFERENCE)
+    return detect_symbol_version(REFERENCE).value + normalize_reference(REFERENCE)
+
+
+def chain_euro_amount() -> str:
+    validate_euro_amount(EURO_AMOUNT)
+    return normalize_euro_amount(EURO_AMOUNT)
+
+
+def chain_due_date() -> str:
+    validate_due_date(DUE_DATE)
+    return normalize_due_date(DUE_DATE)
+
+
+STAGES = {
+    "iban": (chain_iban, lambda: prepare_iban(IBAN)),
+    "reference": (chain_reference, lambda: prepare_reference(REFERENCE)),
+    "euro_amount": (chain_euro_amount, lambda: prepare_euro_amount(EURO_AMOUNT)),
+    "due_date": (chain_due_date, lambda: prepare_due_date(DUE_DATE)),
+    "total": (chain, engine),
+}
+
+
+def main(calls: int) -> None:
+    assert chain() == engine()
+
+    for stage, (chain_function, engine_function) in STAGES.items():
+        chain_time = timeit.timeit(chain_function, number=calls) / calls * 1e9
+        engine_time = timeit.timeit(engine_function, number=calls) / calls * 1e9
+        print(
+            f"{stage:12} chain {chain_time:6.0f} ns  engine {engine_time:6.0f} ns  "
+            f"{chain_time / engine_time:4.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
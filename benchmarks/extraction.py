@@ -0,0 +1,75 @@
+"""Extracts virtuaaliviivakoodi's from a large generated text file.
+
+The text mixes prose, other numbers and virtuaaliviivakoodi's, some of which are
+split into groups by spaces and line breaks. Reports the throughput and the peak
+memory traced while extracting.
+
+Usage: python benchmarks/extraction.py [megabytes]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from batch_generation import build_columns
+
+from virtuaaliviivakoodi import extract_virtuaaliviivakoodit, virtuaaliviivakoodi_many
+
+PROSE = (
+    "Hei, ohessa lasku tilauksesta 123456 ajalta 1.1.-31.1.2024. Summa 100,20 EUR. "
+    "Maksathan laskun viimeistään eräpäivänä. Puhelin 040 123 4567.\n"
+)
+
+
+def write_text(path: str, megabytes: int, rng: random.Random) -> int:
+    virtuaaliviivakoodit = virtuaaliviivakoodi_many(*build_columns(1000))
+    count = 0
+
+    with open(path, "w", encoding="utf-8") as file:
+        while file.tell() < megabytes * 1_000_000:
+            paragraphs = [PROSE * rng.randrange(1, 40)]
+            code = rng.choice(virtuaaliviivakoodit)
+
+            if rng.random() < 0.5:
+                paragraphs.append(f"Virtuaaliviivakoodi: {code}\n")
+            else:
+                cut = rng.randrange(1, 54)
+                paragraphs.append(f"Viivakoodi {code[:cut]}\n{code[cut:]}\n")
+
+            file.write("".join(paragraphs))
+            count += 1
+
+    return count
+
+
+def main(megabytes: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "documents.txt")
+        expected = write_text(path, megabytes, random.Random(1))
+        size = os.path.getsize(path)
+
+        with open(path, "rb") as file:
+            start = time.perf_counter()
+            found = sum(1 for _ in extract_virtuaaliviivakoodit(file))
+            elapsed = time.perf_counter() - start
+
+        with open(path, "rb") as file:
+            tracemalloc.start()
+            for _ in extract_virtuaaliviivakoodit(file, chunk_size=1 << 16):
+                pass
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    assert found == expected
+
+    print(f"size:        {size / 1e6:10,.0f} MB")
+    print(f"found:       {found:10,}")
+    print(f"throughput:  {size / 1e6 / elapsed:10,.1f} MB/s")
+    print(f"peak memory: {peak / 1e3:10,.0f} kB with 64 kB chunks")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
@@ -0,0 +1,55 @@
+"""Finds the crossover point between serial and process pool generation.
+
+Usage: python benchmarks/parallel.py [workers]
+"""
+
+import os
+import sys
+import time
+
+from batch_generation import build_columns
+
+from virtuaaliviivakoodi import (
+    deconstruct_many,
+    deconstruct_parallel,
+    generate_parallel,
+    parallel,
+    virtuaaliviivakoodi_many_from_records,
+)
+
+SIZES = [1_000, 5_000, 10_000, 20_000, 50_000, 200_000, 1_000_000]
+
+
+def main(workers: int) -> None:
+    # Always use the process pool to measure it also below the threshold
+    parallel.SERIAL_THRESHOLD = 0
+    records = list(zip(*build_columns(max(SIZES))))
+
+    for size in SIZES:
+        chunk = records[:size]
+
+        start = time.perf_counter()
+        barcodes = virtuaaliviivakoodi_many_from_records(chunk)
+        serial_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        assert list(generate_parallel(chunk, workers=workers)) == barcodes
+        parallel_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        deconstruct_many(barcodes)
+        serial_deconstruct_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in deconstruct_parallel(barcodes, workers=workers, batches=True):
+            pass
+        parallel_deconstruct_time = time.perf_counter() - start
+
+        print(
+            f"{size:>9,} rows  generate {serial_time / parallel_time:5.2f}x  "
+            f"deconstruct {serial_deconstruct_time / parallel_deconstruct_time:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count())
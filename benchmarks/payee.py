@@ -0,0 +1,47 @@
+"""Compares generating barcodes for one payee with `virtuaaliviivakoodi()` and `Payee.barcode()`.
+
+Usage: python benchmarks/payee.py [calls]
+"""
+
+import sys
+import timeit
+from datetime import date
+
+from virtuaaliviivakoodi import Payee, virtuaaliviivakoodi
+
+IBAN = "FI49 5000 9420 0287 30"
+REFERENCE = "1234561"
+EURO_AMOUNT = 124.12
+DUE_DATE = date(2022, 2, 2)
+
+
+def main(calls: int) -> None:
+    payee = Payee(IBAN)
+    assert payee.barcode(REFERENCE, EURO_AMOUNT, DUE_DATE) == virtuaaliviivakoodi(
+        IBAN, REFERENCE, EURO_AMOUNT, DUE_DATE
+    )
+
+    function_time = (
+        timeit.timeit(
+            lambda: virtuaaliviivakoodi(IBAN, REFERENCE, EURO_AMOUNT, DUE_DATE),
+            number=calls,
+        )
+        / calls
+        * 1e9
+    )
+    payee_time = (
+        timeit.timeit(
+            lambda: payee.barcode(REFERENCE, EURO_AMOUNT, DUE_DATE), number=calls
+        )
+        / calls
+        * 1e9
+    )
+
+    print(f"virtuaaliviivakoodi() {function_time:6.0f} ns")
+    print(
+        f"Payee.barcode()       {payee_time:6.0f} ns  {function_time / payee_time:4.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,95 @@
+"""Measures the memory, reconciliation speed and reload time of `ReconciliationIndex`.
+
+The memory of the index is compared against a dict keyed on IBAN and reference
+strings with `Decimal` amounts.
+
+Usage: python benchmarks/reconciliation.py [invoices]
+"""
+
+import decimal
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from corpus import build_rows
+
+from virtuaaliviivakoodi import ReconciliationIndex
+
+
+def build_payments(rows, rng: random.Random):
+    payments = []
+
+    # A tenth of the payments are a cent short
+    for iban, reference, euro_amount, _ in rows:
+        amount_cents = round(decimal.Decimal(str(euro_amount)) * 100)
+
+        if rng.random() < 0.1:
+            amount_cents -= 1
+
+        payments.append(
+            {"iban": iban, "reference": reference, "amount_cents": amount_cents}
+        )
+
+    rng.shuffle(payments)
+
+    return payments
+
+
+def main(invoices: int) -> None:
+    rows = build_rows(invoices)
+    payments = build_payments(rows, random.Random(1))
+
+    tracemalloc.start()
+    index = ReconciliationIndex.from_records(rows)
+    index_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    # Copies of the fields, like the ones parsed from an invoice file
+    ad_hoc = {
+        (iban.replace(" ", "").upper(), reference.replace(" ", "").upper()): (
+            decimal.Decimal(str(euro_amount))
+        )
+        for iban, reference, euro_amount, _ in rows
+    }
+    ad_hoc_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    matches = index.reconcile(payments, tolerance_cents=1)
+    reconcile_seconds = time.perf_counter() - start
+
+    assert all(match is not None for match in matches)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "index.bin")
+
+        start = time.perf_counter()
+        index.save(path)
+        save_seconds = time.perf_counter() - start
+        size = os.path.getsize(path)
+
+        start = time.perf_counter()
+        loaded = ReconciliationIndex.load(path)
+        load_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ReconciliationIndex.from_records(rows)
+        build_seconds = time.perf_counter() - start
+
+    assert len(loaded) == len(index)
+
+    print(f"invoices:          {len(index):12,}")
+    print(f"index memory:      {index_bytes / len(index):12,.0f} B/invoice")
+    print(f"ad hoc dict:       {ad_hoc_bytes / len(ad_hoc):12,.0f} B/invoice")
+    print(f"reconcile:         {len(payments) / reconcile_seconds:12,.0f} payments/s")
+    print(f"build:             {build_seconds:12.2f} s")
+    print(f"save:              {save_seconds:12.2f} s, {size / 1e6:,.1f} MB")
+    print(f"load:              {load_seconds:12.2f} s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,44 @@
+"""Measures the cost of strict reference check digit validation.
+
+Usage: python benchmarks/reference_checksum.py [calls]
+"""
+
+import sys
+import timeit
+from functools import partial
+
+from virtuaaliviivakoodi.engine import prepare_reference
+from virtuaaliviivakoodi.validators import (
+    validate_reference,
+    validate_reference_checksums,
+)
+
+REFERENCES = [
+    "1234567907",
+    "92125374252539897737",
+    "RF92 1234 2345",
+    "RF7192125374252539897737",
+]
+
+
+def main(calls: int) -> None:
+    for reference in REFERENCES:
+        regex = timeit.timeit(partial(validate_reference, reference), number=calls)
+        loose = timeit.timeit(partial(prepare_reference, reference), number=calls)
+        strict = timeit.timeit(
+            partial(prepare_reference, reference, True), number=calls
+        )
+        print(
+            f"{reference:26} regex {regex / calls * 1e9:5.0f} ns  "
+            f"engine {loose / calls * 1e9:5.0f} ns  "
+            f"engine strict {strict / calls * 1e9:5.0f} ns"
+        )
+
+    bulk = timeit.timeit(
+        lambda: validate_reference_checksums(REFERENCES * 2500), number=10
+    )
+    print(f"bulk: {10 * 10000 / bulk:,.0f} references/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,37 @@
+"""Measures Finnish <-> RF reference conversion throughput.
+
+Usage: python benchmarks/reference_conversion.py [references]
+"""
+
+import sys
+import time
+
+from virtuaaliviivakoodi.converters import finnish_to_rf_many, rf_to_finnish_many
+from virtuaaliviivakoodi.generators import generate_references
+
+START = 10**12
+
+
+def main(count: int) -> None:
+    finnish_references = list(generate_references(START, START + count))
+
+    started = time.perf_counter()
+    rf_references = finnish_to_rf_many(finnish_references)
+    to_rf_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    converted_back = rf_to_finnish_many(rf_references)
+    to_finnish_time = time.perf_counter() - started
+
+    assert converted_back == finnish_references
+
+    print(f"references:   {count}")
+    print(f"finnish -> rf: {to_rf_time:.3f}s ({count / to_rf_time:,.0f} references/s)")
+    print(
+        f"rf -> finnish: {to_finnish_time:.3f}s "
+        f"({count / to_finnish_time:,.0f} references/s)"
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,34 @@
+"""Compares incremental reference generation against computing each check digit.
+
+Usage: python benchmarks/reference_generator.py [references]
+"""
+
+import sys
+import time
+
+from virtuaaliviivakoodi.generators import generate_reference, generate_references
+
+START = 10**9
+
+
+def main(count: int) -> None:
+    started = time.perf_counter()
+    single = [generate_reference(base) for base in range(START, START + count)]
+    single_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    incremental = list(generate_references(START, START + count))
+    incremental_time = time.perf_counter() - started
+
+    assert single == incremental
+
+    print(f"references:  {count}")
+    print(f"single:      {single_time:.3f}s ({count / single_time:,.0f} references/s)")
+    print(
+        f"incremental: {incremental_time:.3f}s "
+        f"({count / incremental_time:,.0f} references/s)"
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
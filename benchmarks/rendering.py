@@ -0,0 +1,55 @@
+"""Compares rendering SVG barcodes from the cached template against drawing every bar
+as its own element.
+
+Usage: python benchmarks/rendering.py [barcodes]
+"""
+
+import sys
+import time
+
+from batch_generation import build_columns
+
+from virtuaaliviivakoodi import virtuaaliviivakoodi_many
+from virtuaaliviivakoodi.renderers import code128c_widths, render_pbm, render_svg
+
+
+def render_svg_rects(virtuaaliviivakoodi: str) -> str:
+    rects = []
+    x = 10
+
+    for index, width in enumerate(map(int, code128c_widths(virtuaaliviivakoodi))):
+        if index % 2 == 0:
+            rects.append(f'<rect x="{x}" y="0" width="{width}" height="50"/>')
+
+        x += width
+
+    return (
+        '<svg xmlns="http://www.w3.org/2000/svg" width="352" height="50">'
+        + "".join(rects)
+        + "</svg>"
+    )
+
+
+def main(count: int) -> None:
+    virtuaaliviivakoodit = virtuaaliviivakoodi_many(*build_columns(count))
+
+    for name, render in (
+        ("rects", render_svg_rects),
+        ("svg", render_svg),
+        ("pbm", render_pbm),
+    ):
+        size = 0
+        start = time.perf_counter()
+
+        for virtuaaliviivakoodi in virtuaaliviivakoodit:
+            size += len(render(virtuaaliviivakoodi))
+
+        elapsed = time.perf_counter() - start
+        print(
+            f"{name:6} {count / elapsed:10,.0f} barcodes/s  "
+            f"{size / count:6,.0f} bytes/barcode"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
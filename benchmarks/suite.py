@@ -0,0 +1,322 @@
+"""Benchmarks every stage of generation and deconstruction.
+
+Measures operations per second and the peak memory allocated per call of each
+engine stage of generation and of each validator, normalizer and deconstructor, and
+rows per second of the full round trip at several corpus sizes. The results are
+written as JSON and compared against a stored baseline, and the exit status is 1 if
+a stage regressed by more than the tolerance.
+
+Usage:
+    python benchmarks/suite.py [--sizes 1000,100000,1000000] [--output results.json]
+    python benchmarks/suite.py --save-baseline
+"""
+
+import argparse
+import decimal
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from corpus import build_rows
+
+from virtuaaliviivakoodi import (
+    deconstruct_many,
+    deconstruct_virtuaaliviivakoodi,
+    virtuaaliviivakoodi,
+    virtuaaliviivakoodi_many_from_records,
+)
+from virtuaaliviivakoodi.deconstructors import (
+    deconstruct_amount,
+    deconstruct_amount_cents,
+    deconstruct_date,
+    deconstruct_iban,
+    deconstruct_reference_and_version,
+)
+from virtuaaliviivakoodi.engine import (
+    amount_cents_segment,
+    due_date_segment,
+    euro_amount_segment,
+    iban_segment,
+    prepare_amount_cents,
+    prepare_due_date,
+    prepare_euro_amount,
+    prepare_iban,
+    prepare_reference,
+    reference_segment,
+)
+from virtuaaliviivakoodi.normalizers import (
+    normalize_due_date,
+    normalize_euro_amount,
+    normalize_iban,
+    normalize_reference,
+)
+from virtuaaliviivakoodi.validators import (
+    validate_due_date,
+    validate_euro_amount,
+    validate_iban,
+    validate_length,
+    validate_reference,
+    validate_reference_checksum,
+)
+
+BASELINE = Path(__file__).with_name("baseline.json")
+SIZES = (1_000, 100_000, 1_000_000)
+SAMPLE_ROWS = 10_000
+ALLOCATION_CALLS = 1_000
+MIN_ROUND_SECONDS = 0.2
+ROUNDS = 3
+TOLERANCE = 0.2
+
+# Allocation differences below this many bytes are measurement noise
+ALLOCATION_SLACK = 64
+
+IBAN, REFERENCE, EURO_AMOUNT, AMOUNT_CENTS, DUE_DATE, ROW, CODE = range(7)
+
+STAGES: Tuple[Tuple[str, Callable, int], ...] = (
+    ("engine.iban_segment", iban_segment, IBAN),
+    ("engine.reference_segment", reference_segment, REFERENCE),
+    ("engine.euro_amount_segment", euro_amount_segment, EURO_AMOUNT),
+    ("engine.amount_cents_segment", amount_cents_segment, AMOUNT_CENTS),
+    ("engine.due_date_segment", due_date_segment, DUE_DATE),
+    ("engine.prepare_iban", prepare_iban, IBAN),
+    ("engine.prepare_reference", prepare_reference, REFERENCE),
+    ("engine.prepare_euro_amount", prepare_euro_amount, EURO_AMOUNT),
+    ("engine.prepare_amount_cents", prepare_amount_cents, AMOUNT_CENTS),
+    ("engine.prepare_due_date", prepare_due_date, DUE_DATE),
+    ("validators.validate_iban", validate_iban, IBAN),
+    ("validators.validate_reference", validate_reference, REFERENCE),
+    ("validators.validate_reference_checksum", validate_reference_checksum, REFERENCE),
+    ("validators.validate_euro_amount", validate_euro_amount, EURO_AMOUNT),
+    ("validators.validate_due_date", validate_due_date, DUE_DATE),
+    ("validators.validate_length", validate_length, CODE),
+    ("normalizers.normalize_iban", normalize_iban, IBAN),
+    ("normalizers.normalize_reference", normalize_reference, REFERENCE),
+    ("normalizers.normalize_euro_amount", normalize_euro_amount, EURO_AMOUNT),
+    ("normalizers.normalize_due_date", normalize_due_date, DUE_DATE),
+    ("deconstructors.deconstruct_iban", deconstruct_iban, CODE),
+    (
+        "deconstructors.deconstruct_reference_and_version",
+        deconstruct_reference_and_version,
+        CODE,
+    ),
+    ("deconstructors.deconstruct_amount", deconstruct_amount, CODE),
+    ("deconstructors.deconstruct_amount_cents", deconstruct_amount_cents, CODE),
+    ("deconstructors.deconstruct_date", deconstruct_date, CODE),
+    ("virtuaaliviivakoodi", lambda row: virtuaaliviivakoodi(*row), ROW),
+    ("deconstruct_virtuaaliviivakoodi", deconstruct_virtuaaliviivakoodi, CODE),
+    (
+        "round_trip",
+        lambda row: deconstruct_virtuaaliviivakoodi(virtuaaliviivakoodi(*row)),
+        ROW,
+    ),
+)
+
+
+def _operations_per_second(function: Callable, inputs: Sequence) -> float:
+    best = float("inf")
+
+    for _ in range(ROUNDS):
+        calls = 0
+        start = time.perf_counter()
+
+        while True:
+            for argument in inputs:
+                function(argument)
+
+            calls += len(inputs)
+            elapsed = time.perf_counter() - start
+
+            if elapsed >= MIN_ROUND_SECONDS:
+                break
+
+        best = min(best, elapsed / calls)
+
+    return 1 / best
+
+
+def _peak_bytes_per_call(function: Callable, inputs: Sequence) -> float:
+    total = 0
+    inputs = inputs[:ALLOCATION_CALLS]
+    tracemalloc.start()
+
+    try:
+        for argument in inputs:
+            current = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            function(argument)
+            total += tracemalloc.get_traced_memory()[1] - current
+    finally:
+        tracemalloc.stop()
+
+    return total / len(inputs)
+
+
+def run_stages(sample_rows: int, only: Optional[str]) -> Dict[str, Dict[str, float]]:
+    rows = build_rows(sample_rows)
+    codes = virtuaaliviivakoodi_many_from_records(rows)
+    inputs: Dict[int, List[Any]] = {
+        IBAN: [row[0] for row in rows],
+        REFERENCE: [row[1] for row in rows],
+        EURO_AMOUNT: [row[2] for row in rows],
+        AMOUNT_CENTS: [round(decimal.Decimal(str(row[2])) * 100) for row in rows],
+        DUE_DATE: [row[3] for row in rows],
+        ROW: rows,
+        CODE: codes,
+    }
+    results = {}
+
+    for name, function, kind in STAGES:
+        if only and only not in name:
+            continue
+
+        results[name] = {
+            "ops_per_second": _operations_per_second(function, inputs[kind]),
+            "peak_bytes_per_call": _peak_bytes_per_call(function, inputs[kind]),
+        }
+        _print_result(name, results[name])
+
+    return results
+
+
+def run_round_trips(
+    sizes: Sequence[int], only: Optional[str]
+) -> Dict[str, Dict[str, float]]:
+    results = {}
+
+    for size in sizes:
+        rows = build_rows(size)
+
+        for mode in ("per_call", "batch"):
+            name = f"round_trip.{mode}.{size}"
+
+            if only and only not in name:
+                continue
+
+            start = time.perf_counter()
+
+            if mode == "batch":
+                batch = deconstruct_many(virtuaaliviivakoodi_many_from_records(rows))
+                assert len(batch) == size
+            else:
+                for row in rows:
+                    deconstruct_virtuaaliviivakoodi(virtuaaliviivakoodi(*row))
+
+            results[name] = {"ops_per_second": size / (time.perf_counter() - start)}
+            _print_result(name, results[name])
+
+    return results
+
+
+def _print_result(name: str, result: Dict[str, float]) -> None:
+    line = f"{name:52} {result['ops_per_second']:14,.0f} ops/s"
+
+    if "peak_bytes_per_call" in result:
+        line += f" {result['peak_bytes_per_call']:10,.0f} B/call"
+
+    print(line, flush=True)
+
+
+def compare(
+    results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float
+) -> List[str]:
+    """Compares results against a baseline.
+
+    :return: Names of the stages that are slower or allocate more than the baseline
+    by more than `tolerance`
+    """
+
+    if results["metadata"] != baseline["metadata"]:
+        print(
+            "\nWarning: the baseline was measured with a different interpreter "
+            "or platform:",
+            baseline["metadata"],
+        )
+
+    print(f"\n{'stage':52} {'ops/s':>10} {'bytes':>10}")
+    regressions = []
+
+    for name, result in results["results"].items():
+        expected = baseline["results"].get(name)
+
+        if expected is None:
+            continue
+
+        speed = result["ops_per_second"] / expected["ops_per_second"]
+        regressed = speed < 1 - tolerance
+        line = f"{name:52} {speed:9.2f}x"
+
+        if "peak_bytes_per_call" in result and "peak_bytes_per_call" in expected:
+            growth = result["peak_bytes_per_call"] - expected["peak_bytes_per_call"]
+            regressed = regressed or (
+                growth > ALLOCATION_SLACK
+                and growth > tolerance * expected["peak_bytes_per_call"]
+            )
+            line += f" {growth:+10,.0f}"
+
+        if regressed:
+            regressions.append(name)
+            line += "  REGRESSION"
+
+        print(line)
+
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in SIZES),
+        help="comma separated corpus sizes of the round trip",
+    )
+    parser.add_argument("--sample-rows", type=int, default=SAMPLE_ROWS)
+    parser.add_argument("--only", help="run only stages whose name contains this")
+    parser.add_argument("--output", type=Path, help="write the results to this file")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="store the results as the new baseline instead of comparing",
+    )
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    args = parser.parse_args(argv)
+
+    results = {
+        "metadata": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+        },
+        "results": {
+            **run_stages(args.sample_rows, args.only),
+            **run_round_trips(
+                [int(size) for size in args.sizes.split(",") if size], args.only
+            ),
+        },
+    }
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"\nNo baseline at {args.baseline}, run with --save-baseline")
+        return 0
+
+    regressions = compare(
+        results, json.loads(args.baseline.read_text()), args.tolerance
+    )
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
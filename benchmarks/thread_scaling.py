@@ -0,0 +1,61 @@
+"""Measures how generation and deconstruction scale with 1, 2, 4 and 8 threads.
+
+Run it on both a regular and a free-threaded (e.g. python3.13t) CPython build.
+With the GIL enabled, threads share one core and the speedup stays around 1x.
+
+Usage: python benchmarks/thread_scaling.py [rows]
+"""
+
+import sys
+import sysconfig
+import time
+
+from batch_generation import build_columns
+
+from virtuaaliviivakoodi import deconstruct_parallel, generate_parallel
+
+THREADS = [1, 2, 4, 8]
+
+
+def _gil_enabled() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled() if is_gil_enabled else True
+
+
+def main(rows: int) -> None:
+    records = list(zip(*build_columns(rows)))
+    free_threaded_build = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+
+    print(
+        f"Python {sys.version.split()[0]}, free-threaded build: {free_threaded_build}, "
+        f"GIL enabled: {_gil_enabled()}"
+    )
+
+    barcodes = None
+    baseline = None
+
+    for threads in THREADS:
+        start = time.perf_counter()
+        barcodes = list(
+            generate_parallel(records, workers=threads, chunk_size=10_000, threads=True)
+        )
+        generate_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in deconstruct_parallel(
+            barcodes, workers=threads, chunk_size=10_000, threads=True, batches=True
+        ):
+            pass
+        deconstruct_time = time.perf_counter() - start
+
+        baseline = baseline or (generate_time, deconstruct_time)
+        print(
+            f"{threads} threads  generate {rows / generate_time:12,.0f} rows/s "
+            f"{baseline[0] / generate_time:4.1f}x  "
+            f"deconstruct {rows / deconstruct_time:12,.0f} rows/s "
+            f"{baseline[1] / deconstruct_time:4.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,51 @@
+"""Compares finding invalid rows by catching exceptions and with `validate_many()`.
+
+Usage: python benchmarks/validation.py [rows]
+"""
+
+import random
+import sys
+import time
+from datetime import date
+
+from virtuaaliviivakoodi import validate_many, virtuaaliviivakoodi
+from virtuaaliviivakoodi.exceptions import VirtuaaliviivakoodiException
+
+IBAN = "FI4950009420028730"
+INVALID_RATIO = 0.05
+
+
+def main(rows: int) -> None:
+    rng = random.Random(0)
+    ibans = [IBAN] * rows
+    references = [
+        "INVALID" if rng.random() < INVALID_RATIO else str(1000 + index)
+        for index in range(rows)
+    ]
+    euro_amounts = [rng.randrange(100_000) / 100 for _ in range(rows)]
+    due_dates = [date(2022, 2, 2)] * rows
+
+    start = time.perf_counter()
+    invalid = 0
+    for row in zip(ibans, references, euro_amounts, due_dates):
+        try:
+            virtuaaliviivakoodi(*row)
+        except VirtuaaliviivakoodiException:
+            invalid += 1
+    exception_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    errors = validate_many(ibans, references, euro_amounts, due_dates)
+    validate_time = time.perf_counter() - start
+
+    assert invalid == sum(error is not None for error in errors)
+
+    print(f"try/except     {rows / exception_time:12,.0f} rows/s")
+    print(
+        f"validate_many  {rows / validate_time:12,.0f} rows/s  "
+        f"{exception_time / validate_time:4.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
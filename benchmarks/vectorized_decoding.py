@@ -0,0 +1,34 @@
+"""Compares the NumPy and pure Python backends of `decode_virtuaaliviivakoodi_array()`.
+
+Usage: python benchmarks/vectorized_decoding.py [rows]
+"""
+
+import sys
+import time
+
+import numpy as np
+from batch_generation import build_columns
+
+from virtuaaliviivakoodi import virtuaaliviivakoodi_many
+from virtuaaliviivakoodi.vectorized import decode_virtuaaliviivakoodi_array
+
+
+def main(rows: int) -> None:
+    virtuaaliviivakoodit = virtuaaliviivakoodi_many(*build_columns(rows))
+    array = np.array(virtuaaliviivakoodit, dtype="S54")
+
+    started = time.perf_counter()
+    decode_virtuaaliviivakoodi_array(virtuaaliviivakoodit, backend="python")
+    python_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    decode_virtuaaliviivakoodi_array(array, backend="numpy")
+    numpy_time = time.perf_counter() - started
+
+    print(f"rows:   {rows}")
+    print(f"python: {python_time:.3f}s ({rows / python_time:,.0f} rows/s)")
+    print(f"numpy:  {numpy_time:.3f}s ({rows / numpy_time:,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,40 @@
+"""Compares reading only the reference of barcodes in a byte buffer with
+`deconstruct_virtuaaliviivakoodi()` and `VirtuaaliviivakoodiView`.
+
+Usage: python benchmarks/view.py [barcodes]
+"""
+
+import sys
+import time
+
+from virtuaaliviivakoodi import deconstruct_virtuaaliviivakoodi
+from virtuaaliviivakoodi.dataclasses import VirtuaaliviivakoodiView
+
+VIRTUAALIVIIVAKOODI = b"449500094200287300001002000000000000001234567907201212"
+
+
+def main(barcodes: int) -> None:
+    buffer = VIRTUAALIVIIVAKOODI * barcodes
+    offsets = range(0, len(buffer), len(VIRTUAALIVIIVAKOODI))
+
+    start = time.perf_counter()
+    for offset in offsets:
+        _ = deconstruct_virtuaaliviivakoodi(
+            buffer[offset : offset + 54].decode("ascii")
+        ).reference
+    deconstruct_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for offset in offsets:
+        _ = VirtuaaliviivakoodiView(buffer, offset).reference
+    view_time = time.perf_counter() - start
+
+    print(f"deconstruct {barcodes / deconstruct_time:12,.0f} barcodes/s")
+    print(
+        f"view        {barcodes / view_time:12,.0f} barcodes/s  "
+        f"{deconstruct_time / view_time:4.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
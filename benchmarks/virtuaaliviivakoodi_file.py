@@ -0,0 +1,65 @@
+"""Measures random access and filtered scans of a memory-mapped barcode file.
+
+Usage: python benchmarks/virtuaaliviivakoodi_file.py [records]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from typing import Any, Dict
+
+from virtuaaliviivakoodi import VirtuaaliviivakoodiFile, virtuaaliviivakoodi_many
+
+IBANS = ["FI4950009420028730", "FI1680001400050267", "FI8333010001100775"]
+
+
+def main(records: int) -> None:
+    rng = random.Random(0)
+    barcodes = virtuaaliviivakoodi_many(
+        [rng.choice(IBANS) for _ in range(records)],
+        [str(1000 + index) for index in range(records)],
+        [rng.randrange(100_000) for _ in range(records)],
+        [date(2022, 1, 1) + timedelta(days=rng.randrange(365)) for _ in range(records)],
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "barcodes.txt")
+
+        start = time.perf_counter()
+        VirtuaaliviivakoodiFile.write(path, barcodes)
+        print(f"write       {records / (time.perf_counter() - start):12,.0f} records/s")
+
+        with VirtuaaliviivakoodiFile(path) as file:
+            indices = [rng.randrange(records) for _ in range(100_000)]
+            start = time.perf_counter()
+            for index in indices:
+                _ = file[index].reference
+            print(
+                f"random read {len(indices) / (time.perf_counter() - start):12,.0f}"
+                " records/s"
+            )
+
+            scans: Dict[str, Dict[str, Any]] = {
+                "iban": {"iban": IBANS[2]},
+                "due date": {
+                    "due_date_from": date(2022, 3, 1),
+                    "due_date_to": date(2022, 3, 31),
+                },
+                "amount": {"min_amount_cents": 99_000_00},
+            }
+
+            for name, filters in scans.items():
+                start = time.perf_counter()
+                matches = sum(1 for _ in file.scan(**filters))
+                elapsed = time.perf_counter() - start
+                print(
+                    f"scan {name:8} {records / elapsed:12,.0f} records/s"
+                    f"  {matches:,} matches"
+                )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,143 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from unittest import IsolatedAsyncioTestCase
+
+from virtuaaliviivakoodi import (
+    deconstruct_async,
+    deconstruct_many,
+    generate_async,
+    virtuaaliviivakoodi_many_from_records,
+)
+from virtuaaliviivakoodi.exceptions import (
+    InvalidReferenceException,
+    VirtuaaliviivakoodiException,
+)
+
+RECORDS = [
+    ("FI4950009420028730", str(1000 + index), index % 1000, date(2022, 2, 2))
+    for index in range(1000)
+]
+VIRTUAALIVIIVAKOODIT = virtuaaliviivakoodi_many_from_records(RECORDS)
+
+
+async def _aiterate(items):
+    for item in items:
+        yield item
+
+
+def _stream_reader(lines):
+    reader = asyncio.StreamReader()
+    reader.feed_data(b"".join(line + b"\n" for line in lines))
+    reader.feed_eof()
+    return reader
+
+
+class TestAio(IsolatedAsyncioTestCase):
+    async def test_generate_from_async_iterable(self):
+        results = [result async for result in generate_async(_aiterate(RECORDS))]
+
+        self.assertEqual(results, VIRTUAALIVIIVAKOODIT)
+
+    async def test_generate_from_iterable_in_executor(self):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            results = [
+                result
+                async for result in generate_async(
+                    RECORDS, chunk_size=100, executor=executor, offload_threshold=50
+                )
+            ]
+
+        self.assertEqual(results, VIRTUAALIVIIVAKOODIT)
+
+    async def test_generate_from_stream_reader(self):
+        reader = _stream_reader(
+            [
+                json.dumps(
+                    {
+                        "iban": "FI4950009420028730",
+                        "reference": "1234561",
+                        "euro_amount": 124.12,
+                        "due_date": "2022-02-02",
+                    }
+                ).encode(),
+                b"",
+                json.dumps(
+                    {
+                        "iban": "FI4950009420028730",
+                        "reference": "RF921234",
+                        "euro_amount": "2222.55",
+                    }
+                ).encode(),
+            ]
+        )
+
+        self.assertEqual(
+            [result async for result in generate_async(reader)],
+            [
+                "449500094200287300001241200000000000000001234561220202",
+                "549500094200287300022225592000000000000000001234000000",
+            ],
+        )
+
+    async def test_deconstruct_from_stream_reader(self):
+        reader = _stream_reader(code.encode() for code in VIRTUAALIVIIVAKOODIT)
+
+        self.assertEqual(
+            [
+                deconstruct
+                async for deconstruct in deconstruct_async(
+                    reader, chunk_size=64, offload_threshold=32
+                )
+            ],
+            list(deconstruct_many(VIRTUAALIVIIVAKOODIT)),
+        )
+
+    async def test_results_are_yielded_before_the_source_ends(self):
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def source():
+            while True:
+                code = await queue.get()
+
+                if code is None:
+                    return
+
+                yield code
+
+        results = deconstruct_async(source())
+        await queue.put(VIRTUAALIVIIVAKOODIT[0])
+
+        first = await asyncio.wait_for(results.__anext__(), timeout=1)
+        self.assertEqual(first.reference, "1000")
+
+        await queue.put(None)
+        self.assertEqual([deconstruct async for deconstruct in results], [])
+
+    async def test_errors(self):
+        records = RECORDS[:10] + [("FI4950009420028730", "INVALID", 1)]
+        results = []
+
+        with self.assertRaises(InvalidReferenceException):
+            async for result in generate_async(records, chunk_size=5):
+                results.append(result)
+
+        self.assertEqual(results, VIRTUAALIVIIVAKOODIT[:10])
+
+        with self.assertRaises(VirtuaaliviivakoodiException):
+            async for _ in deconstruct_async(_stream_reader([b"4" * 53 + b"\xff"])):
+                pass
+
+    async def test_source_errors_are_raised_after_earlier_results(self):
+        async def source():
+            yield VIRTUAALIVIIVAKOODIT[0]
+            raise OSError("Connection lost")
+
+        results = []
+
+        with self.assertRaises(OSError):
+            async for deconstruct in deconstruct_async(source()):
+                results.append(deconstruct)
+
+        self.assertEqual(len(results), 1)
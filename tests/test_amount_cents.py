@@ -0,0 +1,115 @@
+import decimal
+from datetime import date
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from virtuaaliviivakoodi import (
+    Payee,
+    deconstruct_virtuaaliviivakoodi,
+    virtuaaliviivakoodi,
+)
+from virtuaaliviivakoodi.exceptions import InvalidEuroAmountException
+from virtuaaliviivakoodi.utils import euro_amount_to_cents, split_euros_and_cents
+
+IBAN = "FI4950009420028730"
+REFERENCE = "1234561"
+
+
+class TestAmountCents(TestCase):
+    @parameterized.expand(
+        [
+            (0, decimal.Decimal("0.00")),
+            (1, decimal.Decimal("0.01")),
+            (12412, decimal.Decimal("124.12")),
+            (99999999, decimal.Decimal("999999.99")),
+        ]
+    )
+    def test_generate_matches_euro_amount(self, amount_cents, euro_amount):
+        self.assertEqual(
+            virtuaaliviivakoodi(IBAN, REFERENCE, amount_cents=amount_cents),
+            virtuaaliviivakoodi(IBAN, REFERENCE, euro_amount),
+        )
+        self.assertEqual(
+            Payee(IBAN).barcode(REFERENCE, amount_cents=amount_cents),
+            virtuaaliviivakoodi(IBAN, REFERENCE, euro_amount),
+        )
+
+    @parameterized.expand(
+        [
+            (
+                {"amount_cents": -1},
+                "Invalid amount in cents. Amount must be positive.",
+            ),
+            (
+                {"amount_cents": 100000000},
+                "Invalid amount in cents. Max value is 99999999",
+            ),
+            ({"amount_cents": 1.5}, "Amount in cents must be integer"),
+            ({"amount_cents": True}, "Amount in cents must be integer"),
+            (
+                {"euro_amount": 1, "amount_cents": 100},
+                "Invalid euro amount. Give either euro amount or amount in cents.",
+            ),
+            ({}, "Euro amount must be float, integer or decimal value"),
+        ]
+    )
+    def test_invalid_amounts(self, amounts, expected_error_message):
+        with self.assertRaises(InvalidEuroAmountException) as context:
+            virtuaaliviivakoodi(IBAN, REFERENCE, **amounts)
+
+        self.assertEqual(str(context.exception), expected_error_message)
+
+    def test_deconstruct_amount_cents(self):
+        code = virtuaaliviivakoodi(
+            IBAN, REFERENCE, amount_cents=12412, due_date=date(2022, 2, 2)
+        )
+
+        deconstruct = deconstruct_virtuaaliviivakoodi(code, amount_cents=True)
+
+        self.assertEqual(deconstruct.amount_cents, 12412)
+        self.assertIsNone(deconstruct.euro_amount)
+        self.assertEqual(deconstruct.due_date, date(2022, 2, 2))
+
+        deconstruct = deconstruct_virtuaaliviivakoodi(code)
+
+        self.assertEqual(deconstruct.euro_amount, decimal.Decimal("124.12"))
+        self.assertIsNone(deconstruct.amount_cents)
+
+    @parameterized.expand(
+        [
+            (124.12, 12412),
+            (0.995, 100),
+            (999999.99, 99999999),
+            (150000, 15000000),
+            (decimal.Decimal("2222.55"), 222255),
+            (decimal.Decimal("0.0"), 0),
+            # Decimals with more than two decimals round halves away from zero
+            (decimal.Decimal("1.015"), 102),
+            (decimal.Decimal("1.0149"), 101),
+            (decimal.Decimal("2.675"), 268),
+            (decimal.Decimal("10.135"), 1014),
+            (decimal.Decimal("996833.025"), 99683303),
+            (decimal.Decimal("0.005"), 1),
+            (decimal.Decimal("999999.994"), 99999999),
+        ]
+    )
+    def test_euro_amount_to_cents(self, euro_amount, expected):
+        self.assertEqual(euro_amount_to_cents(euro_amount), expected)
+        self.assertEqual(split_euros_and_cents(euro_amount), divmod(expected, 100))
+
+    def test_rounding_up_carries_to_euros(self):
+        self.assertEqual(virtuaaliviivakoodi(IBAN, REFERENCE, 0.995)[17:25], "00000100")
+
+    @parameterized.expand(
+        [
+            (decimal.Decimal("2.675"), "00000268"),
+            (decimal.Decimal("10.135"), "00001014"),
+            (decimal.Decimal("996833.025"), "99683303"),
+            (decimal.Decimal("124.124"), "00012412"),
+        ]
+    )
+    def test_decimal_with_more_than_two_decimals(self, euro_amount, expected):
+        self.assertEqual(
+            virtuaaliviivakoodi(IBAN, REFERENCE, euro_amount)[17:25], expected
+        )
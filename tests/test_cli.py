@@ -0,0 +1,177 @@
+import io
+import json
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from virtuaaliviivakoodi.cli import RowError, main, run
+
+GENERATE_CSV = (
+    "iban,reference,euro_amount,due_date\n"
+    "FI49 5000 9420 0287 30,12 34561,124.12,2022-02-02\n"
+    "FI4950009420028730,INVALID REFERENCE,1,\n"
+    "FI4950009420028730,RF92 1234 2345,2222.55,\n"
+)
+
+DECONSTRUCT_NDJSON = (
+    '{"id": 1, "virtuaaliviivakoodi": '
+    '"449500094200287300001241200000000000000001234561220202"}\n'
+    '{"id": 2, "virtuaaliviivakoodi": "4495"}\n'
+    "\n"
+    '{"id": 3, "virtuaaliviivakoodi": '
+    '"549500094200287300022225592000000000000012342345000000"}\n'
+)
+
+
+def run_command(command, input_text, **options):
+    output = io.StringIO()
+    run(command, io.StringIO(input_text), output, **options)
+    return output.getvalue()
+
+
+class TestCli(TestCase):
+    def test_generate_csv_with_error_column(self):
+        self.assertEqual(
+            run_command("generate", GENERATE_CSV).splitlines(),
+            [
+                "iban,reference,euro_amount,due_date,virtuaaliviivakoodi,error",
+                "FI49 5000 9420 0287 30,12 34561,124.12,2022-02-02,"
+                "449500094200287300001241200000000000000001234561220202,",
+                "FI4950009420028730,INVALID REFERENCE,1,,,"
+                "Invalid reference. Must use Finnish or RF reference formats.",
+                "FI4950009420028730,RF92 1234 2345,2222.55,,"
+                "549500094200287300022225592000000000000012342345000000,",
+            ],
+        )
+
+    def test_generate_csv_skip(self):
+        self.assertEqual(
+            run_command("generate", GENERATE_CSV, on_error="skip").splitlines(),
+            [
+                "iban,reference,euro_amount,due_date,virtuaaliviivakoodi",
+                "FI49 5000 9420 0287 30,12 34561,124.12,2022-02-02,"
+                "449500094200287300001241200000000000000001234561220202",
+                "FI4950009420028730,RF92 1234 2345,2222.55,,"
+                "549500094200287300022225592000000000000012342345000000",
+            ],
+        )
+
+    def test_generate_abort(self):
+        with self.assertRaises(RowError) as context:
+            run_command("generate", GENERATE_CSV, on_error="abort")
+
+        self.assertEqual(
+            str(context.exception),
+            "Row 2: Invalid reference. Must use Finnish or RF reference formats.",
+        )
+
+    def test_generate_ndjson(self):
+        output = run_command(
+            "generate",
+            '{"iban": "FI4950009420028730", "reference": 1234561, "euro_amount": 12.3}\n',
+            data_format="ndjson",
+        )
+
+        self.assertEqual(
+            json.loads(output)["virtuaaliviivakoodi"],
+            "449500094200287300000123000000000000000001234561000000",
+        )
+
+    @parameterized.expand([(1, 10000), (1, 1), (2, 1)])
+    def test_deconstruct_ndjson_keeps_input_order(self, workers, chunk_size):
+        output = run_command(
+            "deconstruct",
+            DECONSTRUCT_NDJSON,
+            data_format="ndjson",
+            workers=workers,
+            chunk_size=chunk_size,
+        )
+        rows = [json.loads(line) for line in output.splitlines()]
+
+        self.assertEqual([row["id"] for row in rows], [1, 2, 3])
+        self.assertEqual(rows[0]["reference"], "1234561")
+        self.assertEqual(rows[0]["euro_amount"], "124.12")
+        self.assertEqual(rows[0]["due_date"], "2022-02-02")
+        self.assertEqual(
+            rows[1]["error"],
+            "Invalid length of virtuaaliviivakoodi. Must be 54 characters.",
+        )
+        self.assertEqual(rows[2]["reference"], "RF9212342345")
+        self.assertEqual(rows[2]["due_date"], "")
+        self.assertNotIn("error", rows[2])
+
+    def test_generate_with_workers_matches_serial(self):
+        self.assertEqual(
+            run_command("generate", GENERATE_CSV, workers=2, chunk_size=1),
+            run_command("generate", GENERATE_CSV),
+        )
+
+    def test_main_rejects_invalid_workers(self):
+        with self.assertRaises(SystemExit):
+            main(["generate", "--workers", "0"])
+
+    @parameterized.expand([("column",), ("skip",)])
+    def test_generate_invalid_amount(self, on_error):
+        output = run_command(
+            "generate",
+            "iban,reference,euro_amount,due_date\n"
+            "FI4950009420028730,1234561,NaN,\n"
+            "FI4950009420028730,1234561,12.3.4,\n"
+            "FI4950009420028730,1234561,12.3,\n",
+            on_error=on_error,
+        )
+        rows = output.splitlines()
+
+        self.assertEqual(
+            rows[-1],
+            "FI4950009420028730,1234561,12.3,,"
+            "449500094200287300000123000000000000000001234561000000"
+            + ("," if on_error == "column" else ""),
+        )
+        self.assertEqual(len(rows), 4 if on_error == "column" else 2)
+
+    def test_deconstruct_non_digit_amount(self):
+        output = run_command(
+            "deconstruct",
+            "virtuaaliviivakoodi\n"
+            "4495000942002873000x0124120000000000000001234561220202\n",
+        )
+
+        self.assertEqual(len(output.splitlines()), 2)
+        self.assertTrue(output.splitlines()[1].startswith("4495000942002873000x"))
+
+    @parameterized.expand(
+        [
+            ('{"virtuaaliviivakoodi": 449500094200287300001241200000000000000}',),
+            ('{"virtuaaliviivakoodi": null}',),
+            ('{"id": 1}',),
+        ]
+    )
+    def test_deconstruct_non_string_field(self, line):
+        output = run_command("deconstruct", line + "\n", data_format="ndjson")
+
+        self.assertEqual(
+            json.loads(output)["error"],
+            "Invalid length of virtuaaliviivakoodi. Must be 54 characters.",
+        )
+
+    @parameterized.expand([("generate",), ("deconstruct",)])
+    def test_invalid_ndjson_lines(self, command):
+        output = run_command(
+            command,
+            '{"iban": 1\n[1, 2]\n' + DECONSTRUCT_NDJSON.splitlines()[0] + "\n",
+            data_format="ndjson",
+        )
+        rows = [json.loads(line) for line in output.splitlines()]
+
+        self.assertEqual(len(rows), 3)
+        self.assertTrue(rows[0]["error"].startswith("Invalid JSON."))
+        self.assertEqual(rows[1]["error"], "Invalid row. Must be a JSON object.")
+
+    def test_invalid_ndjson_line_aborts(self):
+        with self.assertRaises(RowError) as context:
+            run_command("generate", "[1, 2]\n", data_format="ndjson", on_error="abort")
+
+        self.assertEqual(
+            str(context.exception), "Row 1: Invalid row. Must be a JSON object."
+        )
@@ -0,0 +1,116 @@
+import random
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from virtuaaliviivakoodi import deconstruct_virtuaaliviivakoodi
+from virtuaaliviivakoodi.decoders import (
+    decode_runs,
+    decode_scanline,
+    decode_scanlines,
+    scanline_runs,
+)
+from virtuaaliviivakoodi.exceptions import InvalidBarcodeException
+from virtuaaliviivakoodi.renderers import code128c_widths, render_pbm
+
+VIRTUAALIVIIVAKOODIT = [
+    "449500094200287300001002000000000000001234567907201212",
+    "549500094200287300002222592000000000000000001234201212",
+    "416800014000502670009358500000078777679656628687000000",
+    "573313130010000580000000010000000000000000868624130809",
+]
+
+
+def _widths(virtuaaliviivakoodi):
+    return [int(width) for width in code128c_widths(virtuaaliviivakoodi)]
+
+
+def _pixels(virtuaaliviivakoodi, module_width=2):
+    image = render_pbm(virtuaaliviivakoodi, module_width=module_width, height=1)
+    width = 352 * module_width
+    row = image[-((width + 7) // 8) :]
+    bits = format(int.from_bytes(row, "big"), f"0{len(row) * 8}b")[:width]
+
+    return bytes(0 if bit == "1" else 255 for bit in bits)
+
+
+class TestDecoders(TestCase):
+    @parameterized.expand([(code,) for code in VIRTUAALIVIIVAKOODIT])
+    def test_decode_runs(self, virtuaaliviivakoodi):
+        widths = _widths(virtuaaliviivakoodi)
+
+        self.assertEqual(decode_runs(widths), virtuaaliviivakoodi)
+        self.assertEqual(decode_runs(widths[::-1]), virtuaaliviivakoodi)
+        self.assertEqual(
+            decode_runs([width * 0.21 for width in widths]), virtuaaliviivakoodi
+        )
+
+    @parameterized.expand([(code,) for code in VIRTUAALIVIIVAKOODIT])
+    def test_decode_noisy_runs(self, virtuaaliviivakoodi):
+        rng = random.Random(0)
+
+        for _ in range(20):
+            module_width = rng.uniform(2, 5)
+            spread = rng.uniform(-0.3, 0.3) * module_width
+            runs = [
+                width * module_width
+                + (spread if index % 2 == 0 else -spread)
+                + rng.uniform(-0.1, 0.1) * module_width
+                for index, width in enumerate(_widths(virtuaaliviivakoodi))
+            ]
+
+            self.assertEqual(decode_runs(runs), virtuaaliviivakoodi)
+
+    @parameterized.expand([(code,) for code in VIRTUAALIVIIVAKOODIT])
+    def test_decode_scanline(self, virtuaaliviivakoodi):
+        pixels = _pixels(virtuaaliviivakoodi)
+
+        self.assertEqual(
+            scanline_runs(pixels), [2 * w for w in _widths(virtuaaliviivakoodi)]
+        )
+        self.assertEqual(decode_scanline(pixels), virtuaaliviivakoodi)
+        self.assertEqual(decode_scanline(list(pixels)), virtuaaliviivakoodi)
+        self.assertEqual(
+            decode_scanline([pixel / 255 for pixel in pixels], threshold=0.5),
+            virtuaaliviivakoodi,
+        )
+        self.assertEqual(
+            decode_scanline(pixels, deconstruct=True),
+            deconstruct_virtuaaliviivakoodi(virtuaaliviivakoodi),
+        )
+
+    def test_invalid(self):
+        widths = _widths(VIRTUAALIVIIVAKOODIT[0])
+
+        with self.assertRaisesRegex(InvalidBarcodeException, "181 bars and spaces"):
+            decode_runs(widths[:-1])
+
+        # No symbol has five bars and spaces of one module
+        broken = widths[:]
+        broken[6:12] = [1, 1, 1, 1, 1, 6]
+
+        with self.assertRaisesRegex(InvalidBarcodeException, "do not match"):
+            decode_runs(broken)
+
+        # Replace the checksum symbol with a different valid symbol
+        broken = widths[:]
+        broken[168:174] = (
+            [2, 1, 2, 2, 2, 2]
+            if widths[168:174] != [2, 1, 2, 2, 2, 2]
+            else [2, 2, 2, 1, 2, 2]
+        )
+
+        with self.assertRaisesRegex(InvalidBarcodeException, "Checksum"):
+            decode_runs(broken)
+
+        with self.assertRaises(InvalidBarcodeException):
+            decode_scanline(bytes(100))
+
+    def test_decode_scanlines(self):
+        scanlines = [_pixels(code) for code in VIRTUAALIVIIVAKOODIT]
+        scanlines.insert(1, bytes([255]) * 704)
+
+        self.assertEqual(
+            decode_scanlines(scanlines),
+            [VIRTUAALIVIIVAKOODIT[0], None, *VIRTUAALIVIIVAKOODIT[1:]],
+        )
@@ -0,0 +1,60 @@
+from datetime import date, timedelta
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from virtuaaliviivakoodi.exceptions import InvalidDueDateException
+from virtuaaliviivakoodi.utils import (
+    decode_due_date,
+    decode_due_date_ordinal,
+    encode_due_date,
+    encode_due_date_ordinal,
+)
+
+
+class TestDueDateCodec(TestCase):
+    def test_round_trip_every_day(self):
+        day = date(2000, 1, 1)
+
+        while day.year < 2100:
+            encoded = day.strftime("%y%m%d")
+
+            self.assertEqual(encode_due_date(day), encoded)
+            self.assertEqual(decode_due_date(encoded), day)
+            self.assertEqual(decode_due_date_ordinal(encoded), day.toordinal())
+            self.assertEqual(encode_due_date_ordinal(day.toordinal()), encoded)
+
+            day += timedelta(days=1)
+
+    def test_empty_due_date(self):
+        self.assertIsNone(decode_due_date("000000"))
+        self.assertEqual(decode_due_date_ordinal("000000"), 0)
+        self.assertEqual(encode_due_date(None), "000000")
+        self.assertEqual(encode_due_date_ordinal(0), "000000")
+
+    @parameterized.expand(
+        [
+            ("991224", 100, date(2099, 12, 24)),
+            ("991224", 70, date(1999, 12, 24)),
+            ("691224", 70, date(2069, 12, 24)),
+            ("000101", 0, date(1900, 1, 1)),
+        ]
+    )
+    def test_century_pivot(self, due_date, pivot, expected):
+        self.assertEqual(decode_due_date(due_date, pivot), expected)
+
+    @parameterized.expand(
+        [
+            ("999999",),
+            ("220230",),
+            ("221301",),
+            ("220200",),
+            ("22022",),
+            ("2202022",),
+            ("22O202",),
+            ("２２０２０２",),
+        ]
+    )
+    def test_invalid_due_dates(self, due_date):
+        with self.assertRaises(InvalidDueDateException):
+            decode_due_date(due_date)
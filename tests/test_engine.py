@@ -0,0 +1,155 @@
+import decimal
+from datetime import date, datetime
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from virtuaaliviivakoodi.engine import (
+    due_date_segment,
+    euro_amount_segment,
+    iban_segment,
+    prepare_euro_amount,
+    prepare_iban,
+    prepare_reference,
+    reference_segment,
+)
+from virtuaaliviivakoodi.exceptions import (
+    InvalidEuroAmountException,
+    InvalidIBANException,
+    InvalidReferenceException,
+)
+from virtuaaliviivakoodi.normalizers import (
+    normalize_due_date,
+    normalize_euro_amount,
+    normalize_iban,
+    normalize_reference,
+)
+from virtuaaliviivakoodi.utils import detect_symbol_version
+
+
+class TestEngine(TestCase):
+    @parameterized.expand(
+        [
+            ("FI49 5000 9420 0287 30",),
+            ("FI4950009420028730",),
+            ("\tFI49500094200287 30\n",),
+        ]
+    )
+    def test_iban_segment_matches_normalizer(self, iban):
+        self.assertEqual(iban_segment(iban), normalize_iban(iban))
+
+    @parameterized.expand(
+        [
+            ("12 34561",),
+            (1234561,),
+            ("92125374252539897737",),
+            ("RF92 1234 2345",),
+            ("RF07999999999993",),
+            ("RF7192125374252539897737",),
+        ]
+    )
+    def test_reference_segment_matches_normalizer(self, reference):
+        self.assertEqual(
+            reference_segment(reference),
+            (detect_symbol_version(reference).value, normalize_reference(reference)),
+        )
+
+    @parameterized.expand(
+        [
+            (0,),
+            (999999,),
+            (0.0,),
+            (124.12,),
+            (2222.55,),
+            (999999.99,),
+            (decimal.Decimal("0.00"),),
+            (decimal.Decimal("0.01"),),
+            (decimal.Decimal("124.1"),),
+            (decimal.Decimal("999999.99"),),
+            (decimal.Decimal("12.345"),),
+        ]
+    )
+    def test_euro_amount_segment_matches_normalizer(self, euro_amount):
+        self.assertEqual(
+            euro_amount_segment(euro_amount), normalize_euro_amount(euro_amount)
+        )
+
+    @parameterized.expand(
+        [
+            (None,),
+            (date(2022, 2, 2),),
+            (date(2099, 12, 24),),
+            (datetime(2010, 6, 12, 8),),
+        ]
+    )
+    def test_due_date_segment_matches_normalizer(self, due_date):
+        self.assertEqual(due_date_segment(due_date), normalize_due_date(due_date))
+
+    @parameterized.expand(
+        [
+            (iban_segment, "FI495000942002XXXX"),
+            (iban_segment, "FI49500094200287301"),
+            (iban_segment, "FI٤٩٥٠٠٠٩٤٢٠٠٢٨٧٣٠"),
+            (iban_segment, 4950009420028730),
+            (reference_segment, "123"),
+            (reference_segment, "RF12"),
+            (reference_segment, "RF12 ABC"),
+            (reference_segment, -1234),
+            (reference_segment, 12345.0),
+            (euro_amount_segment, -1),
+            (euro_amount_segment, 1000000),
+            (euro_amount_segment, float("nan")),
+            (euro_amount_segment, decimal.Decimal("NaN")),
+            (euro_amount_segment, "1.00"),
+            (due_date_segment, "2022-02-02"),
+        ]
+    )
+    def test_invalid_segments_are_none(self, segment_function, value):
+        self.assertIsNone(segment_function(value))
+
+    @parameterized.expand(
+        [
+            (
+                prepare_iban,
+                "SE45 5000 0000 0583 9825 7466",
+                InvalidIBANException,
+                "IBAN must be Finnish",
+            ),
+            (prepare_iban, "FI٤٩٥٠٠٠٩٤٢٠٠٢٨٧٣٠", InvalidIBANException, "Invalid IBAN"),
+            (
+                prepare_reference,
+                "RF12 ABC",
+                InvalidReferenceException,
+                "Invalid reference. Must use Finnish or RF reference formats.",
+            ),
+            (
+                prepare_euro_amount,
+                float("inf"),
+                InvalidEuroAmountException,
+                "Invalid euro amount. Max value is 999999.99",
+            ),
+            (
+                prepare_euro_amount,
+                float("nan"),
+                InvalidEuroAmountException,
+                "Invalid euro amount. Must be a number.",
+            ),
+            (
+                prepare_euro_amount,
+                decimal.Decimal("NaN"),
+                InvalidEuroAmountException,
+                "Invalid euro amount. Must be a number.",
+            ),
+            (
+                prepare_euro_amount,
+                decimal.Decimal("sNaN"),
+                InvalidEuroAmountException,
+                "Invalid euro amount. Must be a number.",
+            ),
+        ]
+    )
+    def test_prepare_raises(self, prepare_function, value, exception, message):
+        with self.assertRaises(exception) as context:
+            prepare_function(value)
+
+        self.assertEqual(str(context.exception), message)
@@ -0,0 +1,86 @@
+import io
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from virtuaaliviivakoodi import (
+    deconstruct_virtuaaliviivakoodi,
+    extract_virtuaaliviivakoodit,
+)
+
+FINNISH = "449500094200287300001002000000000000001234567907201212"
+RF = "549500094200287300002222592000000000000000001234201212"
+
+TEXT = (
+    f"Lasku 12345\nViivakoodi: {FINNISH}\n"
+    f"Eräpäivä 12.12.2020, summa 100,20 €\n"
+    f"Toinen: {RF[:20]} {RF[20:40]}\n{RF[40:]}. Kiitos!"
+)
+
+
+def _extract(*args, **kwargs):
+    return [
+        (match.virtuaaliviivakoodi, match.offset)
+        for match in extract_virtuaaliviivakoodit(*args, **kwargs)
+    ]
+
+
+EXPECTED = [(FINNISH, TEXT.index(FINNISH)), (RF, TEXT.index(RF[:20]))]
+
+
+class TestExtraction(TestCase):
+    def test_extract(self):
+        matches = list(extract_virtuaaliviivakoodit(TEXT))
+
+        self.assertEqual(
+            [(match.virtuaaliviivakoodi, match.offset) for match in matches], EXPECTED
+        )
+        self.assertEqual(matches[1].deconstruct, deconstruct_virtuaaliviivakoodi(RF))
+
+    @parameterized.expand([(size,) for size in (1, 2, 7, 53, 54, 55, 1000)])
+    def test_chunk_boundaries(self, chunk_size):
+        chunks = [TEXT[i : i + chunk_size] for i in range(0, len(TEXT), chunk_size)]
+
+        self.assertEqual(_extract(chunks), EXPECTED)
+        self.assertEqual(_extract(io.StringIO(TEXT), chunk_size=chunk_size), EXPECTED)
+
+    def test_bytes(self):
+        data = TEXT.encode("utf-8")
+        expected = [
+            (FINNISH, data.index(FINNISH.encode())),
+            (RF, data.index(RF[:20].encode())),
+        ]
+
+        self.assertEqual(_extract(data), expected)
+        self.assertEqual(_extract(io.BytesIO(data), chunk_size=5), expected)
+
+    def test_separators(self):
+        text = f"{FINNISH[:27]}-{FINNISH[27:]}"
+
+        self.assertEqual(_extract(text), [])
+        self.assertEqual(_extract(text, separators="-"), [(FINNISH, 0)])
+
+    @parameterized.expand(
+        [
+            ("glued digits", f"1{FINNISH}"),
+            ("glued digits after", f"{FINNISH}1"),
+            ("split by text", f"{FINNISH[:20]} x {FINNISH[20:]}"),
+            ("invalid symbol", "3" + FINNISH[1:]),
+            ("missing padding", FINNISH[:25] + "1" + FINNISH[26:]),
+            ("invalid due date", FINNISH[:48] + "201312"),
+            ("too long", FINNISH + "0" * 100),
+        ]
+    )
+    def test_no_match(self, _, text):
+        self.assertEqual(_extract(f"Viite: {text}."), [])
+
+    def test_candidate_after_other_numbers(self):
+        text = f"Tilinumero 123 456 {FINNISH} 789"
+
+        self.assertEqual(_extract(text), [(FINNISH, text.index(FINNISH))])
+
+    def test_strict(self):
+        text = FINNISH[:46] + "08" + FINNISH[48:]
+
+        self.assertEqual(_extract(text), [(text, 0)])
+        self.assertEqual(_extract(text, strict=True), [])
@@ -0,0 +1,96 @@
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from virtuaaliviivakoodi import (
+    deconstruct_many,
+    deconstruct_virtuaaliviivakoodi,
+    virtuaaliviivakoodi,
+)
+from virtuaaliviivakoodi.exceptions import (
+    InvalidIBANException,
+    InvalidReferenceException,
+)
+from virtuaaliviivakoodi.validators import validate_iban
+from virtuaaliviivakoodi.validators.iban import iban_checksum_ok
+
+
+class TestIbanChecksum(TestCase):
+    @parameterized.expand(
+        [
+            ("FI49 5000 9420 0287 30",),
+            ("FI7944052020036082",),
+            ("FI0250004640001302",),
+            ("FI9239390001003391",),
+        ]
+    )
+    def test_valid_checksums(self, iban):
+        validate_iban(iban)
+
+    @parameterized.expand(
+        [
+            ("FI49 5000 9420 0287 31",),
+            ("FI48 5000 9420 0287 30",),
+            ("FI49 5000 9420 0278 30",),
+        ]
+    )
+    def test_invalid_checksums(self, iban):
+        with self.assertRaises(InvalidIBANException) as context:
+            validate_iban(iban)
+
+        self.assertEqual(str(context.exception), "Invalid IBAN checksum")
+
+        with self.assertRaises(InvalidIBANException):
+            virtuaaliviivakoodi(iban=iban, reference="1234561", euro_amount=1)
+
+    def test_non_ascii_digits(self):
+        with self.assertRaises(InvalidIBANException) as context:
+            validate_iban("FI٤٩٥٠٠٠٩٤٢٠٠٢٨٧٣٠")
+
+        self.assertEqual(str(context.exception), "Invalid IBAN")
+
+    def test_checksum_results_are_cached(self):
+        iban_checksum_ok.cache_clear()
+
+        for _ in range(3):
+            virtuaaliviivakoodi(
+                iban="FI4950009420028730", reference="1234561", euro_amount=1
+            )
+
+        self.assertEqual(iban_checksum_ok.cache_info().misses, 1)
+        self.assertEqual(iban_checksum_ok.cache_info().hits, 2)
+
+
+class TestStrictDeconstruct(TestCase):
+    VALID = "449500094200287300001241200000000000000001234561220202"
+    INVALID_IBAN = "449500094200287310001241200000000000000001234561220202"
+    INVALID_REFERENCE = "449500094200287300001241200000000000000001234562220202"
+
+    def test_valid(self):
+        self.assertEqual(
+            deconstruct_virtuaaliviivakoodi(self.VALID, strict=True),
+            deconstruct_virtuaaliviivakoodi(self.VALID),
+        )
+        self.assertEqual(len(deconstruct_many([self.VALID], strict=True)), 1)
+
+    def test_checksums_are_not_validated_by_default(self):
+        deconstruct_virtuaaliviivakoodi(self.INVALID_IBAN)
+        deconstruct_virtuaaliviivakoodi(self.INVALID_REFERENCE)
+        deconstruct_many([self.INVALID_IBAN, self.INVALID_REFERENCE])
+
+    @parameterized.expand(
+        [
+            (INVALID_IBAN, InvalidIBANException),
+            (INVALID_REFERENCE, InvalidReferenceException),
+            (
+                "549500094200287300022225593000000000000012342345201212",
+                InvalidReferenceException,
+            ),
+        ]
+    )
+    def test_invalid(self, code, exception):
+        with self.assertRaises(exception):
+            deconstruct_virtuaaliviivakoodi(code, strict=True)
+
+        with self.assertRaises(exception):
+            deconstruct_many([self.VALID, code], strict=True)
@@ -0,0 +1,83 @@
+import subprocess
+import sys
+from typing import Dict
+from unittest import TestCase
+
+from parameterized import parameterized
+
+import virtuaaliviivakoodi
+
+# Cumulative import time of the package in microseconds, as reported by
+# `python -X importtime`. The package imported in about 100 ms when every
+# submodule was imported eagerly, and imports in about 30 ms with lazy loading.
+IMPORT_BUDGET_US = 60_000
+RUNS = 3
+
+HEAVY_MODULES = (
+    "asyncio",
+    "concurrent.futures",
+    "json",
+    "mmap",
+    "multiprocessing",
+    "numpy",
+    "virtuaaliviivakoodi.aio",
+    "virtuaaliviivakoodi.batch",
+    "virtuaaliviivakoodi.parallel",
+    "virtuaaliviivakoodi.virtuaaliviivakoodi_file",
+)
+
+
+def _import_times(statement: str) -> Dict[str, int]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    times = {}
+
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+
+    return times
+
+
+class TestImportTime(TestCase):
+    def test_import_budget(self):
+        cumulative = min(
+            _import_times("import virtuaaliviivakoodi")["virtuaaliviivakoodi"]
+            for _ in range(RUNS)
+        )
+
+        self.assertLess(cumulative, IMPORT_BUDGET_US)
+
+    @parameterized.expand(
+        [
+            ("import virtuaaliviivakoodi", ("dataclasses",)),
+            (
+                "from virtuaaliviivakoodi import virtuaaliviivakoodi",
+                ("dataclasses", "virtuaaliviivakoodi.deconstruction"),
+            ),
+            ("from virtuaaliviivakoodi import deconstruct_virtuaaliviivakoodi", ()),
+            ("from virtuaaliviivakoodi import Payee", ()),
+        ]
+    )
+    def test_heavy_modules_are_not_imported(self, statement, extra_modules):
+        modules = _import_times(statement)
+
+        for module in HEAVY_MODULES + extra_modules:
+            with self.subTest(module=module):
+                self.assertNotIn(module, modules)
+
+    def test_lazy_attributes(self):
+        for name in virtuaaliviivakoodi.__all__:
+            with self.subTest(name=name):
+                self.assertTrue(callable(getattr(virtuaaliviivakoodi, name)))
+                self.assertIn(name, dir(virtuaaliviivakoodi))
+
+        with self.assertRaises(AttributeError):
+            virtuaaliviivakoodi.missing  # pylint: disable=pointless-statement
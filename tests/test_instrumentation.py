@@ -0,0 +1,135 @@
+import decimal
+import importlib
+from datetime import date
+from unittest import TestCase
+
+from virtuaaliviivakoodi import (
+    deconstruct_virtuaaliviivakoodi,
+    instrumentation,
+    virtuaaliviivakoodi,
+)
+from virtuaaliviivakoodi.dataclasses import StageStats
+from virtuaaliviivakoodi.exceptions import InvalidReferenceException
+
+STAGE_MODULES = {
+    **{
+        stage: "virtuaaliviivakoodi.virtuaaliviivakoodi"
+        for stage in instrumentation.GENERATION_STAGES
+    },
+    **{
+        stage: "virtuaaliviivakoodi.deconstruction"
+        for stage in instrumentation.DECONSTRUCTION_STAGES
+    },
+}
+
+VIRTUAALIVIIVAKOODI = "449500094200287300001241200000000000000001234561220202"
+
+
+class TestInstrumentation(TestCase):
+    def setUp(self):
+        instrumentation.reset()
+        self.addCleanup(instrumentation.disable)
+        self.addCleanup(instrumentation.reset)
+
+    def test_disabled_stages_are_not_wrapped(self):
+        originals = {
+            stage: getattr(importlib.import_module(module), stage)
+            for stage, module in STAGE_MODULES.items()
+        }
+
+        instrumentation.enable()
+        self.assertTrue(instrumentation.is_enabled())
+        instrumentation.disable()
+        self.assertFalse(instrumentation.is_enabled())
+
+        for stage, original in originals.items():
+            self.assertIs(
+                getattr(importlib.import_module(STAGE_MODULES[stage]), stage), original
+            )
+
+        virtuaaliviivakoodi("FI4950009420028730", "1234561", 124.12)
+        self.assertEqual(instrumentation.stats(), {})
+
+    def test_stats(self):
+        with instrumentation.instrumented():
+            for _ in range(3):
+                virtuaaliviivakoodi(
+                    "FI4950009420028730",
+                    "1234561",
+                    decimal.Decimal("124.12"),
+                    date(2022, 2, 2),
+                )
+
+            deconstruct_virtuaaliviivakoodi(VIRTUAALIVIIVAKOODI, strict=True)
+
+            with self.assertRaises(InvalidReferenceException):
+                virtuaaliviivakoodi("FI4950009420028730", "INVALID", 1)
+
+        stats = instrumentation.stats()
+
+        self.assertEqual(
+            set(stats),
+            set(instrumentation.STAGES) - {"deconstruct_amount_cents"},
+        )
+        self.assertEqual(stats["prepare_iban"].calls, 4)
+        self.assertEqual(stats["prepare_iban"].failures, 0)
+        self.assertEqual(stats["prepare_reference"].calls, 4)
+        self.assertEqual(stats["prepare_reference"].failures, 1)
+        self.assertEqual(stats["prepare_amount"].calls, 3)
+        self.assertEqual(stats["deconstruct_date"].calls, 1)
+        self.assertIsInstance(stats["deconstruct_date"], StageStats)
+        self.assertGreater(stats["prepare_iban"].seconds, 0)
+
+        instrumentation.reset()
+        self.assertEqual(instrumentation.stats(), {})
+
+    def test_hook(self):
+        calls = []
+
+        with instrumentation.instrumented(
+            lambda stage, seconds, error: calls.append((stage, type(error)))
+        ):
+            with self.assertRaises(InvalidReferenceException):
+                virtuaaliviivakoodi("FI4950009420028730", "INVALID", 1)
+
+        self.assertEqual(
+            calls,
+            [
+                ("prepare_iban", type(None)),
+                ("prepare_reference", InvalidReferenceException),
+            ],
+        )
+
+    def test_failing_hook_is_ignored(self):
+        def hook(stage, seconds, error):
+            raise RuntimeError("exporter down")
+
+        with instrumentation.instrumented(hook):
+            self.assertEqual(
+                virtuaaliviivakoodi(
+                    "FI4950009420028730", "1234561", 124.12, date(2022, 2, 2)
+                ),
+                VIRTUAALIVIIVAKOODI,
+            )
+
+            with self.assertRaises(InvalidReferenceException):
+                virtuaaliviivakoodi("FI4950009420028730", "INVALID", 1)
+
+        self.assertEqual(instrumentation.stats()["prepare_reference"].calls, 2)
+
+    def test_results_are_unchanged(self):
+        expected = deconstruct_virtuaaliviivakoodi(VIRTUAALIVIIVAKOODI)
+
+        with instrumentation.instrumented():
+            self.assertEqual(
+                deconstruct_virtuaaliviivakoodi(VIRTUAALIVIIVAKOODI), expected
+            )
+            self.assertEqual(
+                virtuaaliviivakoodi(
+                    "FI4950009420028730",
+                    "1234561",
+                    124.12,
+                    date(2022, 2, 2),
+                ),
+                VIRTUAALIVIIVAKOODI,
+            )
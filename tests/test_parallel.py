@@ -0,0 +1,105 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+from unittest.mock import patch
+
+from virtuaaliviivakoodi import (
+    deconstruct_many,
+    deconstruct_parallel,
+    generate_parallel,
+    virtuaaliviivakoodi_many_from_records,
+)
+from virtuaaliviivakoodi.dataclasses import VirtuaaliviivakoodiDeconstructBatch
+from virtuaaliviivakoodi.exceptions import (
+    InvalidLengthException,
+    InvalidReferenceException,
+)
+
+RECORDS = [
+    ("FI4950009420028730", str(1000 + index), index % 1000) for index in range(250)
+]
+
+
+class TestParallel(TestCase):
+    def setUp(self):
+        patcher = patch("virtuaaliviivakoodi.parallel.SERIAL_THRESHOLD", 100)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_generate_in_process_pool(self):
+        self.assertEqual(
+            list(generate_parallel(RECORDS, workers=2, chunk_size=30)),
+            virtuaaliviivakoodi_many_from_records(RECORDS),
+        )
+
+    def test_deconstruct_in_process_pool(self):
+        barcodes = virtuaaliviivakoodi_many_from_records(RECORDS)
+
+        self.assertEqual(
+            list(deconstruct_parallel(barcodes, workers=2, chunk_size=30)),
+            list(deconstruct_many(barcodes)),
+        )
+
+    def test_serial_below_threshold(self):
+        records = RECORDS[:50]
+        barcodes = virtuaaliviivakoodi_many_from_records(records)
+
+        with patch("virtuaaliviivakoodi.parallel.ProcessPoolExecutor") as executor:
+            self.assertEqual(list(generate_parallel(records)), barcodes)
+            self.assertEqual(
+                list(deconstruct_parallel(barcodes)), list(deconstruct_many(barcodes))
+            )
+            self.assertEqual(list(generate_parallel([])), [])
+
+        executor.assert_not_called()
+
+    def test_given_executor_and_adaptive_chunks(self):
+        barcodes = virtuaaliviivakoodi_many_from_records(RECORDS)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            batches = list(
+                deconstruct_parallel(
+                    barcodes, workers=2, executor=executor, batches=True
+                )
+            )
+            self.assertEqual(
+                list(generate_parallel(RECORDS, workers=2, executor=executor)),
+                barcodes,
+            )
+
+        self.assertTrue(
+            all(
+                isinstance(batch, VirtuaaliviivakoodiDeconstructBatch)
+                for batch in batches
+            )
+        )
+        self.assertEqual(
+            [deconstruct for batch in batches for deconstruct in batch],
+            list(deconstruct_many(barcodes)),
+        )
+
+    def test_errors_are_raised_in_order(self):
+        records = list(RECORDS)
+        records[200] = ("FI4950009420028730", "INVALID", 1)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = generate_parallel(records, chunk_size=30, executor=executor)
+
+            for _ in range(180):
+                next(results)
+
+            with self.assertRaises(InvalidReferenceException):
+                list(results)
+
+    def test_invalid_length(self):
+        barcodes = virtuaaliviivakoodi_many_from_records(RECORDS)
+        barcodes[120] = barcodes[120][:-1]
+
+        with self.assertRaises(InvalidLengthException):
+            list(deconstruct_parallel(barcodes, workers=2, chunk_size=30))
+
+    def test_invalid_lengths_adding_up_to_packed_length(self):
+        barcodes = virtuaaliviivakoodi_many_from_records(RECORDS[:2])
+        rows = [barcodes[0][:-1], "4" + barcodes[1]]
+
+        for threads in (False, True):
+            with self.assertRaises(InvalidLengthException):
+                list(deconstruct_parallel(rows, threads=threads))
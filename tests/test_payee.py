@@ -0,0 +1,74 @@
+import dataclasses
+import decimal
+import pickle
+from datetime import date
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from virtuaaliviivakoodi import BarcodeTemplate, Payee, virtuaaliviivakoodi
+from virtuaaliviivakoodi.exceptions import (
+    InvalidIBANException,
+    InvalidReferenceException,
+)
+
+
+class TestPayee(TestCase):
+    @parameterized.expand(
+        [
+            ("12 34561", 124.12, date(2022, 2, 2)),
+            (1234561, decimal.Decimal("999999.99"), date(2022, 2, 2)),
+            ("RF92 1234 2345", 2222.55, date(2020, 12, 12)),
+            ("RF10868624", decimal.Decimal("0.0"), None),
+        ]
+    )
+    def test_barcode_matches_virtuaaliviivakoodi(
+        self, reference, euro_amount, due_date
+    ):
+        payee = Payee("FI49 5000 9420 0287 30")
+
+        self.assertEqual(
+            payee.barcode(reference, euro_amount, due_date),
+            virtuaaliviivakoodi(
+                "FI49 5000 9420 0287 30", reference, euro_amount, due_date
+            ),
+        )
+
+    def test_normalizes_iban(self):
+        payee = Payee("FI49 5000 9420 0287 30")
+
+        self.assertEqual(payee.iban, "FI4950009420028730")
+        self.assertEqual(payee.iban_segment, "4950009420028730")
+        self.assertEqual(payee, Payee("FI4950009420028730"))
+
+    @parameterized.expand(
+        [
+            ("FI495000942002XXXX", "Invalid IBAN"),
+            ("FI4950009420028731", "Invalid IBAN checksum"),
+            (None, "IBAN must be string"),
+        ]
+    )
+    def test_invalid_iban(self, iban, expected_error_message):
+        with self.assertRaises(InvalidIBANException) as context:
+            Payee(iban)
+
+        self.assertEqual(str(context.exception), expected_error_message)
+
+    def test_strict(self):
+        payee = Payee("FI4950009420028730")
+
+        with self.assertRaises(InvalidReferenceException):
+            payee.barcode("1234562", 1, strict=True)
+
+    def test_immutable(self):
+        payee = Payee("FI4950009420028730")
+
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            payee.iban_segment = "1680001400050267"
+
+    def test_picklable(self):
+        payee = BarcodeTemplate("FI4950009420028730")
+        unpickled = pickle.loads(pickle.dumps(payee))
+
+        self.assertEqual(unpickled, payee)
+        self.assertEqual(unpickled.barcode(1234561, 1), payee.barcode(1234561, 1))
@@ -0,0 +1,169 @@
+import os
+import tempfile
+from decimal import Decimal
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from virtuaaliviivakoodi import ReconciliationIndex, virtuaaliviivakoodi
+from virtuaaliviivakoodi.constants import ReconciliationStatus
+from virtuaaliviivakoodi.dataclasses import ReconciliationMatch
+from virtuaaliviivakoodi.exceptions import (
+    InvalidIBANException,
+    InvalidReferenceException,
+    VirtuaaliviivakoodiException,
+)
+
+IBAN = "FI49 5000 9420 0287 30"
+OTHER_IBAN = "FI58 1017 1000 0001 22"
+
+INVOICES = [
+    (IBAN, "12345 67907", Decimal("100.20")),
+    (IBAN, "RF92 1234 2345", 50),
+    (OTHER_IBAN, 1234561, 12.5),
+]
+
+
+class TestReconciliationIndex(TestCase):
+    def setUp(self):
+        self.index = ReconciliationIndex.from_records(INVOICES)
+
+    def test_from_records(self):
+        self.assertEqual(len(self.index), 3)
+        self.assertEqual(
+            sorted(self.index),
+            [
+                ("FI4950009420028730", "1234567907", 10020),
+                ("FI4950009420028730", "RF9212342345", 5000),
+                ("FI5810171000000122", "1234561", 1250),
+            ],
+        )
+
+    def test_from_virtuaaliviivakoodit(self):
+        index = ReconciliationIndex.from_virtuaaliviivakoodit(
+            virtuaaliviivakoodi(iban, reference, euro_amount)
+            for iban, reference, euro_amount in INVOICES
+        )
+
+        self.assertEqual(sorted(index), sorted(self.index))
+
+    def test_from_mappings(self):
+        index = ReconciliationIndex.from_records(
+            [{"iban": IBAN, "reference": "1234567907", "amount_cents": 10020}]
+        )
+
+        self.assertEqual(index.get(IBAN, 1234567907), 10020)
+
+    @parameterized.expand(
+        [
+            ("FI4950009420028730", "1234567907", 10020),
+            (IBAN, "0001234567907", 10020),
+            (IBAN, "RF9212342345", 5000),
+            (IBAN, "1234561", None),
+            ("FI00", "1234567907", None),
+            (IBAN, "invalid", None),
+        ]
+    )
+    def test_get(self, iban, reference, expected):
+        self.assertEqual(self.index.get(iban, reference), expected)
+
+    def test_add_and_remove(self):
+        self.index.add(IBAN, "1234561", amount_cents=999)
+        self.index.add(IBAN, "1234561", 10)
+
+        self.assertEqual(len(self.index), 4)
+        self.assertEqual(self.index.remove(IBAN, 1234561), 1000)
+        self.assertEqual(self.index.get(IBAN, 1234561), None)
+
+        with self.assertRaises(KeyError):
+            self.index.remove(IBAN, 1234561)
+
+    def test_add_and_remove_virtuaaliviivakoodi(self):
+        code = virtuaaliviivakoodi(OTHER_IBAN, "RF92 1234 2345", 1)
+        self.index.add_virtuaaliviivakoodi(code)
+
+        self.assertEqual(self.index.get(OTHER_IBAN, "RF9212342345"), 100)
+        self.assertEqual(self.index.remove_virtuaaliviivakoodi(code), 100)
+
+        with self.assertRaises(KeyError):
+            self.index.remove_virtuaaliviivakoodi(code)
+
+    @parameterized.expand(
+        [
+            (InvalidIBANException, ("FI00", "1234567907", 1), {}),
+            (InvalidReferenceException, (IBAN, "1234567908", 1), {"strict": True}),
+        ]
+    )
+    def test_add_invalid(self, exception, arguments, options):
+        with self.assertRaises(exception):
+            self.index.add(*arguments, **options)
+
+    @parameterized.expand(
+        [
+            ("449500094200287300001002000000000000001234567907",),
+            ("649500094200287300001002000000000000001234567907201212",),
+            ("44950009420028730000100200000000000000123456790720121x",),
+        ]
+    )
+    def test_add_invalid_virtuaaliviivakoodi(self, code):
+        with self.assertRaises(VirtuaaliviivakoodiException):
+            self.index.add_virtuaaliviivakoodi(code)
+
+    def test_reconcile(self):
+        payments = [
+            (IBAN, "1234567907", Decimal("100.20")),
+            {"iban": IBAN, "reference": "RF92 1234 2345", "amount_cents": 4999},
+            (OTHER_IBAN, "1234561", 20),
+            (OTHER_IBAN, "1234567907", Decimal("100.20")),
+            (IBAN, "invalid", 1),
+            ("invalid", "1234567907", 1),
+            (IBAN, "1234567907", -1),
+        ]
+
+        self.assertEqual(
+            self.index.reconcile(payments, tolerance_cents=1),
+            [
+                ReconciliationMatch(ReconciliationStatus.EXACT, 10020, 0),
+                ReconciliationMatch(ReconciliationStatus.AMOUNT_TOLERANCE, 5000, -1),
+                ReconciliationMatch(ReconciliationStatus.REFERENCE_ONLY, 1250, 750),
+                None,
+                None,
+                None,
+                None,
+            ],
+        )
+
+    def test_reconcile_without_tolerance(self):
+        payments = [
+            (IBAN, "RF9212342345", Decimal("49.99")),
+            (IBAN, "1234567907", Decimal("100.20")),
+        ]
+
+        self.assertEqual(
+            self.index.reconcile(payments, reference_only=False),
+            [None, ReconciliationMatch(ReconciliationStatus.EXACT, 10020, 0)],
+        )
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "index.bin")
+            self.index.save(path)
+            loaded = ReconciliationIndex.load(path)
+
+            self.assertEqual(sorted(loaded), sorted(self.index))
+            self.assertEqual(loaded.get(IBAN, "1234567907"), 10020)
+
+            ReconciliationIndex().save(path)
+
+            self.assertEqual(len(ReconciliationIndex.load(path)), 0)
+
+    @parameterized.expand([(b"",), (b"VVKRIDX\x01" + b"\x01" + b"\x00" * 7,)])
+    def test_load_invalid(self, data):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "index.bin")
+
+            with open(path, "wb") as file:
+                file.write(data)
+
+            with self.assertRaises(VirtuaaliviivakoodiException):
+                ReconciliationIndex.load(path)
@@ -0,0 +1,91 @@
+from datetime import date
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from virtuaaliviivakoodi import virtuaaliviivakoodi, virtuaaliviivakoodi_many
+from virtuaaliviivakoodi.exceptions import InvalidReferenceException
+from virtuaaliviivakoodi.utils import finnish_reference_check_digit, mod97
+from virtuaaliviivakoodi.validators import (
+    is_valid_reference_checksum,
+    validate_reference_checksum,
+    validate_reference_checksums,
+)
+
+
+class TestReferenceChecksum(TestCase):
+    @parameterized.expand(
+        [
+            ("12 34561",),
+            (1234561,),
+            ("1234567907",),
+            ("92125374252539897737",),
+            ("RF92 1234 2345",),
+            ("RF07999999999993",),
+            ("RF7192125374252539897737",),
+            ("RF951357914",),
+        ]
+    )
+    def test_valid_checksums(self, reference):
+        self.assertTrue(is_valid_reference_checksum(reference))
+        validate_reference_checksum(reference)
+
+    @parameterized.expand(
+        [
+            ("12 34562",),
+            (1234560,),
+            ("92125374252539897738",),
+            ("RF93 1234 2345",),
+            ("RF07999999999994",),
+            ("RF",),
+            ("RF92 ABCD",),
+            ("INVALID",),
+            (12.5,),
+        ]
+    )
+    def test_invalid_checksums(self, reference):
+        self.assertFalse(is_valid_reference_checksum(reference))
+
+        with self.assertRaises(InvalidReferenceException):
+            validate_reference_checksum(reference)
+
+    def test_bulk_validation(self):
+        self.assertEqual(
+            validate_reference_checksums(["1234561", "1234562", "RF951357914"]),
+            [True, False, True],
+        )
+
+    def test_check_digit_and_mod97(self):
+        self.assertEqual(finnish_reference_check_digit("123456"), 1)
+        self.assertEqual(finnish_reference_check_digit("123456790"), 7)
+        self.assertEqual(mod97("9" * 40), int("9" * 40) % 97)
+
+    def test_strict_mode(self):
+        options = {
+            "iban": "FI4950009420028730",
+            "euro_amount": 1,
+            "due_date": date(2022, 2, 2),
+        }
+
+        self.assertEqual(
+            virtuaaliviivakoodi(reference="RF92 1234 2345", strict=True, **options),
+            virtuaaliviivakoodi(reference="RF92 1234 2345", **options),
+        )
+        self.assertEqual(
+            virtuaaliviivakoodi(reference="1234562", **options),
+            "449500094200287300000010000000000000000001234562220202",
+        )
+
+        for reference in ["1234562", "RF93 1234 2345"]:
+            with self.assertRaises(InvalidReferenceException) as context:
+                virtuaaliviivakoodi(reference=reference, strict=True, **options)
+
+            self.assertEqual(
+                str(context.exception),
+                "Invalid reference. Check digit does not match.",
+            )
+
+        with self.assertRaises(InvalidReferenceException):
+            virtuaaliviivakoodi_many(
+                ["FI4950009420028730"], ["1234562"], [1], strict=True
+            )
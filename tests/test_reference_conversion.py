@@ -0,0 +1,83 @@
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from virtuaaliviivakoodi.converters import (
+    finnish_to_rf,
+    finnish_to_rf_many,
+    rf_to_finnish,
+    rf_to_finnish_many,
+)
+from virtuaaliviivakoodi.exceptions import InvalidReferenceException
+from virtuaaliviivakoodi.validators import is_valid_reference_checksum
+
+REFERENCES = [
+    ("868624", "RF10868624"),
+    ("1357914", "RF951357914"),
+    ("590738390", "RF66590738390"),
+    ("868516259619897", "RF09868516259619897"),
+    ("92125374252539897737", "RF7192125374252539897737"),
+]
+
+
+class TestReferenceConversion(TestCase):
+    @parameterized.expand(REFERENCES)
+    def test_finnish_to_rf(self, finnish_reference, rf_reference):
+        self.assertEqual(finnish_to_rf(finnish_reference), rf_reference)
+        self.assertTrue(is_valid_reference_checksum(rf_reference))
+
+    @parameterized.expand(REFERENCES)
+    def test_rf_to_finnish(self, finnish_reference, rf_reference):
+        self.assertEqual(rf_to_finnish(rf_reference), finnish_reference)
+
+    def test_whitespace_and_integers(self):
+        self.assertEqual(finnish_to_rf("12 34561"), "RF341234561")
+        self.assertEqual(finnish_to_rf(1234561), "RF341234561")
+        self.assertEqual(rf_to_finnish("RF34 1234 561"), "1234561")
+        self.assertEqual(rf_to_finnish("RF95 0000 1357 914"), "1357914")
+
+    def test_batch_matches_single_conversions(self):
+        finnish_references = [finnish for finnish, _ in REFERENCES] + [
+            "12 34561",
+            1234561,
+        ]
+        rf_references = [rf for _, rf in REFERENCES] + [
+            "RF34 1234 561",
+            "RF9500001357914",
+        ]
+
+        self.assertEqual(
+            finnish_to_rf_many(finnish_references),
+            [finnish_to_rf(reference) for reference in finnish_references],
+        )
+        self.assertEqual(
+            rf_to_finnish_many(rf_references),
+            [rf_to_finnish(reference) for reference in rf_references],
+        )
+
+    @parameterized.expand(
+        [("123",), ("RF10868624",), ("12345678901234567890123",), (1.5,)]
+    )
+    def test_invalid_finnish_references(self, reference):
+        with self.assertRaises(InvalidReferenceException):
+            finnish_to_rf(reference)
+
+        with self.assertRaises(InvalidReferenceException):
+            finnish_to_rf_many(["868624", reference])
+
+    @parameterized.expand(
+        [
+            # Invalid RF check digits
+            ("RF11868624",),
+            # Valid RF reference, but the body has no valid Finnish check digit
+            ("RF6512342346",),
+            ("868624",),
+            ("RF",),
+        ]
+    )
+    def test_invalid_rf_references(self, reference):
+        with self.assertRaises(InvalidReferenceException):
+            rf_to_finnish(reference)
+
+        with self.assertRaises(InvalidReferenceException):
+            rf_to_finnish_many(["RF10868624", reference])
@@ -0,0 +1,62 @@
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from virtuaaliviivakoodi import virtuaaliviivakoodi, virtuaaliviivakoodi_many
+from virtuaaliviivakoodi.exceptions import InvalidReferenceException
+from virtuaaliviivakoodi.generators import generate_reference, generate_references
+from virtuaaliviivakoodi.validators import is_valid_reference_checksum
+
+
+class TestReferenceGenerator(TestCase):
+    @parameterized.expand(
+        [
+            (123456, "1234561"),
+            (777777, "7777776"),
+            (123456790, "1234567907"),
+            (100, "1009"),
+            (9212537425253989773, "92125374252539897737"),
+        ]
+    )
+    def test_generate_reference(self, base, expected_result):
+        self.assertEqual(generate_reference(base), expected_result)
+
+    @parameterized.expand(
+        [(100, 1000), (995, 1012), (9999999999999999950, 10**19), (1234, 1235)]
+    )
+    def test_generate_references_matches_single_references(self, start, stop):
+        references = list(generate_references(start, stop))
+
+        self.assertEqual(
+            references, [generate_reference(base) for base in range(start, stop)]
+        )
+        self.assertTrue(all(map(is_valid_reference_checksum, references)))
+
+    def test_empty_range(self):
+        self.assertEqual(list(generate_references(1000, 1000)), [])
+
+    @parameterized.expand([(99,), (10**19,), ("1234",), (-1000,)])
+    def test_invalid_base(self, base):
+        with self.assertRaises(InvalidReferenceException):
+            generate_reference(base)
+
+    def test_invalid_range(self):
+        with self.assertRaises(InvalidReferenceException):
+            list(generate_references(10**19 - 5, 10**19 + 5))
+
+    def test_feeds_batch_generation(self):
+        iban = "FI4950009420028730"
+
+        result = virtuaaliviivakoodi_many(
+            [iban] * 3, generate_references(1000, 1003), [10, 20, 30], strict=True
+        )
+
+        self.assertEqual(
+            result,
+            [
+                virtuaaliviivakoodi(iban, reference, euro_amount)
+                for reference, euro_amount in zip(
+                    ["10003", "10016", "10029"], [10, 20, 30]
+                )
+            ],
+        )
@@ -0,0 +1,126 @@
+import re
+from itertools import groupby
+from unittest import TestCase
+from xml.etree import ElementTree
+
+from parameterized import parameterized
+
+from virtuaaliviivakoodi.constants.code128 import CODE128_PATTERNS
+from virtuaaliviivakoodi.exceptions import (
+    InvalidLengthException,
+    VirtuaaliviivakoodiException,
+)
+from virtuaaliviivakoodi.renderers import (
+    code128c_values,
+    code128c_widths,
+    render_pbm,
+    render_svg,
+)
+
+VIRTUAALIVIIVAKOODIT = [
+    "449500094200287300001002000000000000001234567907201212",
+    "549500094200287300002222592000000000000000001234201212",
+    "416800014000502670009358500000078777679656628687000000",
+    "573313130010000580000000010000000000000000868624130809",
+]
+
+
+def _modules(pattern: str) -> str:
+    return "".join(
+        ("0" if index % 2 else "1") * int(width) for index, width in enumerate(pattern)
+    )
+
+
+class TestCode128(TestCase):
+    def test_patterns(self):
+        self.assertEqual(len(set(CODE128_PATTERNS)), 107)
+        self.assertEqual(_modules(CODE128_PATTERNS[0]), "11011001100")
+        self.assertEqual(_modules(CODE128_PATTERNS[105]), "11010011100")
+        self.assertEqual(_modules(CODE128_PATTERNS[106]), "1100011101011")
+
+        for pattern in CODE128_PATTERNS[:106]:
+            self.assertEqual(sum(map(int, pattern)), 11)
+
+    @parameterized.expand([(code,) for code in VIRTUAALIVIIVAKOODIT])
+    def test_values(self, virtuaaliviivakoodi):
+        values = code128c_values(virtuaaliviivakoodi)
+        pairs = [int(virtuaaliviivakoodi[i : i + 2]) for i in range(0, 54, 2)]
+        checksum = (105 + sum(i * v for i, v in enumerate(pairs, start=1))) % 103
+
+        self.assertEqual(values, [105, *pairs, checksum, 106])
+
+    @parameterized.expand([(code,) for code in VIRTUAALIVIIVAKOODIT])
+    def test_widths(self, virtuaaliviivakoodi):
+        widths = code128c_widths(virtuaaliviivakoodi)
+
+        self.assertEqual(len(widths), 29 * 6 + 7)
+        self.assertEqual(sum(map(int, widths)), 332)
+        self.assertTrue(widths.startswith("211232"))
+        self.assertTrue(widths.endswith("2331112"))
+
+    @parameterized.expand(
+        [
+            (
+                "4495000942002873000010020000000000000012345679072012",
+                InvalidLengthException,
+            ),
+            (
+                "44950009420028730000100200000000000000123456790720121A",
+                VirtuaaliviivakoodiException,
+            ),
+        ]
+    )
+    def test_invalid(self, virtuaaliviivakoodi, exception):
+        for function in (code128c_values, render_svg, render_pbm):
+            with self.assertRaises(exception):
+                function(virtuaaliviivakoodi)
+
+
+class TestRenderers(TestCase):
+    @parameterized.expand([(code,) for code in VIRTUAALIVIIVAKOODIT])
+    def test_svg(self, virtuaaliviivakoodi):
+        document = render_svg(
+            virtuaaliviivakoodi, module_width=0.5, height=15, unit="mm"
+        )
+        root = ElementTree.fromstring(document)
+        path = root.find("{http://www.w3.org/2000/svg}path").get("d")
+
+        self.assertEqual(root.get("width"), "176mm")
+        self.assertEqual(root.get("height"), "15mm")
+
+        # Rebuild the modules from the absolute positions of the bars
+        x = float(re.match(r"M([\d.]+),0", path).group(1))
+        bars = []
+
+        for bar_width, move in re.findall(r"h([\d.]+)v15h-[\d.]+zm([\d.]+),0", path):
+            bars.append((x, float(bar_width)))
+            x += float(move)
+
+        modules = ["0"] * 352
+
+        for start, width in bars:
+            for module in range(round(start / 0.5), round((start + width) / 0.5)):
+                modules[module] = "1"
+
+        self.assertEqual(
+            "".join(modules),
+            "0" * 10 + _modules(code128c_widths(virtuaaliviivakoodi)) + "0" * 10,
+        )
+
+    @parameterized.expand([(code,) for code in VIRTUAALIVIIVAKOODIT])
+    def test_pbm(self, virtuaaliviivakoodi):
+        image = render_pbm(virtuaaliviivakoodi, module_width=3, height=4, quiet_zone=12)
+        width = (332 + 24) * 3
+        header = f"P4\n{width} 4\n".encode("ascii")
+        data = image[len(header) :]
+
+        self.assertTrue(image.startswith(header))
+        self.assertEqual(len(data), 4 * 134)
+
+        row = format(int.from_bytes(data[:134], "big"), "01072b")[:width]
+        runs = "".join(str(len(list(run)) // 3) for _, run in groupby(row[36:-36]))
+
+        self.assertEqual(row[:36], "0" * 36)
+        self.assertEqual(row[-36:], "0" * 36)
+        self.assertEqual(runs, code128c_widths(virtuaaliviivakoodi))
+        self.assertEqual(data, data[:134] * 4)
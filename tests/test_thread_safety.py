@@ -0,0 +1,102 @@
+import decimal
+import importlib
+import pkgutil
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from enum import Enum
+from types import MappingProxyType, ModuleType
+from unittest import TestCase
+
+import virtuaaliviivakoodi
+from virtuaaliviivakoodi import (
+    deconstruct_many,
+    deconstruct_parallel,
+    generate_parallel,
+    virtuaaliviivakoodi_many_from_records,
+)
+from virtuaaliviivakoodi.dataclasses import FieldError
+
+IMMUTABLE_TYPES = (
+    int,
+    float,
+    str,
+    bytes,
+    tuple,
+    frozenset,
+    slice,
+    decimal.Decimal,
+    date,
+    Enum,
+    FieldError,
+    MappingProxyType,
+    re.Pattern,
+)
+
+# Process-wide state of the opt-in instrumentation, guarded by its lock
+LOCK_PROTECTED = {
+    ("virtuaaliviivakoodi.instrumentation", "_lock"),
+    ("virtuaaliviivakoodi.instrumentation", "_originals"),
+    ("virtuaaliviivakoodi.instrumentation", "_stats"),
+    ("virtuaaliviivakoodi.instrumentation", "_hook"),
+}
+
+RECORDS = [
+    (
+        ["FI4950009420028730", "FI1680001400050267"][index % 2],
+        str(1000 + index),
+        decimal.Decimal(index) / 100,
+        date(2022, 1, 1 + index % 28),
+    )
+    for index in range(4000)
+]
+
+
+class TestThreadSafety(TestCase):
+    def test_module_globals_are_immutable(self):
+        for module_info in pkgutil.walk_packages(
+            virtuaaliviivakoodi.__path__, "virtuaaliviivakoodi."
+        ):
+            if module_info.name.endswith("__main__"):
+                continue
+
+            try:
+                module = importlib.import_module(module_info.name)
+            except ImportError:
+                # Optional dependencies
+                continue
+
+            for name, value in vars(module).items():
+                private = name.startswith("_") and not name.startswith("__")
+
+                if not (name.isupper() or private):
+                    continue
+
+                # Private helper functions, classes and imported modules
+                if private and (isinstance(value, ModuleType) or callable(value)):
+                    continue
+
+                if (module_info.name, name) in LOCK_PROTECTED:
+                    continue
+
+                with self.subTest(module=module_info.name, name=name):
+                    if type(value).__module__ == "numpy":
+                        self.assertFalse(value.flags.writeable)
+                    else:
+                        self.assertIsInstance(value, IMMUTABLE_TYPES)
+
+    def test_threads_match_serial_results(self):
+        expected = virtuaaliviivakoodi_many_from_records(RECORDS)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            generated = list(
+                generate_parallel(
+                    RECORDS, workers=8, chunk_size=100, threads=True, executor=executor
+                )
+            )
+            deconstructed = list(
+                deconstruct_parallel(expected, workers=8, chunk_size=100, threads=True)
+            )
+
+        self.assertEqual(generated, expected)
+        self.assertEqual(deconstructed, list(deconstruct_many(expected)))
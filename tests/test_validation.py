@@ -0,0 +1,184 @@
+import decimal
+from datetime import date
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from virtuaaliviivakoodi import (
+    deconstruct_many,
+    is_valid,
+    is_valid_virtuaaliviivakoodi,
+    validate,
+    validate_many,
+    validate_virtuaaliviivakoodi,
+    validate_virtuaaliviivakoodi_many,
+    virtuaaliviivakoodi,
+)
+from virtuaaliviivakoodi.constants import ErrorCode
+from virtuaaliviivakoodi.dataclasses import FieldError
+from virtuaaliviivakoodi.exceptions import VirtuaaliviivakoodiException
+
+VALID = {
+    "iban": "FI49 5000 9420 0287 30",
+    "reference": "12 34561",
+    "euro_amount": 124.12,
+    "due_date": date(2022, 2, 2),
+}
+
+GENERATION_CASES = [
+    ({}, None),
+    ({"due_date": None}, None),
+    ({"reference": "RF92 1234 2345"}, None),
+    ({"iban": "FI495000942002XXXX"}, FieldError(ErrorCode.INVALID_IBAN, "iban")),
+    ({"iban": "FI4950009420028731"}, FieldError(ErrorCode.INVALID_IBAN, "iban")),
+    ({"iban": "SE4550000000058398257466"}, FieldError(ErrorCode.INVALID_IBAN, "iban")),
+    ({"iban": ["FI4950009420028730"]}, FieldError(ErrorCode.INVALID_IBAN, "iban")),
+    (
+        {"reference": "INVALID"},
+        FieldError(ErrorCode.INVALID_REFERENCE, "reference"),
+    ),
+    ({"reference": 1.5}, FieldError(ErrorCode.INVALID_REFERENCE, "reference")),
+    (
+        {"euro_amount": -1},
+        FieldError(ErrorCode.INVALID_EURO_AMOUNT, "euro_amount"),
+    ),
+    (
+        {"euro_amount": decimal.Decimal("1000000")},
+        FieldError(ErrorCode.INVALID_EURO_AMOUNT, "euro_amount"),
+    ),
+    (
+        {"euro_amount": float("nan")},
+        FieldError(ErrorCode.INVALID_EURO_AMOUNT, "euro_amount"),
+    ),
+    (
+        {"euro_amount": decimal.Decimal("NaN")},
+        FieldError(ErrorCode.INVALID_EURO_AMOUNT, "euro_amount"),
+    ),
+    (
+        {"euro_amount": "124.12"},
+        FieldError(ErrorCode.INVALID_EURO_AMOUNT, "euro_amount"),
+    ),
+    (
+        {"due_date": "2022-02-02"},
+        FieldError(ErrorCode.INVALID_DUE_DATE, "due_date"),
+    ),
+    (
+        {"iban": "FI495000942002XXXX", "due_date": "2022-02-02"},
+        FieldError(ErrorCode.INVALID_IBAN, "iban"),
+    ),
+]
+
+
+class TestValidation(TestCase):
+    @parameterized.expand(GENERATION_CASES)
+    def test_validate_agrees_with_virtuaaliviivakoodi(self, overrides, expected):
+        arguments = {**VALID, **overrides}
+
+        self.assertEqual(validate(**arguments), expected)
+        self.assertEqual(is_valid(**arguments), expected is None)
+
+        if expected is None:
+            virtuaaliviivakoodi(**arguments)
+        else:
+            with self.assertRaises(VirtuaaliviivakoodiException) as context:
+                virtuaaliviivakoodi(**arguments)
+
+            self.assertEqual(type(context.exception).__name__, expected.code.value)
+
+    def test_validate_many(self):
+        rows = [{**VALID, **overrides} for overrides, _ in GENERATION_CASES]
+
+        self.assertEqual(
+            validate_many(
+                [row["iban"] for row in rows],
+                [row["reference"] for row in rows],
+                [row["euro_amount"] for row in rows],
+                [row["due_date"] for row in rows],
+            ),
+            [expected for _, expected in GENERATION_CASES],
+        )
+
+    def test_strict_and_amount_cents(self):
+        self.assertEqual(
+            validate(**{**VALID, "reference": "1234562"}, strict=True),
+            FieldError(ErrorCode.INVALID_REFERENCE, "reference"),
+        )
+        self.assertEqual(
+            validate_many([VALID["iban"]], ["1234562"], [1], strict=True),
+            [FieldError(ErrorCode.INVALID_REFERENCE, "reference")],
+        )
+        self.assertTrue(is_valid(VALID["iban"], "1234561", amount_cents=100))
+        self.assertEqual(
+            validate(VALID["iban"], "1234561", 1, amount_cents=100),
+            FieldError(ErrorCode.INVALID_EURO_AMOUNT, "amount_cents"),
+        )
+
+    @parameterized.expand(
+        [
+            ("449500094200287300001002000000000000001234567907201212", None),
+            ("549500094200287300002222592000000000000000001234201212", None),
+            (
+                "44950009420028730000100200000000000000123456790720121",
+                FieldError(ErrorCode.INVALID_LENGTH, "virtuaaliviivakoodi"),
+            ),
+            (
+                "649500094200287300001002000000000000001234567907201212",
+                FieldError(ErrorCode.INVALID_SYMBOL, "symbol"),
+            ),
+            (
+                "44950009420028X300001002000000000000001234567907201212",
+                FieldError(ErrorCode.INVALID_IBAN, "iban"),
+            ),
+            (
+                "44950009420028730000100X000000000000001234567907201212",
+                FieldError(ErrorCode.INVALID_EURO_AMOUNT, "euro_amount"),
+            ),
+            (
+                "449500094200287300001002000000000000001234567X07201212",
+                FieldError(ErrorCode.INVALID_REFERENCE, "reference"),
+            ),
+            (
+                "449500094200287300001002000000000000001234567907201299",
+                FieldError(ErrorCode.INVALID_DUE_DATE, "due_date"),
+            ),
+            (
+                None,
+                FieldError(
+                    ErrorCode.INVALID_VIRTUAALIVIIVAKOODI, "virtuaaliviivakoodi"
+                ),
+            ),
+        ]
+    )
+    def test_validate_virtuaaliviivakoodi(self, code, expected):
+        self.assertEqual(validate_virtuaaliviivakoodi(code), expected)
+        self.assertEqual(is_valid_virtuaaliviivakoodi(code), expected is None)
+        self.assertEqual(
+            validate_virtuaaliviivakoodi_many([code, code]), [expected] * 2
+        )
+
+        if expected is None:
+            deconstruct_many([code])
+        else:
+            with self.assertRaises((VirtuaaliviivakoodiException, TypeError)):
+                deconstruct_many([code])
+
+    @parameterized.expand(
+        [
+            (
+                "449500094200287310001002000000000000001234567907201212",
+                FieldError(ErrorCode.INVALID_IBAN, "iban"),
+            ),
+            (
+                "449500094200287300001002000000000000001234567917201212",
+                FieldError(ErrorCode.INVALID_REFERENCE, "reference"),
+            ),
+        ]
+    )
+    def test_validate_virtuaaliviivakoodi_strict(self, code, expected):
+        self.assertIsNone(validate_virtuaaliviivakoodi(code))
+        self.assertEqual(validate_virtuaaliviivakoodi(code, strict=True), expected)
+
+        with self.assertRaises(VirtuaaliviivakoodiException) as context:
+            deconstruct_many([code], strict=True)
+
+        self.assertEqual(type(context.exception).__name__, expected.code.value)
@@ -0,0 +1,155 @@
+import decimal
+from datetime import date
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from virtuaaliviivakoodi import (
+    virtuaaliviivakoodi,
+    virtuaaliviivakoodi_many,
+    virtuaaliviivakoodi_many_from_records,
+)
+from virtuaaliviivakoodi.exceptions import (
+    InvalidDueDateException,
+    InvalidEuroAmountException,
+    InvalidIBANException,
+    InvalidReferenceException,
+)
+
+RECORDS = [
+    {
+        "iban": "FI49 5000 9420 0287 30",
+        "reference": "12 34561",
+        "euro_amount": 124.12,
+        "due_date": date(2022, 2, 2),
+    },
+    {
+        "iban": "FI49 5000 9420 0287 30",
+        "reference": 1234561,
+        "euro_amount": decimal.Decimal("999999.99"),
+        "due_date": date(2022, 2, 2),
+    },
+    {
+        "iban": "FI4950009420028730",
+        "reference": "RF92 1234 2345",
+        "euro_amount": 2222.55,
+        "due_date": date(2020, 12, 12),
+    },
+    {
+        "iban": "FI1680001400050267",
+        "reference": "RF6078777679656628687",
+        "euro_amount": 935.85,
+        "due_date": None,
+    },
+    {
+        "iban": "FI8333010001100775",
+        "reference": "92125374252539897737",
+        "euro_amount": 150000,
+        "due_date": date(2016, 5, 25),
+    },
+    {
+        "iban": "FI7331313001000058",
+        "reference": "RF10868624",
+        "euro_amount": decimal.Decimal("0.0"),
+        "due_date": date(2013, 8, 9),
+    },
+]
+
+
+class TestVirtuaaliviivakoodiMany(TestCase):
+    def test_matches_single_calls_in_input_order(self):
+        expected = [virtuaaliviivakoodi(**record) for record in RECORDS]
+
+        result = virtuaaliviivakoodi_many(
+            [record["iban"] for record in RECORDS],
+            [record["reference"] for record in RECORDS],
+            [record["euro_amount"] for record in RECORDS],
+            [record["due_date"] for record in RECORDS],
+        )
+
+        self.assertEqual(result, expected)
+
+    def test_without_due_dates(self):
+        result = virtuaaliviivakoodi_many(
+            ["FI1680001400050267"], ["78777679656628687"], [935.85]
+        )
+
+        self.assertEqual(
+            result, ["416800014000502670009358500000078777679656628687000000"]
+        )
+
+    def test_from_records(self):
+        expected = [virtuaaliviivakoodi(**record) for record in RECORDS]
+        tuples = [tuple(record.values()) for record in RECORDS]
+
+        self.assertEqual(virtuaaliviivakoodi_many_from_records(RECORDS), expected)
+        self.assertEqual(virtuaaliviivakoodi_many_from_records(tuples), expected)
+        self.assertEqual(
+            virtuaaliviivakoodi_many_from_records(
+                [record[:3] for record in tuples if record[3] is None]
+            ),
+            [virtuaaliviivakoodi(**RECORDS[3])],
+        )
+
+    def test_accepts_iterators(self):
+        expected = [virtuaaliviivakoodi(**record) for record in RECORDS]
+
+        result = virtuaaliviivakoodi_many(
+            (record["iban"] for record in RECORDS),
+            (record["reference"] for record in RECORDS),
+            (record["euro_amount"] for record in RECORDS),
+            (record["due_date"] for record in RECORDS),
+        )
+
+        self.assertEqual(result, expected)
+
+    def test_mismatching_column_lengths(self):
+        with self.assertRaises(ValueError):
+            virtuaaliviivakoodi_many(
+                ["FI4950009420028730"], ["1234561", "7777776"], [1]
+            )
+
+    @parameterized.expand(
+        [
+            ({"iban": "FI495000942002XXXX"}, InvalidIBANException, "Invalid IBAN"),
+            (
+                {"iban": ["FI4950009420028730"]},
+                InvalidIBANException,
+                "IBAN must be string",
+            ),
+            (
+                {"reference": "INVALID REFERENCE"},
+                InvalidReferenceException,
+                "Invalid reference. Must use Finnish or RF reference formats.",
+            ),
+            (
+                {"reference": 12345.123},
+                InvalidReferenceException,
+                "Invalid reference. Must be string or integer.",
+            ),
+            (
+                {"euro_amount": -1},
+                InvalidEuroAmountException,
+                "Invalid euro amount. Amount must be positive.",
+            ),
+            (
+                {"euro_amount": decimal.Decimal("1000000")},
+                InvalidEuroAmountException,
+                "Invalid euro amount. Max value is 999999.99",
+            ),
+            (
+                {"due_date": "2022-02-02"},
+                InvalidDueDateException,
+                "Due date must be date object",
+            ),
+        ]
+    )
+    def test_invalid_rows_raise_like_single_calls(
+        self, overrides, expected_exception, expected_error_message
+    ):
+        records = RECORDS + [{**RECORDS[0], **overrides}]
+
+        with self.assertRaises(expected_exception) as context:
+            virtuaaliviivakoodi_many_from_records(records)
+
+        self.assertEqual(str(context.exception), expected_error_message)
@@ -7,6 +7,7 @@ from parameterized import parameterized
 from virtuaaliviivakoodi import deconstruct_virtuaaliviivakoodi
 from virtuaaliviivakoodi.constants import SymbolVersion
 from virtuaaliviivakoodi.exceptions import (
+    InvalidDueDateException,
     InvalidLengthException,
     InvalidSymbolException,
 )
@@ -293,7 +294,7 @@ class TestVirtuaaliviivakoodi(TestCase):
             ),
             (
                 "492393900010033910000000295000000000000001357914999999",
-                ValueError,
+                InvalidDueDateException,
             ),
         ]
     )
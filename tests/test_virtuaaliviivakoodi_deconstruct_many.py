@@ -0,0 +1,96 @@
+from array import array
+from datetime import date
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from virtuaaliviivakoodi import deconstruct_many, deconstruct_virtuaaliviivakoodi
+from virtuaaliviivakoodi.constants import SymbolVersion
+from virtuaaliviivakoodi.exceptions import (
+    InvalidDueDateException,
+    InvalidLengthException,
+    InvalidSymbolException,
+    VirtuaaliviivakoodiException,
+)
+
+VIRTUAALIVIIVAKOODIT = [
+    "449500094200287300001241200000000000000001234561220202",
+    "549500094200287300000000007000000000999999999993201212",
+    "416800014000502670009358500000078777679656628687000000",
+    "516800014000502670009358560000078777679656628687000000",
+    "483330100011007751500002000092125374252539897737160525",
+    "592393900010033910000000295000000000000001357914991224",
+]
+
+
+class TestDeconstructMany(TestCase):
+    def test_matches_single_calls_in_input_order(self):
+        batch = deconstruct_many(VIRTUAALIVIIVAKOODIT)
+
+        self.assertEqual(len(batch), len(VIRTUAALIVIIVAKOODIT))
+        self.assertEqual(
+            list(batch),
+            [deconstruct_virtuaaliviivakoodi(code) for code in VIRTUAALIVIIVAKOODIT],
+        )
+
+    def test_columns(self):
+        batch = deconstruct_many(VIRTUAALIVIIVAKOODIT[:3])
+
+        self.assertEqual(batch.symbols, array("B", [4, 5, 4]))
+        self.assertEqual(batch.euro_cents, array("q", [12412, 0, 93585]))
+        self.assertEqual(
+            batch.due_date_ordinals,
+            array(
+                "i", [date(2022, 2, 2).toordinal(), date(2020, 12, 12).toordinal(), 0]
+            ),
+        )
+        self.assertEqual(
+            batch.ibans, b"495000942002873049500094200287301680001400050267"
+        )
+        self.assertEqual(len(batch.references), 3 * 23)
+        self.assertEqual(batch.nbytes, 3 * (1 + 8 + 4 + 16 + 23))
+
+    def test_row_accessors(self):
+        batch = deconstruct_many(VIRTUAALIVIIVAKOODIT)
+
+        self.assertEqual(batch.symbol(1), SymbolVersion.VERSION_5)
+        self.assertEqual(batch.iban(-1), "FI9239390001003391")
+        self.assertEqual(batch.reference(1), "RF07999999999993")
+        self.assertEqual(batch.reference(2), "78777679656628687")
+        self.assertEqual(str(batch.euro_amount(4)), "150000.20")
+        self.assertIsNone(batch.due_date(3))
+        self.assertEqual(
+            batch[-1], deconstruct_virtuaaliviivakoodi(VIRTUAALIVIIVAKOODIT[-1])
+        )
+
+        self.assertRaises(IndexError, batch.__getitem__, len(VIRTUAALIVIIVAKOODIT))
+
+    def test_empty(self):
+        batch = deconstruct_many([])
+
+        self.assertEqual(len(batch), 0)
+        self.assertEqual(list(batch), [])
+
+    @parameterized.expand(
+        [
+            (
+                "692393900010033910000000295000000000000001357914991224",
+                InvalidSymbolException,
+            ),
+            (
+                "4923939000100339100000002950000000000001357914991224",
+                InvalidLengthException,
+            ),
+            (
+                "49239390001003391000000029500000000000000135791499122X",
+                VirtuaaliviivakoodiException,
+            ),
+            (
+                "492393900010033910000000295000000000000001357914999999",
+                InvalidDueDateException,
+            ),
+        ]
+    )
+    def test_invalid_virtuaaliviivakoodit(self, virtuaaliviivakoodi, error):
+        with self.assertRaises(error):
+            deconstruct_many(VIRTUAALIVIIVAKOODIT + [virtuaaliviivakoodi])
@@ -0,0 +1,126 @@
+import os
+import shutil
+import tempfile
+from datetime import date
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from virtuaaliviivakoodi import (
+    VirtuaaliviivakoodiFile,
+    deconstruct_virtuaaliviivakoodi,
+    virtuaaliviivakoodi,
+)
+from virtuaaliviivakoodi.exceptions import (
+    InvalidLengthException,
+    VirtuaaliviivakoodiException,
+)
+
+VIRTUAALIVIIVAKOODIT = [
+    virtuaaliviivakoodi(iban, reference, euro_amount, due_date)
+    for iban, reference, euro_amount, due_date in [
+        ("FI4950009420028730", "1234561", 124.12, date(2022, 2, 2)),
+        ("FI1680001400050267", "RF6078777679656628687", 935.85, None),
+        ("FI4950009420028730", "RF921234", 2222.55, date(2020, 12, 12)),
+        ("FI8333010001100775", "92125374252539897737", 150000, date(2016, 5, 25)),
+        ("FI4950009420028730", "RF10868624", 0, date(2013, 8, 9)),
+        # The IBAN digits of the payee in the reference field of another payee
+        ("FI7331313001000058", "4950009420028730", 1, date(2022, 1, 1)),
+    ]
+]
+
+
+class TestVirtuaaliviivakoodiFile(TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, "barcodes.txt")
+
+        VirtuaaliviivakoodiFile.write(self.path, VIRTUAALIVIIVAKOODIT)
+        self.file = VirtuaaliviivakoodiFile(self.path)
+        self.addCleanup(self.file.close)
+
+    def test_random_access(self):
+        self.assertEqual(len(self.file), len(VIRTUAALIVIIVAKOODIT))
+        self.assertEqual(str(self.file[3]), VIRTUAALIVIIVAKOODIT[3])
+        self.assertEqual(str(self.file[-1]), VIRTUAALIVIIVAKOODIT[-1])
+        self.assertEqual(
+            self.file.deconstruct(2),
+            deconstruct_virtuaaliviivakoodi(VIRTUAALIVIIVAKOODIT[2]),
+        )
+
+        self.assertRaises(IndexError, self.file.__getitem__, len(VIRTUAALIVIIVAKOODIT))
+
+    def test_slicing_and_iteration(self):
+        self.assertEqual(
+            [str(view) for view in self.file[1:5:2]], VIRTUAALIVIIVAKOODIT[1:5:2]
+        )
+        self.assertEqual([str(view) for view in self.file], VIRTUAALIVIIVAKOODIT)
+
+    @parameterized.expand(
+        [
+            ({"iban": "FI49 5000 9420 0287 30"}, [0, 2, 4]),
+            ({"iban": "FI4950009420028730", "min_amount_cents": 20000}, [2]),
+            ({"due_date_from": date(2020, 12, 12)}, [0, 2, 5]),
+            (
+                {"due_date_from": date(2016, 1, 1), "due_date_to": date(2020, 12, 12)},
+                [2, 3],
+            ),
+            ({"due_date_to": date(2016, 5, 24)}, [4]),
+            ({"min_amount_cents": 1, "max_amount_cents": 12412}, [0, 5]),
+            ({"max_amount_cents": 0}, [4]),
+            ({}, [0, 1, 2, 3, 4, 5]),
+        ]
+    )
+    def test_scan(self, filters, expected_indices):
+        self.assertEqual(
+            [str(view) for view in self.file.scan(**filters)],
+            [VIRTUAALIVIIVAKOODIT[index] for index in expected_indices],
+        )
+
+    def test_append(self):
+        with open(self.path, "rb+") as file:
+            file.truncate(os.path.getsize(self.path) - 1)
+
+        VirtuaaliviivakoodiFile.write(self.path, VIRTUAALIVIIVAKOODIT[:2], append=True)
+
+        with VirtuaaliviivakoodiFile(self.path) as file:
+            self.assertEqual(
+                [str(view) for view in file],
+                VIRTUAALIVIIVAKOODIT + VIRTUAALIVIIVAKOODIT[:2],
+            )
+
+    def test_views_outlive_the_file(self):
+        view = self.file[0]
+        self.file.close()
+
+        self.assertEqual(view.reference, "1234561")
+
+        self.assertRaises(ValueError, self.file.__getitem__, 0)
+
+    def test_empty_file(self):
+        VirtuaaliviivakoodiFile.write(self.path, [])
+
+        with VirtuaaliviivakoodiFile(self.path) as file:
+            self.assertEqual(len(file), 0)
+            self.assertEqual(list(file.scan(iban="FI4950009420028730")), [])
+
+    def test_invalid_file_size(self):
+        with open(self.path, "ab") as file:
+            file.write(b"123\n")
+
+        with self.assertRaises(VirtuaaliviivakoodiException):
+            VirtuaaliviivakoodiFile(self.path)
+
+    @parameterized.expand(
+        [
+            (VIRTUAALIVIIVAKOODIT[0][:-1], InvalidLengthException),
+            (VIRTUAALIVIIVAKOODIT[0] + "0", InvalidLengthException),
+            ("6" + VIRTUAALIVIIVAKOODIT[0][1:], VirtuaaliviivakoodiException),
+            (VIRTUAALIVIIVAKOODIT[0][:-1] + "X", VirtuaaliviivakoodiException),
+            (VIRTUAALIVIIVAKOODIT[0][:-1] + "\n", VirtuaaliviivakoodiException),
+        ]
+    )
+    def test_write_invalid(self, invalid, error):
+        with self.assertRaises(error):
+            VirtuaaliviivakoodiFile.write(self.path, [invalid])
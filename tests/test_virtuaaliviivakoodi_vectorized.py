@@ -0,0 +1,104 @@
+from datetime import date
+from unittest import TestCase, skipUnless
+
+from virtuaaliviivakoodi.vectorized import HAS_NUMPY, decode_virtuaaliviivakoodi_array
+
+VIRTUAALIVIIVAKOODIT = [
+    "449500094200287300001241200000000000000001234561220202",
+    "516800014000502670009358560000078777679656628687000000",
+    "592393900010033910000000295000000000000001357914240229",
+    # Invalid due date
+    "492393900010033910000000295000000000000001357914999999",
+    "492393900010033910000000295000000000000001357914230229",
+    # Invalid length
+    "4923939000100339100000002950000000000001357914991224",
+    "4923939000100339100000002950000000000000013579149912240",
+    # Invalid characters
+    "X92393900010033910000000295000000000000001357914991224",
+    "49239390001003391000000029500000000000000135791499122Ĵ",
+    # Invalid symbol
+    "692393900010033910000000295000000000000001357914991224",
+]
+
+COLUMNS = ["valid", "symbols", "euro_cents", "due_dates", "ibans", "references"]
+
+
+class TestDecodeVirtuaaliviivakoodiArray(TestCase):
+    def test_python_backend(self):
+        columns = decode_virtuaaliviivakoodi_array(
+            VIRTUAALIVIIVAKOODIT, backend="python"
+        )
+
+        self.assertEqual(columns.valid, [True] * 3 + [False] * 7)
+        self.assertEqual(columns.symbols, [4, 5, 5] + [0] * 7)
+        self.assertEqual(columns.euro_cents, [12412, 93585, 2] + [0] * 7)
+        self.assertEqual(
+            columns.due_dates, [date(2022, 2, 2), None, date(2024, 2, 29)] + [None] * 7
+        )
+        self.assertEqual(
+            columns.ibans,
+            [b"4950009420028730", b"1680001400050267", b"9239390001003391"] + [b""] * 7,
+        )
+        self.assertEqual(
+            columns.references,
+            [
+                b"00000000000000001234561",
+                b"60000078777679656628687",
+                b"95000000000000001357914",
+            ]
+            + [b""] * 7,
+        )
+
+    def test_invalid_backend(self):
+        with self.assertRaises(ValueError):
+            decode_virtuaaliviivakoodi_array(VIRTUAALIVIIVAKOODIT, backend="rust")
+
+    @skipUnless(HAS_NUMPY, "NumPy is not installed")
+    def test_numpy_backend_matches_python_backend(self):
+        import numpy as np
+
+        expected = decode_virtuaaliviivakoodi_array(
+            VIRTUAALIVIIVAKOODIT, backend="python"
+        )
+        encoded = [code.encode("utf-8") for code in VIRTUAALIVIIVAKOODIT]
+
+        for virtuaaliviivakoodit in [
+            VIRTUAALIVIIVAKOODIT,
+            encoded,
+            np.array(VIRTUAALIVIIVAKOODIT),
+            np.array(encoded),
+        ]:
+            columns = decode_virtuaaliviivakoodi_array(
+                virtuaaliviivakoodit, backend="numpy"
+            )
+
+            for column in COLUMNS:
+                self.assertEqual(
+                    getattr(columns, column).tolist(), getattr(expected, column)
+                )
+
+    @skipUnless(HAS_NUMPY, "NumPy is not installed")
+    def test_numpy_backend_dtypes(self):
+        import numpy as np
+
+        codes = np.array(VIRTUAALIVIIVAKOODIT[:3], dtype="S54")
+        matrix = codes.view(np.uint8).reshape(3, 54)
+
+        columns = decode_virtuaaliviivakoodi_array(matrix)
+
+        self.assertEqual(columns.valid.dtype, np.bool_)
+        self.assertEqual(columns.symbols.dtype, np.uint8)
+        self.assertEqual(columns.euro_cents.dtype, np.int64)
+        self.assertEqual(columns.due_dates.dtype, np.dtype("datetime64[D]"))
+        self.assertEqual(columns.ibans.dtype, np.dtype("S16"))
+        self.assertEqual(columns.references.dtype, np.dtype("S23"))
+        self.assertTrue(columns.valid.all())
+
+    @skipUnless(HAS_NUMPY, "NumPy is not installed")
+    def test_empty_input(self):
+        columns = decode_virtuaaliviivakoodi_array([], backend="numpy")
+
+        self.assertEqual(len(columns.valid), 0)
+        self.assertEqual(
+            decode_virtuaaliviivakoodi_array([], backend="python").valid, []
+        )
@@ -0,0 +1,106 @@
+from datetime import date
+from decimal import Decimal
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from virtuaaliviivakoodi import deconstruct_virtuaaliviivakoodi
+from virtuaaliviivakoodi.constants import SymbolVersion
+from virtuaaliviivakoodi.dataclasses import VirtuaaliviivakoodiView
+from virtuaaliviivakoodi.exceptions import (
+    InvalidDueDateException,
+    InvalidLengthException,
+    InvalidSymbolException,
+    VirtuaaliviivakoodiException,
+)
+
+VIRTUAALIVIIVAKOODIT = [
+    "449500094200287300001002000000000000001234567907201212",
+    "549500094200287300002222592000000000000000001234201212",
+    "416800014000502670009358500000078777679656628687000000",
+    "573313130010000580000000010000000000000000868624130809",
+]
+
+
+class TestVirtuaaliviivakoodiView(TestCase):
+    @parameterized.expand([(code,) for code in VIRTUAALIVIIVAKOODIT])
+    def test_matches_deconstruct(self, virtuaaliviivakoodi):
+        view = VirtuaaliviivakoodiView(virtuaaliviivakoodi.encode("ascii"))
+        expected = deconstruct_virtuaaliviivakoodi(virtuaaliviivakoodi)
+
+        self.assertEqual(view.to_deconstruct(), expected)
+        self.assertEqual(view.symbol, expected.symbol)
+        self.assertEqual(view.iban, expected.iban)
+        self.assertEqual(view.reference, expected.reference)
+        self.assertEqual(view.euro_amount, expected.euro_amount)
+        self.assertEqual(view.due_date, expected.due_date)
+        self.assertEqual(
+            view.to_deconstruct(amount_cents=True),
+            deconstruct_virtuaaliviivakoodi(virtuaaliviivakoodi, amount_cents=True),
+        )
+
+    def test_buffer_types_and_offset(self):
+        buffer = "".join(VIRTUAALIVIIVAKOODIT).encode("ascii")
+
+        for wrap in (bytes, bytearray, memoryview):
+            view = VirtuaaliviivakoodiView(wrap(buffer), offset=54)
+
+            self.assertEqual(str(view), VIRTUAALIVIIVAKOODIT[1])
+            self.assertEqual(bytes(view), VIRTUAALIVIIVAKOODIT[1].encode("ascii"))
+            self.assertEqual(view.reference, "RF921234")
+
+    def test_does_not_copy_buffer(self):
+        buffer = bytearray(VIRTUAALIVIIVAKOODIT[0].encode("ascii"))
+        view = VirtuaaliviivakoodiView(buffer)
+
+        with self.assertRaises(BufferError):
+            buffer.extend(b"0")
+
+        del view
+        buffer.extend(b"0")
+
+    def test_fields_are_decoded_lazily(self):
+        buffer = bytearray(VIRTUAALIVIIVAKOODIT[0].encode("ascii"))
+        buffer[48:54] = b"999999"
+        view = VirtuaaliviivakoodiView(buffer)
+
+        self.assertEqual(view.reference, "1234567907")
+        self.assertEqual(view.amount_cents, 10020)
+        self.assertEqual(view.euro_amount, Decimal("100.20"))
+
+        self.assertRaises(InvalidDueDateException, getattr, view, "due_date")
+
+    def test_fields_are_cached(self):
+        buffer = bytearray(VIRTUAALIVIIVAKOODIT[0].encode("ascii"))
+        view = VirtuaaliviivakoodiView(buffer)
+
+        self.assertEqual(view.due_date, date(2020, 12, 12))
+        buffer[48:54] = b"210101"
+
+        self.assertEqual(view.due_date, date(2020, 12, 12))
+        self.assertEqual(view.symbol, SymbolVersion.VERSION_4)
+
+    @parameterized.expand(
+        [
+            (b"4495000942002873000010020000000000000012345679072012", 0),
+            (VIRTUAALIVIIVAKOODIT[0].encode("ascii"), 1),
+        ]
+    )
+    def test_invalid_length(self, buffer, offset):
+        with self.assertRaises(InvalidLengthException):
+            VirtuaaliviivakoodiView(buffer, offset)
+
+    def test_invalid_symbol(self):
+        with self.assertRaises(InvalidSymbolException):
+            VirtuaaliviivakoodiView(b"6" + VIRTUAALIVIIVAKOODIT[0][1:].encode("ascii"))
+
+    def test_non_digit_field(self):
+        view = VirtuaaliviivakoodiView(
+            VIRTUAALIVIIVAKOODIT[0][:30].encode("ascii")
+            + b"X"
+            + VIRTUAALIVIIVAKOODIT[0][31:].encode("ascii")
+        )
+
+        self.assertEqual(view.iban, "FI4950009420028730")
+
+        self.assertRaises(VirtuaaliviivakoodiException, getattr, view, "reference")
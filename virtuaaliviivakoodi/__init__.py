@@ -1 +1,79 @@
-from .virtuaaliviivakoodi import deconstruct_virtuaaliviivakoodi, virtuaaliviivakoodi
+"""Generation and deconstruction of Finnish virtual barcodes (virtuaaliviivakoodi).
+
+Only `virtuaaliviivakoodi()` is imported with the package. The other functions and
+classes are imported from their modules on first access, so short-lived processes
+only pay for the parts they use.
+"""
+
+import importlib
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, List
+
+from .virtuaaliviivakoodi import virtuaaliviivakoodi
+
+if TYPE_CHECKING:
+    from .aio import deconstruct_async, generate_async
+    from .batch import (
+        deconstruct_many,
+        virtuaaliviivakoodi_many,
+        virtuaaliviivakoodi_many_from_records,
+    )
+    from .deconstruction import deconstruct_virtuaaliviivakoodi
+    from .extraction import extract_virtuaaliviivakoodit
+    from .parallel import deconstruct_parallel, generate_parallel
+    from .payee import BarcodeTemplate, Payee
+    from .reconciliation import ReconciliationIndex
+    from .validation import (
+        is_valid,
+        is_valid_virtuaaliviivakoodi,
+        validate,
+        validate_many,
+        validate_virtuaaliviivakoodi,
+        validate_virtuaaliviivakoodi_many,
+    )
+    from .virtuaaliviivakoodi_file import VirtuaaliviivakoodiFile
+
+_LAZY_ATTRIBUTES = MappingProxyType(
+    {
+        "deconstruct_async": ".aio",
+        "generate_async": ".aio",
+        "deconstruct_many": ".batch",
+        "virtuaaliviivakoodi_many": ".batch",
+        "virtuaaliviivakoodi_many_from_records": ".batch",
+        "deconstruct_virtuaaliviivakoodi": ".deconstruction",
+        "extract_virtuaaliviivakoodit": ".extraction",
+        "deconstruct_parallel": ".parallel",
+        "generate_parallel": ".parallel",
+        "BarcodeTemplate": ".payee",
+        "Payee": ".payee",
+        "ReconciliationIndex": ".reconciliation",
+        "is_valid": ".validation",
+        "is_valid_virtuaaliviivakoodi": ".validation",
+        "validate": ".validation",
+        "validate_many": ".validation",
+        "validate_virtuaaliviivakoodi": ".validation",
+        "validate_virtuaaliviivakoodi_many": ".validation",
+        "VirtuaaliviivakoodiFile": ".virtuaaliviivakoodi_file",
+    }
+)
+
+__all__ = [
+    "virtuaaliviivakoodi",
+    *_LAZY_ATTRIBUTES,
+]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,5 @@
+import sys
+
+from virtuaaliviivakoodi.cli import main
+
+sys.exit(main())
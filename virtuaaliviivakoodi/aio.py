@@ -0,0 +1,205 @@
+"""Asyncio streaming API for generating and deconstructing virtuaaliviivakoodi's.
+
+Input is read into a bounded queue by a background task. Every chunk takes whatever
+rows are available, up to `chunk_size`, so results of a slow stream are yielded
+without waiting for a full chunk, and busy streams are processed in large batches.
+The next chunk is read only after the results of the previous one are consumed,
+which propagates backpressure to the source.
+
+Chunks of at least `offload_threshold` rows are processed in an executor, and
+smaller chunks inline, so the event loop is never blocked for longer than processing
+`offload_threshold` rows takes (about 1 ms with the default threshold).
+"""
+
+import asyncio
+import json
+from concurrent.futures import Executor
+from decimal import Decimal
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from virtuaaliviivakoodi.batch import (
+    deconstruct_many,
+    virtuaaliviivakoodi_many_from_records,
+)
+from virtuaaliviivakoodi.dataclasses import VirtuaaliviivakoodiDeconstruct
+from virtuaaliviivakoodi.records import parse_record
+
+CHUNK_SIZE = 4096
+OFFLOAD_THRESHOLD = 256
+
+Item = TypeVar("Item")
+Result = TypeVar("Result")
+Source = Union[asyncio.StreamReader, AsyncIterable[Any], Iterable[Any]]
+
+
+class _End:
+    __slots__ = ("error",)
+
+    def __init__(self, error: Optional[BaseException] = None):
+        self.error = error
+
+
+async def _lines(reader: asyncio.StreamReader) -> AsyncIterator[bytes]:
+    async for line in reader:
+        line = line.strip()
+
+        if line:
+            yield line
+
+
+async def _iterate(source: Union[AsyncIterable[Any], Iterable[Any]]) -> AsyncIterator:
+    if hasattr(source, "__aiter__"):
+        async for item in source:
+            yield item
+    else:
+        for item in source:
+            yield item
+
+
+async def _produce(source: AsyncIterator[Any], queue: asyncio.Queue) -> None:
+    try:
+        async for item in source:
+            await queue.put(item)
+    except Exception as error:  # pylint: disable=broad-except
+        await queue.put(_End(error))
+    else:
+        await queue.put(_End())
+
+
+async def _chunks(source: AsyncIterator[Item], chunk_size: int) -> AsyncIterator[List]:
+    queue: asyncio.Queue = asyncio.Queue(maxsize=chunk_size)
+    producer = asyncio.ensure_future(_produce(source, queue))
+
+    try:
+        end = None
+
+        while end is None:
+            chunk = []
+            item = await queue.get()
+
+            while True:
+                if isinstance(item, _End):
+                    end = item
+                    break
+
+                chunk.append(item)
+
+                if len(chunk) >= chunk_size or queue.empty():
+                    break
+
+                item = queue.get_nowait()
+
+            if chunk:
+                yield chunk
+
+        if end.error is not None:
+            raise end.error
+    finally:
+        producer.cancel()
+
+
+async def _process(
+    function: Callable[[List[Item]], Result],
+    source: AsyncIterator[Item],
+    chunk_size: int,
+    executor: Optional[Executor],
+    offload_threshold: int,
+) -> AsyncIterator[Result]:
+    loop = asyncio.get_running_loop()
+
+    async for chunk in _chunks(source, chunk_size):
+        if len(chunk) >= offload_threshold:
+            yield await loop.run_in_executor(executor, function, chunk)
+        else:
+            yield function(chunk)
+
+
+async def generate_async(
+    records: Source,
+    *,
+    strict: bool = False,
+    chunk_size: int = CHUNK_SIZE,
+    executor: Optional[Executor] = None,
+    offload_threshold: int = OFFLOAD_THRESHOLD,
+) -> AsyncIterator[str]:
+    """Generates virtuaaliviivakoodi's for a stream of invoice records.
+
+    :param records: Async iterable or iterable of records accepted by
+    `virtuaaliviivakoodi_many_from_records()`, or a stream reader of NDJSON records
+    with the fields of the command line interface
+    :param strict: Validate the check digits of the references
+    :param chunk_size: Maximum number of records processed at once
+    :param executor: Executor for large chunks, defaults to the loop's default executor
+    :param offload_threshold: Smallest chunk that is processed in the executor
+
+    :return: Async iterator of virtuaaliviivakoodi's in input order
+    """
+
+    if isinstance(records, asyncio.StreamReader):
+        source: AsyncIterator = (
+            parse_record(json.loads(line, parse_float=Decimal))
+            async for line in _lines(records)
+        )
+    else:
+        source = _iterate(records)
+
+    async for results in _process(
+        partial(virtuaaliviivakoodi_many_from_records, strict=strict),
+        source,
+        chunk_size,
+        executor,
+        offload_threshold,
+    ):
+        for result in results:
+            yield result
+
+
+async def deconstruct_async(
+    virtuaaliviivakoodit: Source,
+    *,
+    strict: bool = False,
+    chunk_size: int = CHUNK_SIZE,
+    executor: Optional[Executor] = None,
+    offload_threshold: int = OFFLOAD_THRESHOLD,
+) -> AsyncIterator[VirtuaaliviivakoodiDeconstruct]:
+    """Deconstructs a stream of virtuaaliviivakoodi's.
+
+    Rows are validated like in `deconstruct_many()`.
+
+    :param virtuaaliviivakoodit: Async iterable or iterable of virtuaaliviivakoodi's,
+    or a stream reader with one virtuaaliviivakoodi per line
+    :param strict: Validate the IBAN checksum and the check digits of the reference
+    :param chunk_size: Maximum number of virtuaaliviivakoodi's processed at once
+    :param executor: Executor for large chunks, defaults to the loop's default executor
+    :param offload_threshold: Smallest chunk that is processed in the executor
+
+    :return: Async iterator of deconstructed virtuaaliviivakoodi's in input order
+    """
+
+    if isinstance(virtuaaliviivakoodit, asyncio.StreamReader):
+        source: AsyncIterator = (
+            line.decode("latin-1") async for line in _lines(virtuaaliviivakoodit)
+        )
+    else:
+        source = _iterate(virtuaaliviivakoodit)
+
+    async for batch in _process(
+        partial(deconstruct_many, strict=strict),
+        source,
+        chunk_size,
+        executor,
+        offload_threshold,
+    ):
+        for deconstruct in batch:
+            yield deconstruct
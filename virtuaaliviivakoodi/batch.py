@@ -0,0 +1,214 @@
+import decimal
+from array import array
+from datetime import date
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from virtuaaliviivakoodi.dataclasses import VirtuaaliviivakoodiDeconstructBatch
+from virtuaaliviivakoodi.deconstructors import deconstruct_reference_and_version
+from virtuaaliviivakoodi.engine import (
+    prepare_due_date,
+    prepare_euro_amount,
+    prepare_iban,
+    prepare_reference,
+    reference_segment_checksum_ok,
+)
+from virtuaaliviivakoodi.exceptions import (
+    InvalidIBANException,
+    InvalidReferenceException,
+    VirtuaaliviivakoodiException,
+)
+from virtuaaliviivakoodi.utils import decode_due_date_ordinal
+from virtuaaliviivakoodi.validators import validate_length
+from virtuaaliviivakoodi.validators.iban import iban_checksum_ok
+
+Record = Union[Mapping[str, Any], Sequence[Any]]
+
+
+def _cached(cache: Dict[Any, str], key: Any, build: Callable[[Any], str]) -> str:
+    try:
+        return cache[key]
+    except KeyError:
+        value = cache[key] = build(key)
+        return value
+    except TypeError:
+        # Unhashable input, let the builder raise the validation error.
+        return build(key)
+
+
+def _generate(
+    rows: Iterable[Tuple[Any, Any, Any, Any]], strict: bool = False
+) -> List[str]:
+    iban_cache: Dict[Any, str] = {}
+    due_date_cache: Dict[Any, str] = {None: "000000"}
+    results: List[str] = []
+    append = results.append
+
+    for iban, reference, euro_amount, due_date in rows:
+        try:
+            iban_segment = iban_cache[iban]
+        except (KeyError, TypeError):
+            iban_segment = _cached(iban_cache, iban, prepare_iban)
+
+        try:
+            due_date_segment = due_date_cache[due_date]
+        except (KeyError, TypeError):
+            due_date_segment = _cached(due_date_cache, due_date, prepare_due_date)
+
+        symbol, reference_segment = prepare_reference(reference, strict)
+
+        append(
+            symbol
+            + iban_segment
+            + prepare_euro_amount(euro_amount)
+            + reference_segment
+            + due_date_segment
+        )
+
+    return results
+
+
+def virtuaaliviivakoodi_many(
+    ibans: Iterable[str],
+    references: Iterable[Union[int, str]],
+    euro_amounts: Iterable[Union[float, int, decimal.Decimal]],
+    due_dates: Iterable[Union[date, None]] = None,
+    *,
+    strict: bool = False,
+) -> List[str]:
+    """Generates virtuaaliviivakoodi's for whole columns of invoices at once.
+
+    Produces the same results as calling `virtuaaliviivakoodi()` for each row, in input
+    order, but shares the work that repeats across a batch: IBAN segments and due date
+    encodings are validated and normalized once per distinct value.
+
+    :param ibans: IBAN of each invoice
+    :param references: Reference of each invoice
+    :param euro_amounts: Euro amount of each invoice
+    :param due_dates: Due date of each invoice. If left empty, no due date is used.
+    :param strict: Validate the check digits of the references
+
+    :return: List of virtuaaliviivakoodi's in input order
+    """
+
+    rows: Iterable[Tuple[Any, Any, Any, Any]]
+
+    if due_dates is None:
+        rows = (
+            (iban, reference, euro_amount, None)
+            for iban, reference, euro_amount in zip(
+                ibans, references, euro_amounts, strict=True
+            )
+        )
+    else:
+        rows = zip(ibans, references, euro_amounts, due_dates, strict=True)
+
+    return _generate(rows, strict)
+
+
+def _split_record(record: Record) -> Tuple[Any, Any, Any, Any]:
+    if isinstance(record, Mapping):
+        return (
+            record["iban"],
+            record["reference"],
+            record["euro_amount"],
+            record.get("due_date"),
+        )
+
+    if len(record) == 3:
+        return record[0], record[1], record[2], None
+
+    iban, reference, euro_amount, due_date = record
+    return iban, reference, euro_amount, due_date
+
+
+def virtuaaliviivakoodi_many_from_records(
+    records: Iterable[Record], *, strict: bool = False
+) -> List[str]:
+    """Generates virtuaaliviivakoodi's for an iterable of invoice records.
+
+    Each record is either a mapping with the same keys as the arguments of
+    `virtuaaliviivakoodi()` or an `(iban, reference, euro_amount[, due_date])` tuple.
+    """
+
+    return _generate(map(_split_record, records), strict)
+
+
+def deconstruct_many(
+    virtuaaliviivakoodit: Iterable[str],
+    *,
+    strict: bool = False,
+) -> VirtuaaliviivakoodiDeconstructBatch:
+    """Deconstructs many virtuaaliviivakoodi's into a columnar batch.
+
+    Rows are validated like in `deconstruct_virtuaaliviivakoodi()`, and in addition
+    every row must consist of digits only.
+
+    :param virtuaaliviivakoodit: Virtuaaliviivakoodi's to deconstruct
+    :param strict: Validate the IBAN checksum and the check digits of the reference
+
+    :return: VirtuaaliviivakoodiDeconstructBatch holding the deconstructed parts
+    of every virtuaaliviivakoodi in input order
+    """
+
+    symbols = array("B")
+    euro_cents = array("q")
+    due_date_ordinals = array("i")
+    ibans = bytearray()
+    references = bytearray()
+    due_date_cache: Dict[bytes, int] = {b"000000": 0}
+
+    for virtuaaliviivakoodi in virtuaaliviivakoodit:
+        validate_length(virtuaaliviivakoodi)
+
+        if virtuaaliviivakoodi[0] not in "45":
+            deconstruct_reference_and_version(virtuaaliviivakoodi)
+
+        if not (virtuaaliviivakoodi.isascii() and virtuaaliviivakoodi.isdigit()):
+            raise VirtuaaliviivakoodiException(
+                "Invalid virtuaaliviivakoodi. Must contain only digits."
+            )
+
+        if strict:
+            if not iban_checksum_ok(virtuaaliviivakoodi[1:17]):
+                raise InvalidIBANException("Invalid IBAN checksum")
+
+            if not reference_segment_checksum_ok(
+                virtuaaliviivakoodi[0], virtuaaliviivakoodi[25:48]
+            ):
+                raise InvalidReferenceException(
+                    "Invalid reference. Check digit does not match."
+                )
+
+        raw = virtuaaliviivakoodi.encode("ascii")
+        due_date = raw[48:54]
+
+        try:
+            due_date_ordinal = due_date_cache[due_date]
+        except KeyError:
+            due_date_ordinal = due_date_cache[due_date] = decode_due_date_ordinal(
+                virtuaaliviivakoodi[48:54]
+            )
+
+        symbols.append(raw[0] - 48)
+        ibans += raw[1:17]
+        euro_cents.append(int(raw[17:25]))
+        references += raw[25:48]
+        due_date_ordinals.append(due_date_ordinal)
+
+    return VirtuaaliviivakoodiDeconstructBatch(
+        symbols=symbols,
+        euro_cents=euro_cents,
+        due_date_ordinals=due_date_ordinals,
+        ibans=bytes(ibans),
+        references=bytes(references),
+    )
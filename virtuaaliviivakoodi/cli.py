@@ -0,0 +1,305 @@
+"""Command line interface for generating and deconstructing virtuaaliviivakoodi's.
+
+Reads CSV or NDJSON rows from stdin and writes them to stdout with the results added:
+
+    python -m virtuaaliviivakoodi generate < invoices.csv > barcodes.csv
+    python -m virtuaaliviivakoodi deconstruct --format ndjson < barcodes.ndjson
+"""
+
+import argparse
+import csv
+import decimal
+import json
+import sys
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+from virtuaaliviivakoodi.batch import virtuaaliviivakoodi_many_from_records
+from virtuaaliviivakoodi.deconstruction import deconstruct_virtuaaliviivakoodi
+from virtuaaliviivakoodi.exceptions import VirtuaaliviivakoodiException
+from virtuaaliviivakoodi.records import parse_record
+from virtuaaliviivakoodi.virtuaaliviivakoodi import virtuaaliviivakoodi
+
+Row = Dict[str, Any]
+Result = Tuple[Row, Optional[str]]
+
+ON_ERROR_SKIP = "skip"
+ON_ERROR_COLUMN = "column"
+ON_ERROR_ABORT = "abort"
+
+ERROR_FIELD = "error"
+GENERATE_FIELDS: Tuple[str, ...] = ("virtuaaliviivakoodi",)
+DECONSTRUCT_FIELDS: Tuple[str, ...] = (
+    "symbol",
+    "iban",
+    "reference",
+    "euro_amount",
+    "due_date",
+)
+
+# Exceptions of invalid rows. Malformed numbers raise decimal.InvalidOperation,
+# which is an ArithmeticError.
+ROW_ERRORS = (VirtuaaliviivakoodiException, ArithmeticError, ValueError, TypeError)
+
+
+class RowError(Exception):
+    def __init__(self, line_number: int, message: str):
+        super().__init__(f"Row {line_number}: {message}")
+
+
+class InvalidRow:
+    """Input line that could not be read as a row, e.g. malformed NDJSON"""
+
+    def __init__(self, message: str):
+        self.message = message
+
+
+InputRow = Union[Row, InvalidRow]
+
+
+def _generate_row(row: InputRow) -> Result:
+    if isinstance(row, InvalidRow):
+        return {"virtuaaliviivakoodi": ""}, row.message
+
+    try:
+        return {"virtuaaliviivakoodi": virtuaaliviivakoodi(**parse_record(row))}, None
+    except ROW_ERRORS as error:
+        return {"virtuaaliviivakoodi": ""}, str(error)
+
+
+def generate_chunk(rows: List[InputRow]) -> List[Result]:
+    """Generates the virtuaaliviivakoodi's of a chunk of rows.
+
+    The whole chunk is generated as a batch, and only a chunk with invalid rows is
+    processed row by row to find out which rows failed.
+    """
+
+    try:
+        records = [parse_record(row) for row in rows if isinstance(row, dict)]
+
+        if len(records) == len(rows):
+            return [
+                ({"virtuaaliviivakoodi": result}, None)
+                for result in virtuaaliviivakoodi_many_from_records(records)
+            ]
+    except ROW_ERRORS:
+        pass
+
+    return [_generate_row(row) for row in rows]
+
+
+def _deconstruct_row(row: InputRow) -> Result:
+    if isinstance(row, InvalidRow):
+        return dict.fromkeys(DECONSTRUCT_FIELDS, ""), row.message
+
+    code = row.get("virtuaaliviivakoodi")
+
+    # Missing and non-string fields, e.g. NDJSON numbers, fail the length validation
+    if not isinstance(code, str):
+        code = ""
+
+    try:
+        deconstruct = deconstruct_virtuaaliviivakoodi(code)
+    except ROW_ERRORS as error:
+        return dict.fromkeys(DECONSTRUCT_FIELDS, ""), str(error)
+
+    return {
+        "symbol": deconstruct.symbol.value,
+        "iban": deconstruct.iban,
+        "reference": deconstruct.reference,
+        "euro_amount": str(deconstruct.euro_amount),
+        "due_date": deconstruct.due_date.isoformat() if deconstruct.due_date else "",
+    }, None
+
+
+def deconstruct_chunk(rows: List[InputRow]) -> List[Result]:
+    """Deconstructs the virtuaaliviivakoodi's of a chunk of rows"""
+
+    return [_deconstruct_row(row) for row in rows]
+
+
+def _chunks(rows: Iterable[InputRow], chunk_size: int) -> Iterator[List[InputRow]]:
+    iterator = iter(rows)
+
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _ordered_map(
+    function: Callable[[List[InputRow]], List[Result]],
+    chunks: Iterable[List[InputRow]],
+    executor: Optional[Executor],
+    max_pending: int,
+) -> Iterator[Tuple[List[InputRow], List[Result]]]:
+    """Maps chunks in input order, keeping at most `max_pending` chunks in flight"""
+
+    if executor is None:
+        for chunk in chunks:
+            yield chunk, function(chunk)
+        return
+
+    pending: deque = deque()
+
+    for chunk in chunks:
+        pending.append((chunk, executor.submit(function, chunk)))
+
+        if len(pending) >= max_pending:
+            done_chunk, future = pending.popleft()
+            yield done_chunk, future.result()
+
+    while pending:
+        done_chunk, future = pending.popleft()
+        yield done_chunk, future.result()
+
+
+def _read_csv(stream: TextIO) -> Tuple[List[str], Iterator[InputRow]]:
+    reader = csv.DictReader(stream)
+    return list(reader.fieldnames or []), reader
+
+
+def _decode_ndjson(line: str) -> InputRow:
+    try:
+        row = json.loads(line, parse_float=decimal.Decimal)
+    except ValueError as error:
+        return InvalidRow(f"Invalid JSON. {error}")
+
+    if not isinstance(row, dict):
+        return InvalidRow("Invalid row. Must be a JSON object.")
+
+    return row
+
+
+def _read_ndjson(stream: TextIO) -> Tuple[List[str], Iterator[InputRow]]:
+    # Lines are decoded one by one, so that a malformed line is an invalid row
+    # handled by the error policy instead of ending the whole run
+    rows = (_decode_ndjson(line) for line in stream if line.strip())
+    return [], rows
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def run(  # pylint: disable=too-many-arguments
+    command: str,
+    input_stream: TextIO,
+    output_stream: TextIO,
+    *,
+    data_format: str = "csv",
+    on_error: str = ON_ERROR_COLUMN,
+    workers: int = 1,
+    chunk_size: int = 10000,
+) -> None:
+    """Streams rows from `input_stream` through `command` into `output_stream`.
+
+    :raises RowError: if a row is invalid and `on_error` is "abort"
+    """
+
+    if command == "generate":
+        function, result_fields = generate_chunk, GENERATE_FIELDS
+    else:
+        function, result_fields = deconstruct_chunk, DECONSTRUCT_FIELDS
+
+    write: Callable[[Row], Any]
+
+    if data_format == "csv":
+        input_fields, rows = _read_csv(input_stream)
+        output_fields = input_fields + [
+            field for field in result_fields if field not in input_fields
+        ]
+        if on_error == ON_ERROR_COLUMN and ERROR_FIELD not in output_fields:
+            output_fields.append(ERROR_FIELD)
+        writer = csv.DictWriter(
+            output_stream, fieldnames=output_fields, extrasaction="ignore"
+        )
+        writer.writeheader()
+        write = writer.writerow
+    else:
+        _, rows = _read_ndjson(input_stream)
+
+        def write(row: Row) -> None:
+            output_stream.write(json.dumps(row, default=_json_default) + "\n")
+
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    line_number = 0
+
+    try:
+        for chunk, results in _ordered_map(
+            function, _chunks(rows, chunk_size), executor, max_pending=2 * workers
+        ):
+            for input_row, (result, error) in zip(chunk, results):
+                line_number += 1
+                row = {} if isinstance(input_row, InvalidRow) else input_row
+
+                if error is None:
+                    write({**row, **result})
+                elif on_error == ON_ERROR_COLUMN:
+                    write({**row, **result, ERROR_FIELD: error})
+                elif on_error == ON_ERROR_ABORT:
+                    raise RowError(line_number, error)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m virtuaaliviivakoodi",
+        description="Generates or deconstructs virtuaaliviivakoodi's "
+        "from CSV or NDJSON rows read from stdin.",
+    )
+    parser.add_argument(
+        "command",
+        choices=["generate", "deconstruct"],
+        help="generate: reads iban, reference, euro_amount and due_date (YYYY-MM-DD) "
+        "fields. deconstruct: reads a virtuaaliviivakoodi field.",
+    )
+    parser.add_argument("--format", choices=["csv", "ndjson"], default="csv")
+    parser.add_argument(
+        "--on-error",
+        choices=[ON_ERROR_SKIP, ON_ERROR_COLUMN, ON_ERROR_ABORT],
+        default=ON_ERROR_COLUMN,
+        help="skip invalid rows, emit them with an error column, or abort",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="number of worker processes"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=10000, help="rows per processed chunk"
+    )
+    args = parser.parse_args(argv)
+
+    if args.workers < 1 or args.chunk_size < 1:
+        parser.error("--workers and --chunk-size must be positive")
+
+    try:
+        run(
+            args.command,
+            sys.stdin,
+            sys.stdout,
+            data_format=args.format,
+            on_error=args.on_error,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+        )
+    except RowError as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+
+    return 0
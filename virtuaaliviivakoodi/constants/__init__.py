@@ -1 +1,3 @@
+from .error_code import ErrorCode
+from .reconciliation_status import ReconciliationStatus
 from .symbol_version import SymbolVersion
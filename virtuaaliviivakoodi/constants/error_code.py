@@ -0,0 +1,17 @@
+from enum import Enum
+
+
+class ErrorCode(Enum):
+    """Error codes of the non-raising validation API.
+
+    There is one error code per exception class in `virtuaaliviivakoodi.exceptions`.
+    """
+
+    INVALID_VIRTUAALIVIIVAKOODI = "VirtuaaliviivakoodiException"
+    INVALID_IBAN = "InvalidIBANException"
+    INVALID_REFERENCE = "InvalidReferenceException"
+    INVALID_EURO_AMOUNT = "InvalidEuroAmountException"
+    INVALID_DUE_DATE = "InvalidDueDateException"
+    INVALID_SYMBOL = "InvalidSymbolException"
+    INVALID_LENGTH = "InvalidLengthException"
+    INVALID_BARCODE = "InvalidBarcodeException"
@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class ReconciliationStatus(Enum):
+    """How a payment matches an open invoice with the same IBAN and reference"""
+
+    EXACT = "exact"
+    AMOUNT_TOLERANCE = "amount_tolerance"
+    REFERENCE_ONLY = "reference_only"
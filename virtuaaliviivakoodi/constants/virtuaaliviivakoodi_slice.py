@@ -4,6 +4,8 @@ class VirtuaaliviivakoodiSlice:
     IBAN               = slice(1, 17)
     AMOUNT_EUROS       = slice(17, 23)
     AMOUNT_CENTS       = slice(23, 25)
+    AMOUNT             = slice(17, 25)
+    REFERENCE          = slice(25, 48)
     REFERENCE_FIN      = slice(28, 48)
     REFERENCE_RF_HEAD  = slice(25, 27)
     REFERENCE_RF_TAIL  = slice(27, 48)
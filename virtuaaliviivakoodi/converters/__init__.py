@@ -0,0 +1,6 @@
+from .reference import (
+    finnish_to_rf,
+    finnish_to_rf_many,
+    rf_to_finnish,
+    rf_to_finnish_many,
+)
@@ -0,0 +1,136 @@
+from typing import Iterable, List, Union
+
+from virtuaaliviivakoodi.exceptions import InvalidReferenceException
+from virtuaaliviivakoodi.utils import finnish_reference_check_digit, mod97
+from virtuaaliviivakoodi.validators.reference_checksum import (
+    RF_SHIFT,
+    RF_SUFFIX,
+    is_valid_finnish_reference_checksum,
+    rf_checksum_ok,
+)
+
+TEN_DIGIT_SHIFT = 10**10 % 97
+RF_PREFIXES = tuple(f"RF{check_digits:02d}" for check_digits in range(99))
+
+
+def _short_mod97(digits: str) -> int:
+    """mod-97 of at most 21 digits, reduced in two chunks"""
+
+    remainder = int(digits[:-10] or 0) % 97
+    return (remainder * TEN_DIGIT_SHIFT + int(digits[-10:] or 0)) % 97
+
+
+def _strip(reference: Union[str, int]) -> str:
+    if not isinstance(reference, (str, int)):
+        raise InvalidReferenceException("Invalid reference. Must be string or integer.")
+
+    return "".join(str(reference).split())
+
+
+def finnish_to_rf(reference: Union[str, int]) -> str:
+    """Converts a Finnish reference into the international RF format.
+    E.g. "868624" > "RF10868624"
+
+    The RF check digits are calculated with chunked mod-97 arithmetic.
+    """
+
+    reference_ = _strip(reference)
+
+    if not (
+        4 <= len(reference_) <= 20 and reference_.isascii() and reference_.isdigit()
+    ):
+        raise InvalidReferenceException(
+            "Invalid reference. Must use Finnish reference format."
+        )
+
+    check_digits = 98 - (mod97(reference_) * RF_SHIFT + RF_SUFFIX) % 97
+
+    return f"RF{check_digits:02d}{reference_}"
+
+
+def rf_to_finnish(reference: str) -> str:
+    """Converts an RF reference back into the Finnish format.
+    E.g. "RF10868624" > "868624"
+
+    Only possible when the RF check digits are valid and the body of the RF reference
+    is a Finnish reference with a valid check digit.
+    """
+
+    reference_ = _strip(reference)
+
+    if not (
+        5 <= len(reference_) <= 25
+        and reference_.startswith("RF")
+        and reference_.isascii()
+        and reference_[2:].isdigit()
+        and rf_checksum_ok(reference_[4:], reference_[2:4])
+    ):
+        raise InvalidReferenceException(
+            "Invalid reference. Must use RF reference format with valid check digits."
+        )
+
+    body = reference_[4:].lstrip("0")
+
+    if not (4 <= len(body) <= 20 and is_valid_finnish_reference_checksum(body)):
+        raise InvalidReferenceException(
+            "Invalid reference. RF reference does not contain a Finnish reference."
+        )
+
+    return body
+
+
+def finnish_to_rf_many(references: Iterable[Union[str, int]]) -> List[str]:
+    """Converts many Finnish references into the RF format, in input order.
+
+    Whitespace-free digit strings take an inlined fast path where the mod-97 remainder
+    of the at most 20 digits is reduced in two 10 digit chunks.
+    """
+
+    results: List[str] = []
+    append = results.append
+
+    for reference in references:
+        if (
+            isinstance(reference, str)
+            and 4 <= len(reference) <= 20
+            and reference.isascii()
+            and reference.isdigit()
+        ):
+            remainder = _short_mod97(reference)
+            append(
+                RF_PREFIXES[98 - (remainder * RF_SHIFT + RF_SUFFIX) % 97] + reference
+            )
+        else:
+            append(finnish_to_rf(reference))
+
+    return results
+
+
+def rf_to_finnish_many(references: Iterable[str]) -> List[str]:
+    """Converts many RF references into the Finnish format, in input order"""
+
+    results: List[str] = []
+    append = results.append
+
+    for reference in references:
+        if (
+            isinstance(reference, str)
+            and 5 <= len(reference) <= 25
+            and reference.startswith("RF")
+            and reference.isascii()
+            and reference[2:].isdigit()
+        ):
+            body = reference[4:].lstrip("0")
+
+            if (
+                (_short_mod97(body) * RF_SHIFT + RF_SUFFIX + int(reference[2:4])) % 97
+                == 1
+                and 4 <= len(body) <= 20
+                and finnish_reference_check_digit(body[:-1]) == int(body[-1])
+            ):
+                append(body)
+                continue
+
+        append(rf_to_finnish(reference))
+
+    return results
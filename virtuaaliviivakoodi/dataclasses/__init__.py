@@ -1 +1,47 @@
-from .virtuaaliviivakoodi_deconstruct import VirtuaaliviivakoodiDeconstruct
+import importlib
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .field_error import FieldError
+    from .reconciliation_match import ReconciliationMatch
+    from .stage_stats import StageStats
+    from .virtuaaliviivakoodi_columns import VirtuaaliviivakoodiColumns
+    from .virtuaaliviivakoodi_deconstruct import VirtuaaliviivakoodiDeconstruct
+    from .virtuaaliviivakoodi_deconstruct_batch import (
+        VirtuaaliviivakoodiDeconstructBatch,
+    )
+    from .virtuaaliviivakoodi_match import VirtuaaliviivakoodiMatch
+    from .virtuaaliviivakoodi_view import VirtuaaliviivakoodiView
+
+# Imported on first access, so importing one dataclass does not load the others
+_LAZY_ATTRIBUTES = MappingProxyType(
+    {
+        "FieldError": ".field_error",
+        "ReconciliationMatch": ".reconciliation_match",
+        "StageStats": ".stage_stats",
+        "VirtuaaliviivakoodiColumns": ".virtuaaliviivakoodi_columns",
+        "VirtuaaliviivakoodiDeconstruct": ".virtuaaliviivakoodi_deconstruct",
+        "VirtuaaliviivakoodiDeconstructBatch": ".virtuaaliviivakoodi_deconstruct_batch",
+        "VirtuaaliviivakoodiMatch": ".virtuaaliviivakoodi_match",
+        "VirtuaaliviivakoodiView": ".virtuaaliviivakoodi_view",
+    }
+)
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
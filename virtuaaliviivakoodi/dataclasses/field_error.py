@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+from virtuaaliviivakoodi.constants import ErrorCode
+
+
+@dataclass(frozen=True)
+class FieldError:
+    """Validation error of a single row, returned instead of raising an exception"""
+
+    code: ErrorCode
+    field: str
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+from virtuaaliviivakoodi.constants import ReconciliationStatus
+
+
+@dataclass(frozen=True)
+class ReconciliationMatch:
+    """Open invoice matched by a payment.
+
+    :param status: How the payment matches the invoice
+    :param amount_cents: Open amount of the invoice in cents
+    :param difference_cents: Paid amount minus the open amount in cents
+    """
+
+    status: ReconciliationStatus
+    amount_cents: int
+    difference_cents: int
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class StageStats:
+    """Call statistics of a single instrumented stage"""
+
+    calls: int
+    failures: int
+    seconds: float
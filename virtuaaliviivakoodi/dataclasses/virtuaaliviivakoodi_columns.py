@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class VirtuaaliviivakoodiColumns:
+    """Column-wise decode result of `decode_virtuaaliviivakoodi_array()`.
+
+    With the NumPy backend every column is a NumPy array, with the Python
+    backend a list holding the same values as the array's `tolist()`.
+    Invalid rows are marked in `valid` and have empty values in other columns.
+    """
+
+    valid: Any  # bool
+    symbols: Any  # uint8, 4 or 5
+    euro_cents: Any  # int64
+    due_dates: Any  # datetime64[D], NaT if not defined
+    ibans: Any  # S16, IBAN digits without the country code
+    references: Any  # S23, reference field of the virtuaaliviivakoodi
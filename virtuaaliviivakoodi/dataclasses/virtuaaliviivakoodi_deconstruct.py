@@ -11,5 +11,6 @@ class VirtuaaliviivakoodiDeconstruct:
     symbol: SymbolVersion
     iban: str
     reference: str
-    euro_amount: Decimal
+    euro_amount: Optional[Decimal]
     due_date: Optional[date]
+    amount_cents: Optional[int] = None
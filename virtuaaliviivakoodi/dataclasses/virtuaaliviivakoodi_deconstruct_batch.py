@@ -0,0 +1,110 @@
+from array import array
+from datetime import date
+from decimal import Decimal
+from typing import Iterator, Optional
+
+from virtuaaliviivakoodi.constants import SymbolVersion
+
+from .virtuaaliviivakoodi_deconstruct import VirtuaaliviivakoodiDeconstruct
+
+IBAN_WIDTH = 16
+REFERENCE_WIDTH = 23
+
+
+class VirtuaaliviivakoodiDeconstructBatch:
+    """Columnar result of `deconstruct_many()`.
+
+    Every field is stored in a compact column instead of one object per row:
+
+    - `symbols`: symbol version digit (4 or 5) per row, `array("B")`
+    - `euro_cents`: euro amount as integer cents per row, `array("q")`
+    - `due_date_ordinals`: `date.toordinal()` of the due date, 0 if not defined, `array("i")`
+    - `ibans`: 16 IBAN digits per row without the country code, `bytes`
+    - `references`: 23 character reference field per row, `bytes`
+
+    Per-row values and `VirtuaaliviivakoodiDeconstruct` objects are materialized on demand.
+    """
+
+    __slots__ = ("symbols", "euro_cents", "due_date_ordinals", "ibans", "references")
+
+    def __init__(
+        self,
+        symbols: array,
+        euro_cents: array,
+        due_date_ordinals: array,
+        ibans: bytes,
+        references: bytes,
+    ):
+        self.symbols = symbols
+        self.euro_cents = euro_cents
+        self.due_date_ordinals = due_date_ordinals
+        self.ibans = ibans
+        self.references = references
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __iter__(self) -> Iterator[VirtuaaliviivakoodiDeconstruct]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getitem__(self, index: int) -> VirtuaaliviivakoodiDeconstruct:
+        index = self._index(index)
+
+        return VirtuaaliviivakoodiDeconstruct(
+            symbol=self.symbol(index),
+            iban=self.iban(index),
+            reference=self.reference(index),
+            euro_amount=self.euro_amount(index),
+            due_date=self.due_date(index),
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the column buffers in bytes"""
+
+        return (
+            self.symbols.itemsize * len(self.symbols)
+            + self.euro_cents.itemsize * len(self.euro_cents)
+            + self.due_date_ordinals.itemsize * len(self.due_date_ordinals)
+            + len(self.ibans)
+            + len(self.references)
+        )
+
+    def _index(self, index: int) -> int:
+        length = len(self)
+
+        if index < 0:
+            index += length
+
+        if not 0 <= index < length:
+            raise IndexError("Batch index out of range")
+
+        return index
+
+    def symbol(self, index: int) -> SymbolVersion:
+        return SymbolVersion(str(self.symbols[index]))
+
+    def iban(self, index: int) -> str:
+        index = self._index(index)
+        start = index * IBAN_WIDTH
+
+        return "FI" + self.ibans[start : start + IBAN_WIDTH].decode("ascii")
+
+    def reference(self, index: int) -> str:
+        index = self._index(index)
+        start = index * REFERENCE_WIDTH
+        reference = self.references[start : start + REFERENCE_WIDTH].decode("ascii")
+
+        if self.symbols[index] == 5:
+            return "RF" + reference[:2] + reference[2:].lstrip("0")
+
+        return reference[3:].lstrip("0")
+
+    def euro_amount(self, index: int) -> Decimal:
+        return Decimal(self.euro_cents[index]).scaleb(-2)
+
+    def due_date(self, index: int) -> Optional[date]:
+        ordinal = self.due_date_ordinals[index]
+
+        return date.fromordinal(ordinal) if ordinal else None
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+from .virtuaaliviivakoodi_deconstruct import VirtuaaliviivakoodiDeconstruct
+
+
+@dataclass(frozen=True)
+class VirtuaaliviivakoodiMatch:
+    """Virtuaaliviivakoodi found in a text"""
+
+    virtuaaliviivakoodi: str
+    offset: int
+    deconstruct: VirtuaaliviivakoodiDeconstruct
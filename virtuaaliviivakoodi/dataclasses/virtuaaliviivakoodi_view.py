@@ -0,0 +1,160 @@
+from datetime import date
+from decimal import Decimal
+from typing import Optional, Union
+
+from virtuaaliviivakoodi.constants import SymbolVersion
+from virtuaaliviivakoodi.constants.virtuaaliviivakoodi_slice import (
+    VirtuaaliviivakoodiSlice,
+)
+from virtuaaliviivakoodi.exceptions import (
+    InvalidLengthException,
+    InvalidSymbolException,
+    VirtuaaliviivakoodiException,
+)
+from virtuaaliviivakoodi.utils import decode_due_date
+
+from .virtuaaliviivakoodi_deconstruct import VirtuaaliviivakoodiDeconstruct
+
+LENGTH = 54
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+class VirtuaaliviivakoodiView:
+    """Lazy view of a virtuaaliviivakoodi inside a byte buffer.
+
+    The buffer is wrapped in a `memoryview` without copying, and only the length and
+    the symbol version are validated when the view is created. Each field is decoded
+    from its `VirtuaaliviivakoodiSlice` on first access and cached, so reading only
+    the reference does not build Decimals or dates. A view can be shared between
+    threads: concurrent first accesses may decode a field twice, with the same result.
+
+    :param buffer: Buffer containing the virtuaaliviivakoodi as ASCII digits
+    :param offset: Start of the virtuaaliviivakoodi in the buffer
+    """
+
+    __slots__ = (
+        "_buffer",
+        "_symbol",
+        "_iban",
+        "_reference",
+        "_amount_cents",
+        "_due_date",
+    )
+
+    # Fields are decoded into the slots on first access
+    _buffer: memoryview
+    _symbol: SymbolVersion
+    _iban: str
+    _reference: str
+    _amount_cents: int
+    _due_date: Optional[date]
+
+    def __init__(self, buffer: Buffer, offset: int = 0):
+        view = memoryview(buffer)[offset : offset + LENGTH]
+
+        if len(view) != LENGTH:
+            raise InvalidLengthException(
+                "Invalid length of virtuaaliviivakoodi. Must be 54 characters."
+            )
+
+        if view.format != "B":
+            view = view.cast("B")
+
+        if view[0] == 52:
+            self._symbol = SymbolVersion.VERSION_4
+        elif view[0] == 53:
+            self._symbol = SymbolVersion.VERSION_5
+        else:
+            raise InvalidSymbolException("Invalid symbol version. Must be 4 or 5.")
+
+        self._buffer = view
+
+    def __bytes__(self) -> bytes:
+        return self._buffer.tobytes()
+
+    def __str__(self) -> str:
+        return str(self._buffer, "latin-1")
+
+    def __repr__(self) -> str:
+        return f"VirtuaaliviivakoodiView({bytes(self)!r})"
+
+    def _digits(self, field: slice) -> str:
+        digits = str(self._buffer[field], "latin-1")
+
+        if not (digits.isascii() and digits.isdigit()):
+            raise VirtuaaliviivakoodiException(
+                "Invalid virtuaaliviivakoodi. Must contain only digits."
+            )
+
+        return digits
+
+    @property
+    def symbol(self) -> SymbolVersion:
+        return self._symbol
+
+    @property
+    def iban(self) -> str:
+        try:
+            return self._iban
+        except AttributeError:
+            self._iban = iban = "FI" + self._digits(VirtuaaliviivakoodiSlice.IBAN)
+            return iban
+
+    @property
+    def reference(self) -> str:
+        try:
+            return self._reference
+        except AttributeError:
+            pass
+
+        if self._symbol is SymbolVersion.VERSION_5:
+            reference = (
+                "RF"
+                + self._digits(VirtuaaliviivakoodiSlice.REFERENCE_RF_HEAD)
+                + self._digits(VirtuaaliviivakoodiSlice.REFERENCE_RF_TAIL).lstrip("0")
+            )
+        else:
+            reference = self._digits(VirtuaaliviivakoodiSlice.REFERENCE_FIN).lstrip("0")
+
+        self._reference = reference
+        return reference
+
+    @property
+    def amount_cents(self) -> int:
+        try:
+            return self._amount_cents
+        except AttributeError:
+            self._amount_cents = amount_cents = int(
+                self._digits(VirtuaaliviivakoodiSlice.AMOUNT)
+            )
+            return amount_cents
+
+    @property
+    def euro_amount(self) -> Decimal:
+        return Decimal(self.amount_cents).scaleb(-2)
+
+    @property
+    def due_date(self) -> Optional[date]:
+        try:
+            return self._due_date
+        except AttributeError:
+            self._due_date = due_date = decode_due_date(
+                str(self._buffer[VirtuaaliviivakoodiSlice.DATE], "latin-1")
+            )
+            return due_date
+
+    def to_deconstruct(
+        self, amount_cents: bool = False
+    ) -> VirtuaaliviivakoodiDeconstruct:
+        """Converts the view into a `VirtuaaliviivakoodiDeconstruct`, with the amount
+        as integer `amount_cents` instead of `euro_amount` if requested"""
+
+        return VirtuaaliviivakoodiDeconstruct(
+            symbol=self.symbol,
+            iban=self.iban,
+            reference=self.reference,
+            euro_amount=None if amount_cents else self.euro_amount,
+            due_date=self.due_date,
+            amount_cents=self.amount_cents if amount_cents else None,
+        )
@@ -0,0 +1 @@
+from .code128 import decode_runs, decode_scanline, decode_scanlines, scanline_runs
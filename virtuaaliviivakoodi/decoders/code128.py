@@ -0,0 +1,253 @@
+import math
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+from virtuaaliviivakoodi.constants.code128 import (
+    CODE128_CHECKSUM_MODULUS,
+    CODE128_PATTERNS,
+    CODE128_START_C,
+    CODE128_STOP,
+    CODE128_STOP_MODULES,
+    CODE128_SYMBOL_MODULES,
+)
+from virtuaaliviivakoodi.dataclasses import VirtuaaliviivakoodiDeconstruct
+from virtuaaliviivakoodi.deconstruction import deconstruct_virtuaaliviivakoodi
+from virtuaaliviivakoodi.exceptions import (
+    InvalidBarcodeException,
+    VirtuaaliviivakoodiException,
+)
+
+SYMBOLS = 29
+RUNS = SYMBOLS * 6 + 7
+
+# Largest accepted difference between a measured distance and a whole number of
+# modules. Values close to 0.5 accept any measurement that rounds to a valid symbol,
+# and rely on the checksum to reject misreads.
+TOLERANCE = 0.45
+
+PAIRS = tuple(f"{value:02d}" for value in range(100))
+
+RUN_PATTERN = re.compile(rb"1+|0+")
+
+Runs = Sequence[float]
+Decoded = Union[str, VirtuaaliviivakoodiDeconstruct]
+
+
+def _edges(widths: Sequence[float]) -> Tuple[float, ...]:
+    return tuple(widths[index] + widths[index + 1] for index in range(len(widths) - 2))
+
+
+# Symbols are identified by the distances between the leading edges of consecutive
+# bars and of consecutive spaces. Unlike the bar widths, these distances are not
+# changed by ink spread or blur, which make all bars wider and all spaces narrower.
+EDGE_VALUES = MappingProxyType(
+    {
+        _edges(tuple(map(int, pattern))): value
+        for value, pattern in enumerate(CODE128_PATTERNS[:CODE128_STOP])
+    }
+)
+STOP_EDGES = _edges(tuple(map(int, CODE128_PATTERNS[CODE128_STOP])))
+
+
+def _classify(
+    edges: Sequence[float], scale: float, tolerance: float
+) -> Optional[Tuple[int, ...]]:
+    modules = tuple(round(edge * scale) for edge in edges)
+
+    for edge, rounded in zip(edges, modules):
+        if abs(edge * scale - rounded) > tolerance:
+            return None
+
+    return modules
+
+
+def _symbol_values(runs: Runs, tolerance: float) -> Optional[List[int]]:
+    edges = [width + next_width for width, next_width in zip(runs, runs[1:])]
+    values = []
+
+    # The module width is measured separately for every symbol, which tolerates
+    # a scan speed or a print scale that changes along the barcode
+    for offset in range(0, SYMBOLS * 6, 6):
+        width = sum(runs[offset : offset + 6])
+
+        if width <= 0:
+            return None
+
+        value = EDGE_VALUES.get(
+            _classify(
+                edges[offset : offset + 4], CODE128_SYMBOL_MODULES / width, tolerance
+            )
+        )
+
+        if value is None:
+            return None
+
+        values.append(value)
+
+    width = sum(runs[SYMBOLS * 6 :])
+
+    if (
+        width <= 0
+        or _classify(
+            edges[SYMBOLS * 6 : RUNS - 2], CODE128_STOP_MODULES / width, tolerance
+        )
+        != STOP_EDGES
+    ):
+        return None
+
+    return values
+
+
+def _decode_values(runs: Runs, tolerance: float) -> List[int]:
+    if len(runs) != RUNS:
+        raise InvalidBarcodeException(
+            f"Invalid barcode. Must have {RUNS} bars and spaces, got {len(runs)}."
+        )
+
+    values = _symbol_values(runs, tolerance)
+
+    # A barcode scanned from right to left starts with the stop pattern
+    if values is None or values[0] != CODE128_START_C:
+        values = _symbol_values(runs[::-1], tolerance)
+
+    if values is None:
+        raise InvalidBarcodeException(
+            "Invalid barcode. Bar and space widths do not match Code 128 symbols."
+        )
+
+    if values[0] != CODE128_START_C:
+        raise InvalidBarcodeException("Invalid barcode. Must be Code 128 set C.")
+
+    checksum = sum(
+        position * value for position, value in enumerate(values[1:-1], start=1)
+    )
+
+    if (CODE128_START_C + checksum) % CODE128_CHECKSUM_MODULUS != values[-1]:
+        raise InvalidBarcodeException("Invalid barcode. Checksum does not match.")
+
+    return values[1:-1]
+
+
+def decode_runs(
+    runs: Runs,
+    tolerance: float = TOLERANCE,
+    deconstruct: bool = False,
+    strict: bool = False,
+) -> Decoded:
+    """Decodes a virtuaaliviivakoodi from the bar and space widths of its barcode.
+
+    :param runs: Widths of the bars and spaces in any unit, starting and ending with
+    a bar, without the quiet zones. The barcode may be scanned in either direction.
+    :param tolerance: Largest accepted deviation from a whole number of modules
+    :param deconstruct: Return a `VirtuaaliviivakoodiDeconstruct` instead of the
+    virtuaaliviivakoodi
+    :param strict: Validate the IBAN checksum and the check digits of the reference
+    when deconstructing
+
+    :return: Virtuaaliviivakoodi or its deconstruction
+    :raises InvalidBarcodeException: if the barcode cannot be decoded
+    """
+
+    values = _decode_values(runs, tolerance)
+
+    if any(value >= 100 for value in values):
+        raise InvalidBarcodeException(
+            "Invalid barcode. Must contain only set C digit pairs."
+        )
+
+    virtuaaliviivakoodi = "".join([PAIRS[value] for value in values])
+
+    if deconstruct:
+        return deconstruct_virtuaaliviivakoodi(virtuaaliviivakoodi, strict=strict)
+
+    return virtuaaliviivakoodi
+
+
+@lru_cache(maxsize=None)
+def _bits_table(dark: int) -> bytes:
+    # Maps the `dark` lowest intensities to "1" (bar) and the others to "0"
+    return b"1" * dark + b"0" * (256 - dark)
+
+
+def scanline_runs(
+    pixels: Union[bytes, bytearray, memoryview, Sequence[float]],
+    threshold: Optional[float] = None,
+) -> List[int]:
+    """Measures the bars and spaces of a scanline.
+
+    :param pixels: Intensities of the pixels, where bars are dark
+    :param threshold: Intensity below which a pixel is part of a bar. Defaults to
+    the midpoint of the darkest and the lightest pixel.
+
+    :return: Widths in pixels, from the first bar to the last bar
+    """
+
+    if isinstance(pixels, (bytes, bytearray, memoryview)):
+        pixels = bytes(pixels)
+
+        if not pixels:
+            return []
+
+        if threshold is None:
+            threshold = (min(pixels) + max(pixels)) / 2
+
+        bits = pixels.translate(_bits_table(min(max(math.ceil(threshold), 0), 256)))
+    else:
+        if not pixels:
+            return []
+
+        if threshold is None:
+            threshold = (min(pixels) + max(pixels)) / 2
+
+        bits = bytes(49 if pixel < threshold else 48 for pixel in pixels)
+
+    bits = bits.strip(b"0")
+
+    return [len(run) for run in RUN_PATTERN.findall(bits)]
+
+
+def decode_scanline(
+    pixels: Union[bytes, bytearray, memoryview, Sequence[float]],
+    threshold: Optional[float] = None,
+    tolerance: float = TOLERANCE,
+    deconstruct: bool = False,
+    strict: bool = False,
+) -> Decoded:
+    """Decodes a Code 128 barcode of a virtuaaliviivakoodi from a row of pixels.
+
+    :param pixels: Intensities of the pixels, e.g. a row of an 8-bit grayscale image
+    :param threshold: Intensity below which a pixel is part of a bar. Defaults to
+    the midpoint of the darkest and the lightest pixel.
+
+    The other arguments are the same as in `decode_runs()`.
+    """
+
+    return decode_runs(scanline_runs(pixels, threshold), tolerance, deconstruct, strict)
+
+
+def decode_scanlines(
+    scanlines: Iterable[Union[bytes, bytearray, memoryview, Sequence[float]]],
+    threshold: Optional[float] = None,
+    tolerance: float = TOLERANCE,
+    deconstruct: bool = False,
+    strict: bool = False,
+) -> List[Optional[Decoded]]:
+    """Decodes many scanlines without raising.
+
+    :return: Decoded virtuaaliviivakoodi's in input order, with None for the
+    scanlines that cannot be decoded
+    """
+
+    results: List[Optional[Decoded]] = []
+
+    for pixels in scanlines:
+        try:
+            results.append(
+                decode_scanline(pixels, threshold, tolerance, deconstruct, strict)
+            )
+        except VirtuaaliviivakoodiException:
+            results.append(None)
+
+    return results
@@ -0,0 +1,62 @@
+from virtuaaliviivakoodi.dataclasses.virtuaaliviivakoodi_deconstruct import (
+    VirtuaaliviivakoodiDeconstruct,
+)
+from virtuaaliviivakoodi.deconstructors import (
+    deconstruct_amount,
+    deconstruct_amount_cents,
+    deconstruct_date,
+    deconstruct_iban,
+    deconstruct_reference_and_version,
+)
+from virtuaaliviivakoodi.validators import (
+    validate_iban,
+    validate_length,
+    validate_reference_checksum,
+)
+
+
+def deconstruct_virtuaaliviivakoodi(
+    virtuaaliviivakoodi: str,
+    *,
+    strict: bool = False,
+    amount_cents: bool = False,
+) -> VirtuaaliviivakoodiDeconstruct:
+    """Deconstructs virtuaaliviivakoodi into its parts.
+
+    :param virtuaaliviivakoodi: Virtuaaliviivakoodi to deconstruct
+    :param strict: Validate the IBAN checksum and the check digits of the reference
+    :param amount_cents: Return the amount as integer `amount_cents` instead of
+    `euro_amount`
+
+    :return: VirtuaaliviivakoodiDeconstruct object containing
+    the deconstructed parts of the virtuaaliviivakoodi
+    """
+
+    validate_length(virtuaaliviivakoodi)
+
+    reference, symbol = deconstruct_reference_and_version(virtuaaliviivakoodi)
+    iban = deconstruct_iban(virtuaaliviivakoodi)
+
+    if strict:
+        validate_iban(iban)
+        validate_reference_checksum(reference)
+
+    due_date = deconstruct_date(virtuaaliviivakoodi)
+
+    if amount_cents:
+        return VirtuaaliviivakoodiDeconstruct(
+            symbol=symbol,
+            iban=iban,
+            reference=reference,
+            euro_amount=None,
+            due_date=due_date,
+            amount_cents=deconstruct_amount_cents(virtuaaliviivakoodi),
+        )
+
+    return VirtuaaliviivakoodiDeconstruct(
+        symbol=symbol,
+        iban=iban,
+        reference=reference,
+        euro_amount=deconstruct_amount(virtuaaliviivakoodi),
+        due_date=due_date,
+    )
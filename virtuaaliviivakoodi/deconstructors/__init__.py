@@ -1,4 +1,4 @@
-from .amount import deconstruct_amount
+from .amount import deconstruct_amount, deconstruct_amount_cents
 from .date import deconstruct_date
 from .iban import deconstruct_iban
 from .reference import deconstruct_reference_and_version
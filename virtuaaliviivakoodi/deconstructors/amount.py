@@ -11,3 +11,9 @@ def deconstruct_amount(virtuaaliviivakoodi: str) -> decimal.Decimal:
     cents = virtuaaliviivakoodi[VirtuaaliviivakoodiSlice.AMOUNT_CENTS]
 
     return decimal.Decimal(f"{euros}.{cents}")
+
+
+def deconstruct_amount_cents(virtuaaliviivakoodi: str) -> int:
+    """Deconstructs the amount from virtuaaliviivakoodi as integer cents"""
+
+    return int(virtuaaliviivakoodi[VirtuaaliviivakoodiSlice.AMOUNT])
@@ -1,30 +1,24 @@
-from datetime import date, datetime
+from datetime import date
 from typing import Union
 
 from virtuaaliviivakoodi.constants.virtuaaliviivakoodi_slice import (
     VirtuaaliviivakoodiSlice,
 )
+from virtuaaliviivakoodi.utils.due_date_codec import CENTURY_PIVOT, decode_due_date
 
 
-def deconstruct_date(virtuaaliviivakoodi: str) -> Union[date, None]:
-    """Deconstructs the due date from virtuaaliviivakoodi from "yymmdd" to datetime object.
+def deconstruct_date(
+    virtuaaliviivakoodi: str, pivot: int = CENTURY_PIVOT
+) -> Union[date, None]:
+    """Deconstructs the due date from virtuaaliviivakoodi from "yymmdd" to date object.
 
     The date can be not defined, in which case it is "000000" in the virtuaaliviivakoodi.
     In this case None is returned.
-    """
-
-    due_date = virtuaaliviivakoodi[VirtuaaliviivakoodiSlice.DATE]
 
-    if due_date == "000000":
-        return None
+    Two digit years below `pivot` are in the 2000s and the rest in the 1900s.
+    By default every due date is in the 2000s.
 
-    parsed_date = datetime.strptime(due_date, "%y%m%d").date()
-
-    # CASE: Virtuaaliviivakoodi's date is over the year 69
-    # Python's datetime assumes the year to be in the 1900s.
-    # > Need to manually validate that the year is in the current century.
-    # This is what you get for using 2-digit years.
-    if parsed_date.year < 2000:
-        parsed_date = parsed_date.replace(year=parsed_date.year + 100)
+    :raises InvalidDueDateException: if the due date is not a valid date
+    """
 
-    return parsed_date
+    return decode_due_date(virtuaaliviivakoodi[VirtuaaliviivakoodiSlice.DATE], pivot)
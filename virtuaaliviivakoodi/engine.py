@@ -0,0 +1,213 @@
+"""Fused validation and normalization of the virtuaaliviivakoodi input fields.
+
+Each field is scanned once: whitespace is stripped with a single `str.split()` pass,
+the result is checked with C-level character class methods and the normalized
+segment is built from the same string.
+
+The `*_segment` functions return `None` for invalid input without raising.
+The `prepare_*` functions raise the same exceptions as the `validators` package,
+which is only consulted for the error message once a field is known to be invalid.
+"""
+
+import decimal
+from datetime import date
+from typing import Optional, Tuple, Union
+
+from virtuaaliviivakoodi.exceptions import (
+    InvalidDueDateException,
+    InvalidEuroAmountException,
+    InvalidIBANException,
+    InvalidReferenceException,
+)
+from virtuaaliviivakoodi.utils import (
+    encode_due_date,
+    euro_amount_to_cents,
+    finnish_reference_check_digit,
+)
+from virtuaaliviivakoodi.validators import (
+    validate_amount_cents,
+    validate_due_date,
+    validate_euro_amount,
+    validate_iban,
+    validate_reference,
+)
+from virtuaaliviivakoodi.validators.iban import iban_checksum_ok
+from virtuaaliviivakoodi.validators.reference_checksum import rf_checksum_ok
+
+MAX_EURO_AMOUNT = decimal.Decimal("999999.99")
+MAX_FLOAT_EURO_AMOUNT = 999999.99
+MAX_AMOUNT_CENTS = 99999999
+
+
+def iban_segment(iban: str) -> Optional[str]:
+    """Returns the 16 digit account segment of a Finnish IBAN with a valid checksum,
+    or None if invalid"""
+
+    if not isinstance(iban, str):
+        return None
+
+    iban_ = "".join(iban.split())
+
+    if (
+        len(iban_) == 18
+        and iban_.startswith("FI")
+        and iban_.isascii()
+        and iban_[2:].isdigit()
+        and iban_checksum_ok(iban_[2:])
+    ):
+        return iban_[2:]
+
+    return None
+
+
+def reference_segment(reference: Union[int, str]) -> Optional[Tuple[str, str]]:
+    """Returns the symbol version and the 23 character reference segment,
+    or None if invalid"""
+
+    if isinstance(reference, str):
+        reference_ = "".join(reference.split())
+    elif isinstance(reference, int):
+        reference_ = str(reference)
+    else:
+        return None
+
+    length = len(reference_)
+
+    if not reference_.isascii():
+        return None
+
+    if 4 <= length <= 20 and reference_.isdigit():
+        return "4", reference_.zfill(23)
+
+    if 5 <= length <= 25 and reference_.startswith("RF") and reference_[2:].isdigit():
+        return "5", reference_[2:4] + reference_[4:].zfill(21)
+
+    return None
+
+
+def reference_segment_checksum_ok(symbol: str, segment: str) -> bool:
+    """Checks the check digits of a reference segment returned by `reference_segment()`"""
+
+    if symbol == "5":
+        return rf_checksum_ok(segment[2:], segment[:2])
+
+    return finnish_reference_check_digit(segment[:-1]) == int(segment[-1])
+
+
+def euro_amount_segment(
+    euro_amount: Union[float, int, decimal.Decimal],
+) -> Optional[str]:
+    """Returns the 8 digit euro amount segment, or None if invalid"""
+
+    segment = None
+
+    if isinstance(euro_amount, int):
+        if 0 <= euro_amount <= 999999:
+            segment = f"{euro_amount:06d}00"
+    elif isinstance(euro_amount, float):
+        if 0 <= euro_amount <= MAX_FLOAT_EURO_AMOUNT:
+            segment = f"{round(euro_amount * 100):08d}"
+    elif isinstance(euro_amount, decimal.Decimal):
+        if euro_amount.is_finite() and 0 <= euro_amount <= MAX_EURO_AMOUNT:
+            segment = f"{euro_amount_to_cents(euro_amount):08d}"
+
+    return segment
+
+
+def amount_cents_segment(amount_cents: int) -> Optional[str]:
+    """Returns the 8 digit euro amount segment of an amount in cents,
+    or None if invalid"""
+
+    if (
+        isinstance(amount_cents, int)
+        and not isinstance(amount_cents, bool)
+        and 0 <= amount_cents <= MAX_AMOUNT_CENTS
+    ):
+        return f"{amount_cents:08d}"
+
+    return None
+
+
+def due_date_segment(due_date: Union[date, None]) -> Optional[str]:
+    """Returns the 6 digit "yymmdd" due date segment, or None if invalid"""
+
+    if due_date is None or isinstance(due_date, date):
+        return encode_due_date(due_date)
+
+    return None
+
+
+def prepare_iban(iban: str) -> str:
+    segment = iban_segment(iban)
+
+    if segment is None:
+        validate_iban(iban)
+        raise InvalidIBANException("Invalid IBAN")
+
+    return segment
+
+
+def prepare_reference(
+    reference: Union[int, str], strict: bool = False
+) -> Tuple[str, str]:
+    segment = reference_segment(reference)
+
+    if segment is None:
+        validate_reference(reference)
+        raise InvalidReferenceException(
+            "Invalid reference. Must use Finnish or RF reference formats."
+        )
+
+    if strict and not reference_segment_checksum_ok(*segment):
+        raise InvalidReferenceException(
+            "Invalid reference. Check digit does not match."
+        )
+
+    return segment
+
+
+def prepare_euro_amount(euro_amount: Union[float, int, decimal.Decimal]) -> str:
+    segment = euro_amount_segment(euro_amount)
+
+    if segment is None:
+        validate_euro_amount(euro_amount)
+        raise InvalidEuroAmountException("Invalid euro amount")
+
+    return segment
+
+
+def prepare_amount_cents(amount_cents: int) -> str:
+    segment = amount_cents_segment(amount_cents)
+
+    if segment is None:
+        validate_amount_cents(amount_cents)
+        raise InvalidEuroAmountException("Invalid amount in cents")
+
+    return segment
+
+
+def prepare_amount(
+    euro_amount: Union[float, int, decimal.Decimal, None] = None,
+    amount_cents: Optional[int] = None,
+) -> str:
+    """Prepares the amount segment from either a euro amount or an amount in cents"""
+
+    if amount_cents is None:
+        return prepare_euro_amount(euro_amount)
+
+    if euro_amount is not None:
+        raise InvalidEuroAmountException(
+            "Invalid euro amount. Give either euro amount or amount in cents."
+        )
+
+    return prepare_amount_cents(amount_cents)
+
+
+def prepare_due_date(due_date: Union[date, None]) -> str:
+    segment = due_date_segment(due_date)
+
+    if segment is None:
+        validate_due_date(due_date)
+        raise InvalidDueDateException("Due date must be date object")
+
+    return segment
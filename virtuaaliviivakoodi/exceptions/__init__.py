@@ -24,3 +24,7 @@ class InvalidSymbolException(VirtuaaliviivakoodiException):
 
 class InvalidLengthException(VirtuaaliviivakoodiException):
     pass
+
+
+class InvalidBarcodeException(VirtuaaliviivakoodiException):
+    pass
@@ -0,0 +1,208 @@
+"""Extraction of virtuaaliviivakoodi's from free text, such as OCR output and emails.
+
+A virtuaaliviivakoodi may be split into groups of digits by separator characters,
+e.g. spaces or line breaks. Candidates are 54 digits made of whole groups, so digits
+glued to other digits never start or end a candidate. Candidates pass cheap checks
+of the symbol version, the zero padding of Finnish references and the due date
+digits before they are deconstructed.
+
+Only runs of digits and separators long enough to hold a virtuaaliviivakoodi are
+split into groups, so most of the text is skipped by the regex engine. The text is
+read in chunks, and at most one candidate is kept between chunks, so memory use does
+not depend on the size of the input.
+"""
+
+import re
+from collections import deque
+from typing import BinaryIO, Deque, Iterable, Iterator, Optional, TextIO, Tuple, Union
+
+from virtuaaliviivakoodi.dataclasses import VirtuaaliviivakoodiMatch
+from virtuaaliviivakoodi.deconstruction import deconstruct_virtuaaliviivakoodi
+from virtuaaliviivakoodi.exceptions import VirtuaaliviivakoodiException
+
+LENGTH = 54
+CHUNK_SIZE = 1 << 20
+SEPARATORS = " \t\r\n"
+
+DIGITS = re.compile("[0-9]+")
+
+Chunk = Union[str, bytes]
+Source = Union[TextIO, BinaryIO, Chunk, Iterable[Chunk]]
+
+
+def _is_candidate(digits: str) -> bool:
+    symbol = digits[0]
+
+    if symbol == "4":
+        # Finnish references have at most 20 digits, so the 23 digit reference
+        # field starts with three zeros
+        if digits[25:28] != "000":
+            return False
+    elif symbol != "5":
+        return False
+
+    # Tens of the month and of the day of the due date
+    return digits[50] in "01" and digits[52] in "0123"
+
+
+class _Extractor:
+    def __init__(self, separators: str, strict: bool):
+        self.strict = strict
+        self.characters = "0123456789" + separators
+
+        self.spans = re.compile(
+            f"[0-9][0-9{re.escape(separators)}]{{{LENGTH - 2},}}[0-9]"
+        )
+        self.groups: Deque[Tuple[int, str]] = deque()
+        self.digits = 0
+        self.carry = ""
+        self.carry_offset = 0
+        self.open = False
+
+    def feed(self, chunk: str, offset: int) -> Iterator[VirtuaaliviivakoodiMatch]:
+        position = 0
+        tail = len(chunk.rstrip(self.characters))
+
+        if self.open:
+            # Continue the run of digits and separators at the end of the last chunk
+            position = len(chunk) - len(chunk.lstrip(self.characters))
+
+            if position == len(chunk):
+                yield from self.run(chunk, offset, False)
+                return
+
+            yield from self.run(chunk[:position], offset, True)
+            self.open = False
+
+        for span in self.spans.finditer(chunk, position, tail):
+            yield from self.run(span.group(), offset + span.start(), True)
+
+        if tail < len(chunk):
+            yield from self.run(chunk[tail:], offset + tail, False)
+            self.open = True
+
+    def finish(self, offset: int) -> Iterator[VirtuaaliviivakoodiMatch]:
+        if self.open:
+            yield from self.run("", offset, True)
+
+    def run(
+        self, text: str, offset: int, closed: bool
+    ) -> Iterator[VirtuaaliviivakoodiMatch]:
+        """Processes the digit groups of a run of digits and separators. The run
+        continues in the next chunk unless it is `closed`."""
+
+        if self.carry and text and not "0" <= text[0] <= "9":
+            yield from self.add(self.carry_offset, self.carry)
+            self.carry = ""
+
+        for match in DIGITS.finditer(text):
+            start, end = match.span()
+
+            if start == 0 and self.carry:
+                group_offset, digits = self.carry_offset, self.carry + match.group()
+                self.carry = ""
+            else:
+                group_offset, digits = offset + start, match.group()
+
+            if end == len(text) and not closed:
+                # The group may continue in the next chunk. A group of more than
+                # 54 digits is never part of a virtuaaliviivakoodi, so it is cut.
+                self.carry, self.carry_offset = digits[: LENGTH + 1], group_offset
+            else:
+                yield from self.add(group_offset, digits)
+
+        if closed:
+            if self.carry:
+                yield from self.add(self.carry_offset, self.carry)
+                self.carry = ""
+
+            self.groups.clear()
+            self.digits = 0
+
+    def add(self, offset: int, digits: str) -> Iterator[VirtuaaliviivakoodiMatch]:
+        if len(digits) > LENGTH:
+            self.groups.clear()
+            self.digits = 0
+            return
+
+        self.groups.append((offset, digits))
+        self.digits += len(digits)
+
+        while self.digits >= LENGTH:
+            count = 0
+            length = 0
+
+            for _, group in self.groups:
+                count += 1
+                length += len(group)
+
+                if length >= LENGTH:
+                    break
+
+            if length == LENGTH:
+                candidate = "".join([self.groups[index][1] for index in range(count)])
+                result = self.match(self.groups[0][0], candidate)
+
+                if result is not None:
+                    yield result
+
+                    for _ in range(count):
+                        self.groups.popleft()
+
+                    self.digits -= LENGTH
+                    continue
+
+            self.digits -= len(self.groups.popleft()[1])
+
+    def match(self, offset: int, candidate: str) -> Optional[VirtuaaliviivakoodiMatch]:
+        if not _is_candidate(candidate):
+            return None
+
+        try:
+            deconstruct = deconstruct_virtuaaliviivakoodi(candidate, strict=self.strict)
+        except VirtuaaliviivakoodiException:
+            return None
+
+        return VirtuaaliviivakoodiMatch(candidate, offset, deconstruct)
+
+
+def _chunks(source: Source, chunk_size: int) -> Iterator[str]:
+    if isinstance(source, (str, bytes)):
+        chunks: Iterable[Chunk] = (source,)
+    elif hasattr(source, "read"):
+        chunks = iter(lambda: source.read(chunk_size), source.read(0))
+    else:
+        chunks = source
+
+    for chunk in chunks:
+        # Digits and ASCII separators are single bytes in UTF-8 and in the Latin
+        # encodings, so bytes decode one character per byte
+        yield chunk.decode("latin-1") if isinstance(chunk, bytes) else chunk
+
+
+def extract_virtuaaliviivakoodit(
+    source: Source,
+    separators: str = SEPARATORS,
+    strict: bool = False,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[VirtuaaliviivakoodiMatch]:
+    """Finds the virtuaaliviivakoodi's in a text.
+
+    :param source: Text or bytes, a file opened in text or binary mode, or an
+    iterable of text or byte chunks
+    :param separators: Characters allowed between the digits of a virtuaaliviivakoodi
+    :param strict: Validate the IBAN checksum and the check digits of the reference
+    :param chunk_size: Number of characters or bytes read from a file at once
+
+    :return: Iterator of the found virtuaaliviivakoodi's with their offsets in
+    characters (bytes for binary input), in text order
+    """
+
+    extractor = _Extractor(separators, strict)
+    offset = 0
+
+    for chunk in _chunks(source, chunk_size):
+        yield from extractor.feed(chunk, offset)
+        offset += len(chunk)
+
+    yield from extractor.finish(offset)
@@ -0,0 +1 @@
+from .reference import generate_reference, generate_references
@@ -0,0 +1,85 @@
+from typing import Iterator, List
+
+from virtuaaliviivakoodi.exceptions import InvalidReferenceException
+from virtuaaliviivakoodi.utils import finnish_reference_check_digit
+
+# Finnish references are 4-20 digits long including the check digit
+MIN_BASE = 100
+MAX_BASE = 10**19 - 1
+
+# Weights of the digits of base // 10, i.e. all digits but the last, from the right
+PREFIX_WEIGHTS = (3, 1, 7)
+
+# SUFFIXES[prefix_total % 10][last_digit] is the last base digit followed by the check
+# digit, where prefix_total is the weighted sum of the other base digits.
+SUFFIXES = tuple(
+    tuple(f"{digit}{-(prefix_total + 7 * digit) % 10}" for digit in range(10))
+    for prefix_total in range(10)
+)
+
+
+def _validate_base(base: int) -> None:
+    if not isinstance(base, int) or not MIN_BASE <= base <= MAX_BASE:
+        raise InvalidReferenceException(
+            f"Invalid reference base. Must be integer between {MIN_BASE} and {MAX_BASE}."
+        )
+
+
+def generate_reference(base: int) -> str:
+    """Generates a Finnish reference by appending the 7-3-1 check digit to the base.
+    E.g. 123456 > "1234561"
+    """
+
+    _validate_base(base)
+
+    return f"{base}{finnish_reference_check_digit(str(base))}"
+
+
+def generate_references(start: int, stop: int) -> Iterator[str]:
+    """Generates Finnish references for the consecutive bases `start` ... `stop - 1`.
+
+    The weighted sum of the digits is updated incrementally from one base to the next
+    instead of being recomputed for every reference.
+    """
+
+    _validate_base(start)
+    if stop > start:
+        _validate_base(stop - 1)
+
+    prefix = start // 10
+    prefix_digits: List[int] = [int(digit) for digit in reversed(str(prefix))]
+    prefix_total = sum(
+        PREFIX_WEIGHTS[position % 3] * digit
+        for position, digit in enumerate(prefix_digits)
+    )
+    last_digit = start % 10
+    remaining = stop - start
+
+    while remaining > 0:
+        prefix_str = str(prefix)
+        suffixes = SUFFIXES[prefix_total % 10]
+        block_end = min(10, last_digit + remaining)
+
+        for digit in range(last_digit, block_end):
+            yield prefix_str + suffixes[digit]
+
+        remaining -= block_end - last_digit
+        last_digit = 0
+
+        # Increment the prefix, carrying over nines
+        prefix += 1
+        position = 0
+        while True:
+            if position == len(prefix_digits):
+                prefix_digits.append(0)
+
+            weight = PREFIX_WEIGHTS[position % 3]
+
+            if prefix_digits[position] < 9:
+                prefix_digits[position] += 1
+                prefix_total += weight
+                break
+
+            prefix_digits[position] = 0
+            prefix_total -= 9 * weight
+            position += 1
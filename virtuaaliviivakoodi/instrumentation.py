@@ -0,0 +1,160 @@
+"""Opt-in instrumentation of the stages of `virtuaaliviivakoodi()` and
+`deconstruct_virtuaaliviivakoodi()`.
+
+`enable()` replaces the stage functions used by the two functions with wrappers that
+record call counts, cumulative time and failures, and `disable()` puts the original
+functions back. While instrumentation is disabled nothing is wrapped, so it costs
+nothing. The wrappers, the statistics and the hook are process-wide and shared by
+all threads; the statistics and the hook are guarded by a lock.
+
+The `prepare_*` stages validate and normalize a field of a virtuaaliviivakoodi in one
+pass, so their time covers both the `validate_*` and the `normalize_*` step.
+"""
+
+import functools
+import importlib
+import threading
+import time
+from contextlib import contextmanager
+from types import ModuleType
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from virtuaaliviivakoodi.dataclasses import StageStats
+
+GENERATION_STAGES = (
+    "prepare_iban",
+    "prepare_reference",
+    "prepare_amount",
+    "prepare_due_date",
+)
+DECONSTRUCTION_STAGES = (
+    "validate_length",
+    "deconstruct_reference_and_version",
+    "deconstruct_iban",
+    "validate_iban",
+    "validate_reference_checksum",
+    "deconstruct_date",
+    "deconstruct_amount",
+    "deconstruct_amount_cents",
+)
+STAGES = GENERATION_STAGES + DECONSTRUCTION_STAGES
+
+Hook = Callable[[str, float, Optional[BaseException]], None]
+
+_lock = threading.Lock()
+_originals: Dict[str, Tuple[ModuleType, Callable]] = {}
+_stats: Dict[str, List] = {}
+_hook: Optional[Hook] = None
+
+
+def _record(stage: str, seconds: float, error: Optional[BaseException]) -> None:
+    with _lock:
+        counters = _stats[stage]
+        counters[0] += 1
+        counters[1] += error is not None
+        counters[2] += seconds
+
+    hook = _hook
+
+    if hook is not None:
+        # Metrics must never change the result of the instrumented call
+        try:
+            hook(stage, seconds, error)
+        except Exception:  # pylint: disable=broad-except
+            pass
+
+
+def _wrap(stage: str, function: Callable) -> Callable:
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        error = None
+        start = time.perf_counter()
+
+        try:
+            return function(*args, **kwargs)
+        except BaseException as exception:
+            error = exception
+            raise
+        finally:
+            _record(stage, time.perf_counter() - start, error)
+
+    return wrapper
+
+
+def enable(hook: Optional[Hook] = None) -> None:
+    """Starts recording stage statistics.
+
+    :param hook: Function called after every stage call with the stage name, the
+    elapsed seconds and the raised exception or None, e.g. to export metrics. It is
+    called in the thread that made the call, so it should return quickly. Exceptions
+    raised by the hook are ignored.
+    """
+
+    global _hook  # pylint: disable=global-statement
+
+    with _lock:
+        _hook = hook
+
+        if _originals:
+            return
+
+        for module_name, stages in (
+            ("virtuaaliviivakoodi.virtuaaliviivakoodi", GENERATION_STAGES),
+            ("virtuaaliviivakoodi.deconstruction", DECONSTRUCTION_STAGES),
+        ):
+            module = importlib.import_module(module_name)
+
+            for stage in stages:
+                _stats.setdefault(stage, [0, 0, 0.0])
+                original = getattr(module, stage)
+                _originals[stage] = (module, original)
+                setattr(module, stage, _wrap(stage, original))
+
+
+def disable() -> None:
+    """Stops recording and restores the original stage functions.
+    The recorded statistics are kept until `reset()`."""
+
+    global _hook  # pylint: disable=global-statement
+
+    with _lock:
+        for stage, (module, original) in _originals.items():
+            setattr(module, stage, original)
+
+        _originals.clear()
+        _hook = None
+
+
+def is_enabled() -> bool:
+    return bool(_originals)
+
+
+@contextmanager
+def instrumented(hook: Optional[Hook] = None) -> Iterator[None]:
+    """Enables instrumentation for the duration of a `with` block"""
+
+    enable(hook)
+
+    try:
+        yield
+    finally:
+        disable()
+
+
+def stats() -> Dict[str, StageStats]:
+    """Returns a snapshot of the statistics of every stage called so far"""
+
+    with _lock:
+        return {
+            stage: StageStats(calls, failures, seconds)
+            for stage, (calls, failures, seconds) in _stats.items()
+            if calls
+        }
+
+
+def reset() -> None:
+    """Clears the recorded statistics"""
+
+    with _lock:
+        for counters in _stats.values():
+            counters[:] = [0, 0, 0.0]
@@ -1,6 +1,8 @@
 from datetime import date
 from typing import Union
 
+from virtuaaliviivakoodi.utils.due_date_codec import encode_due_date
+
 
 def normalize_due_date(due_date: Union[date, None]) -> str:
     """
@@ -10,4 +12,4 @@ def normalize_due_date(due_date: Union[date, None]) -> str:
     According to the documentation, the due date can be empty in which case 000000 is used.
     """
 
-    return due_date.strftime("%y%m%d") if due_date else "000000"
+    return encode_due_date(due_date or None)
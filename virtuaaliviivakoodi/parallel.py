@@ -0,0 +1,252 @@
+"""Parallel generation and deconstruction of virtuaaliviivakoodi's.
+
+The input is split into chunks that are processed in a `ProcessPoolExecutor`, or in
+a `ThreadPoolExecutor` with `threads=True`. The results are yielded in input order as
+soon as the next chunk is done. At most two chunks per worker are in flight, so memory
+use stays bounded for any input size.
+
+Chunks are sent and returned in a compact form: generated barcodes come back as one
+packed string per chunk, and barcodes to deconstruct are sent as one packed string
+and come back as a columnar `VirtuaaliviivakoodiDeconstructBatch`.
+
+Starting the process pool takes about 20 ms and pickling costs about 0.5 µs per row,
+while generating a barcode serially takes about 4 µs. With four workers the pool
+therefore pays off at around 10 000 rows, and smaller inputs are faster with the
+serial batch functions. Inputs of less than `SERIAL_THRESHOLD` rows are processed in
+the calling process. `benchmarks/parallel.py` measures the crossover point on the
+current machine.
+
+Threads only scale on free-threaded CPython builds, where the GIL is disabled. The
+package keeps no shared mutable state besides `functools.lru_cache` caches, which are
+thread-safe, so the thread pool can run the same functions without locks. The
+exception is the opt-in `instrumentation` module, which patches the stage functions
+while enabled and guards its statistics with a lock. Threads
+start cheaply and share memory, so with threads the serial path is only used below
+`THREAD_SERIAL_THRESHOLD` rows. `benchmarks/thread_scaling.py` measures the scaling.
+"""
+
+import os
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain, islice
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from virtuaaliviivakoodi.batch import (
+    Record,
+    deconstruct_many,
+    virtuaaliviivakoodi_many_from_records,
+)
+from virtuaaliviivakoodi.dataclasses import (
+    VirtuaaliviivakoodiDeconstruct,
+    VirtuaaliviivakoodiDeconstructBatch,
+)
+from virtuaaliviivakoodi.validators import validate_length
+
+LENGTH = 54
+
+SERIAL_THRESHOLD = 10_000
+THREAD_SERIAL_THRESHOLD = 1_000
+MIN_CHUNK_SIZE = 1_000
+MAX_CHUNK_SIZE = 200_000
+
+# Chunks are sized to take about this long in a worker, which keeps the
+# per-chunk overhead small while results still stream out steadily.
+TARGET_CHUNK_SECONDS = 0.05
+
+Payload = TypeVar("Payload")
+Result = TypeVar("Result")
+
+
+def _generate_chunk(payload: Tuple[List[Record], bool]) -> Tuple[str, float]:
+    records, strict = payload
+    start = time.perf_counter()
+    packed = "".join(virtuaaliviivakoodi_many_from_records(records, strict=strict))
+
+    return packed, time.perf_counter() - start
+
+
+def _deconstruct_chunk(
+    payload: Tuple[str, bool],
+) -> Tuple[VirtuaaliviivakoodiDeconstructBatch, float]:
+    packed, strict = payload
+    start = time.perf_counter()
+    batch = deconstruct_many(
+        (packed[offset : offset + LENGTH] for offset in range(0, len(packed), LENGTH)),
+        strict=strict,
+    )
+
+    return batch, time.perf_counter() - start
+
+
+def _next_chunk_size(rows: int, elapsed: float) -> int:
+    if elapsed <= 0:
+        return MAX_CHUNK_SIZE
+
+    return max(
+        MIN_CHUNK_SIZE, min(MAX_CHUNK_SIZE, int(rows * TARGET_CHUNK_SECONDS / elapsed))
+    )
+
+
+def _run(  # pylint: disable=too-many-arguments
+    function: Callable[[Payload], Tuple[Result, float]],
+    pack: Callable[[List[Any]], Payload],
+    items: Iterable[Any],
+    *,
+    workers: Optional[int],
+    chunk_size: Optional[int],
+    executor: Optional[Executor],
+    threads: bool,
+) -> Iterator[Result]:
+    serial_threshold = THREAD_SERIAL_THRESHOLD if threads else SERIAL_THRESHOLD
+    iterator = iter(items)
+    head = list(islice(iterator, serial_threshold))
+
+    if len(head) < serial_threshold:
+        if head:
+            yield function(pack(head))[0]
+        return
+
+    workers = workers or os.cpu_count() or 1
+    iterator = chain(head, iterator)
+    size = chunk_size or MIN_CHUNK_SIZE
+    owned_executor = executor is None
+
+    if owned_executor:
+        executor = (ThreadPoolExecutor if threads else ProcessPoolExecutor)(
+            max_workers=workers
+        )
+
+    pending: Deque = deque()
+
+    try:
+        while True:
+            while len(pending) < 2 * workers:
+                chunk = list(islice(iterator, size))
+
+                if not chunk:
+                    break
+
+                pending.append((len(chunk), executor.submit(function, pack(chunk))))
+
+            if not pending:
+                return
+
+            rows, future = pending.popleft()
+            result, elapsed = future.result()
+
+            if chunk_size is None:
+                size = _next_chunk_size(rows, elapsed)
+
+            yield result
+    finally:
+        if owned_executor:
+            executor.shutdown(cancel_futures=True)
+
+
+def generate_parallel(  # pylint: disable=too-many-arguments
+    records: Iterable[Record],
+    *,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    strict: bool = False,
+    executor: Optional[Executor] = None,
+    threads: bool = False,
+) -> Iterator[str]:
+    """Generates virtuaaliviivakoodi's for invoice records in parallel.
+
+    Produces the same results as `virtuaaliviivakoodi_many_from_records()`, yielded
+    in input order while the rest of the input is still being processed. An invalid
+    record raises its exception when the iteration reaches its chunk.
+
+    :param records: Mappings or `(iban, reference, euro_amount[, due_date])` tuples
+    :param workers: Number of workers, defaults to the number of CPUs
+    :param chunk_size: Fixed number of records per chunk. By default the chunk size
+    adapts to the measured processing time.
+    :param strict: Validate the check digits of the references
+    :param executor: Executor to use instead of starting a new pool
+    :param threads: Use a thread pool instead of a process pool
+
+    :return: Iterator of virtuaaliviivakoodi's in input order
+    """
+
+    for packed in _run(
+        _generate_chunk,
+        lambda chunk: (chunk, strict),
+        records,
+        workers=workers,
+        chunk_size=chunk_size,
+        executor=executor,
+        threads=threads,
+    ):
+        for offset in range(0, len(packed), LENGTH):
+            yield packed[offset : offset + LENGTH]
+
+
+def _pack_virtuaaliviivakoodit(chunk: List[str]) -> str:
+    # Every row is checked, because rows of wrong lengths may still add up to the
+    # packed length of the chunk and would then be sliced into different barcodes
+    if set(map(len, chunk)) != {LENGTH}:
+        for virtuaaliviivakoodi in chunk:
+            validate_length(virtuaaliviivakoodi)
+
+    return "".join(chunk)
+
+
+def deconstruct_parallel(  # pylint: disable=too-many-arguments
+    virtuaaliviivakoodit: Iterable[str],
+    *,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    strict: bool = False,
+    executor: Optional[Executor] = None,
+    batches: bool = False,
+    threads: bool = False,
+) -> Union[
+    Iterator[VirtuaaliviivakoodiDeconstruct],
+    Iterator[VirtuaaliviivakoodiDeconstructBatch],
+]:
+    """Deconstructs virtuaaliviivakoodi's in parallel.
+
+    Rows are validated like in `deconstruct_many()` and the results are yielded in
+    input order. An invalid virtuaaliviivakoodi raises its exception when the
+    iteration reaches its chunk.
+
+    :param virtuaaliviivakoodit: Virtuaaliviivakoodi's to deconstruct
+    :param workers: Number of workers, defaults to the number of CPUs
+    :param chunk_size: Fixed number of rows per chunk. By default the chunk size
+    adapts to the measured processing time.
+    :param strict: Validate the IBAN checksum and the check digits of the reference
+    :param executor: Executor to use instead of starting a new pool
+    :param batches: Yield one `VirtuaaliviivakoodiDeconstructBatch` per chunk instead
+    of one `VirtuaaliviivakoodiDeconstruct` per row
+    :param threads: Use a thread pool instead of a process pool
+
+    :return: Iterator of deconstructed virtuaaliviivakoodi's in input order
+    """
+
+    results = _run(
+        _deconstruct_chunk,
+        lambda chunk: (_pack_virtuaaliviivakoodit(chunk), strict),
+        virtuaaliviivakoodit,
+        workers=workers,
+        chunk_size=chunk_size,
+        executor=executor,
+        threads=threads,
+    )
+
+    if batches:
+        return results
+
+    return (deconstruct for batch in results for deconstruct in batch)
@@ -0,0 +1,58 @@
+import decimal
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Optional, Union
+
+from virtuaaliviivakoodi.engine import (
+    prepare_amount,
+    prepare_due_date,
+    prepare_iban,
+    prepare_reference,
+)
+
+
+@dataclass(frozen=True)
+class Payee:
+    """Barcode template of a single payee.
+
+    The IBAN is validated and normalized once when the payee is created, so that
+    `barcode()` only has to process the per-invoice fields. Payees are immutable and
+    can be shared between threads and pickled to worker processes.
+
+    :param iban: IBAN of the payee
+    """
+
+    iban: str
+    iban_segment: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "iban_segment", prepare_iban(self.iban))
+        object.__setattr__(self, "iban", "FI" + self.iban_segment)
+
+    def barcode(
+        self,
+        reference: Union[int, str],
+        euro_amount: Union[float, int, decimal.Decimal, None] = None,
+        due_date: date = None,
+        *,
+        strict: bool = False,
+        amount_cents: Optional[int] = None,
+    ) -> str:
+        """Generates a virtuaaliviivakoodi for an invoice of the payee.
+
+        Produces the same result as `virtuaaliviivakoodi()` called with the IBAN of
+        the payee.
+        """
+
+        symbol, reference_segment = prepare_reference(reference, strict)
+
+        return (
+            symbol
+            + self.iban_segment
+            + prepare_amount(euro_amount, amount_cents)
+            + reference_segment
+            + prepare_due_date(due_date)
+        )
+
+
+BarcodeTemplate = Payee
@@ -0,0 +1,351 @@
+"""Matching of incoming payments to open invoices.
+
+Invoices are keyed on the normalized IBAN and reference digits of their
+virtuaaliviivakoodi, packed two digits per byte, and their open amounts are kept as
+integer cents. An index of a million invoices takes roughly a third of the memory of
+a dict keyed on IBAN and reference strings with `Decimal` amounts.
+"""
+
+import decimal
+import os
+import sys
+from array import array
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from virtuaaliviivakoodi.constants import ReconciliationStatus
+from virtuaaliviivakoodi.dataclasses import ReconciliationMatch
+from virtuaaliviivakoodi.engine import (
+    amount_cents_segment,
+    euro_amount_segment,
+    iban_segment,
+    prepare_amount,
+    prepare_iban,
+    prepare_reference,
+    reference_segment,
+)
+from virtuaaliviivakoodi.exceptions import VirtuaaliviivakoodiException
+from virtuaaliviivakoodi.validators import validate_length
+
+# Symbol version, IBAN and reference segment: 40 digits packed into 20 bytes
+KEY_SIZE = 20
+AMOUNT_SIZE = 8
+MAGIC = b"VVKRIDX\x01"
+HEADER_SIZE = len(MAGIC) + 8
+
+Record = Union[Mapping[str, Any], Sequence[Any]]
+
+
+def _key(symbol: str, iban: str, reference: str) -> bytes:
+    return bytes.fromhex(symbol + iban + reference)
+
+
+def _split_record(record: Record) -> Tuple[Any, Any, Any, Any]:
+    # Returns the IBAN, the reference, the euro amount and the amount in cents
+    if isinstance(record, Mapping):
+        return (
+            record["iban"],
+            record["reference"],
+            record.get("euro_amount"),
+            record.get("amount_cents"),
+        )
+
+    return record[0], record[1], record[2], None
+
+
+def _payment_cents(
+    euro_amount: Union[float, int, decimal.Decimal, None],
+    amount_cents: Optional[int],
+) -> Optional[int]:
+    if amount_cents is None:
+        segment = euro_amount_segment(euro_amount)
+    else:
+        segment = amount_cents_segment(amount_cents)
+
+    return None if segment is None else int(segment)
+
+
+class ReconciliationIndex:
+    """Index of open invoices for matching incoming payments.
+
+    Invoices are added with the same arguments as `virtuaaliviivakoodi()` or as
+    virtuaaliviivakoodi's, and removed as they are paid. There is one open invoice
+    per IBAN and reference, so adding an invoice again replaces its amount.
+
+    The index is not thread-safe. Use `save()` and `load()` to persist it.
+    """
+
+    def __init__(self):
+        self._amounts: Dict[bytes, int] = {}
+
+    @classmethod
+    def from_records(
+        cls, records: Iterable[Record], strict: bool = False
+    ) -> "ReconciliationIndex":
+        """Builds an index of invoice records.
+
+        :param records: Mappings with the same keys as the arguments of
+        `virtuaaliviivakoodi()` or `(iban, reference, euro_amount[, due_date])` tuples
+        :param strict: Validate the check digits of the references
+        """
+
+        index = cls()
+        index.add_records(records, strict)
+
+        return index
+
+    @classmethod
+    def from_virtuaaliviivakoodit(
+        cls, virtuaaliviivakoodit: Iterable[str]
+    ) -> "ReconciliationIndex":
+        """Builds an index of the invoices of virtuaaliviivakoodi's"""
+
+        index = cls()
+        index.add_virtuaaliviivakoodit(virtuaaliviivakoodit)
+
+        return index
+
+    def __len__(self) -> int:
+        return len(self._amounts)
+
+    def __iter__(self) -> Iterator[Tuple[str, str, int]]:
+        """Iterates over the open invoices as `(iban, reference, amount_cents)`"""
+
+        for key, amount_cents in self._amounts.items():
+            digits = key.hex()
+            reference = digits[17:]
+
+            if digits[0] == "4":
+                reference = reference.lstrip("0")
+            else:
+                reference = "RF" + reference[:2] + reference[2:].lstrip("0")
+
+            yield "FI" + digits[1:17], reference, amount_cents
+
+    def add(
+        self,
+        iban: str,
+        reference: Union[int, str],
+        euro_amount: Union[float, int, decimal.Decimal, None] = None,
+        *,
+        strict: bool = False,
+        amount_cents: Optional[int] = None,
+    ) -> None:
+        """Adds an open invoice. The arguments are validated like in
+        `virtuaaliviivakoodi()`."""
+
+        symbol, reference_segment_ = prepare_reference(reference, strict)
+        key = _key(symbol, prepare_iban(iban), reference_segment_)
+        self._amounts[key] = int(prepare_amount(euro_amount, amount_cents))
+
+    def add_records(self, records: Iterable[Record], strict: bool = False) -> None:
+        """Adds invoice records, see `from_records()`.
+
+        :raises VirtuaaliviivakoodiException: if a record is invalid. The records
+        before it are already added.
+        """
+
+        iban_cache: Dict[Any, str] = {}
+        amounts = self._amounts
+
+        for record in records:
+            iban, reference, euro_amount, amount_cents = _split_record(record)
+
+            try:
+                iban_segment_ = iban_cache[iban]
+            except KeyError:
+                iban_segment_ = iban_cache[iban] = prepare_iban(iban)
+            except TypeError:
+                iban_segment_ = prepare_iban(iban)
+
+            symbol, reference_segment_ = prepare_reference(reference, strict)
+            amounts[_key(symbol, iban_segment_, reference_segment_)] = int(
+                prepare_amount(euro_amount, amount_cents)
+            )
+
+    def add_virtuaaliviivakoodi(self, virtuaaliviivakoodi: str) -> None:
+        self.add_virtuaaliviivakoodit((virtuaaliviivakoodi,))
+
+    def add_virtuaaliviivakoodit(self, virtuaaliviivakoodit: Iterable[str]) -> None:
+        """Adds the invoices of virtuaaliviivakoodi's.
+
+        :raises VirtuaaliviivakoodiException: if a virtuaaliviivakoodi is invalid.
+        The invoices before it are already added.
+        """
+
+        amounts = self._amounts
+
+        for virtuaaliviivakoodi in virtuaaliviivakoodit:
+            validate_length(virtuaaliviivakoodi)
+
+            if not (
+                virtuaaliviivakoodi.isascii()
+                and virtuaaliviivakoodi.isdigit()
+                and virtuaaliviivakoodi[0] in "45"
+            ):
+                raise VirtuaaliviivakoodiException(
+                    "Invalid virtuaaliviivakoodi. Must contain only digits "
+                    "and start with symbol version 4 or 5."
+                )
+
+            key = bytes.fromhex(virtuaaliviivakoodi[:17] + virtuaaliviivakoodi[25:48])
+            amounts[key] = int(virtuaaliviivakoodi[17:25])
+
+    def get(self, iban: str, reference: Union[int, str]) -> Optional[int]:
+        """Returns the open amount of an invoice in cents, or None if the invoice is
+        not open"""
+
+        segment = reference_segment(reference)
+        iban_segment_ = iban_segment(iban)
+
+        if segment is None or iban_segment_ is None:
+            return None
+
+        return self._amounts.get(_key(segment[0], iban_segment_, segment[1]))
+
+    def remove(self, iban: str, reference: Union[int, str]) -> int:
+        """Removes a paid or cancelled invoice.
+
+        :return: Open amount of the invoice in cents
+        :raises KeyError: if the invoice is not open
+        """
+
+        symbol, reference_segment_ = prepare_reference(reference)
+
+        return self._amounts.pop(_key(symbol, prepare_iban(iban), reference_segment_))
+
+    def remove_virtuaaliviivakoodi(self, virtuaaliviivakoodi: str) -> int:
+        """Removes the invoice of a virtuaaliviivakoodi, see `remove()`"""
+
+        validate_length(virtuaaliviivakoodi)
+
+        try:
+            key = bytes.fromhex(virtuaaliviivakoodi[:17] + virtuaaliviivakoodi[25:48])
+        except ValueError:
+            raise KeyError(virtuaaliviivakoodi) from None
+
+        return self._amounts.pop(key)
+
+    def reconcile(
+        self,
+        payments: Iterable[Record],
+        tolerance_cents: int = 0,
+        reference_only: bool = True,
+    ) -> List[Optional[ReconciliationMatch]]:
+        """Matches a batch of payments to the open invoices.
+
+        A payment matches the invoice with the same IBAN and reference. The match is
+        exact if the amounts are equal, within tolerance if they differ by at most
+        `tolerance_cents`, and otherwise reference-only. Payments with invalid
+        fields do not match. Matched invoices stay open until they are removed.
+
+        :param payments: Mappings with `iban`, `reference` and `euro_amount` or
+        `amount_cents` keys or `(iban, reference, euro_amount)` tuples
+        :param tolerance_cents: Largest accepted difference of the amounts in cents
+        :param reference_only: Return reference-only matches instead of None
+
+        :return: Matches in payment order, with None for unmatched payments
+        """
+
+        amounts = self._amounts
+        iban_cache: Dict[Any, Optional[str]] = {}
+        results: List[Optional[ReconciliationMatch]] = []
+        append = results.append
+
+        for payment in payments:
+            iban, reference, euro_amount, amount_cents = _split_record(payment)
+
+            try:
+                iban_segment_ = iban_cache[iban]
+            except KeyError:
+                iban_segment_ = iban_cache[iban] = iban_segment(iban)
+            except TypeError:
+                iban_segment_ = None
+
+            segment = reference_segment(reference)
+
+            if iban_segment_ is None or segment is None:
+                append(None)
+                continue
+
+            open_cents = amounts.get(_key(segment[0], iban_segment_, segment[1]))
+            paid_cents = _payment_cents(euro_amount, amount_cents)
+
+            if open_cents is None or paid_cents is None:
+                append(None)
+                continue
+
+            difference = paid_cents - open_cents
+
+            if difference == 0:
+                status = ReconciliationStatus.EXACT
+            elif -tolerance_cents <= difference <= tolerance_cents:
+                status = ReconciliationStatus.AMOUNT_TOLERANCE
+            elif reference_only:
+                status = ReconciliationStatus.REFERENCE_ONLY
+            else:
+                append(None)
+                continue
+
+            append(ReconciliationMatch(status, open_cents, difference))
+
+        return results
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """Writes the index into a file.
+
+        The keys and the amounts are written as two fixed-width blocks, so that
+        `load()` reads them back without parsing.
+        """
+
+        amounts = array("q", self._amounts.values())
+
+        if sys.byteorder == "big":
+            amounts.byteswap()
+
+        with open(path, "wb") as file:
+            file.write(MAGIC + len(self._amounts).to_bytes(8, "little"))
+            file.write(b"".join(self._amounts))
+            file.write(amounts.tobytes())
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike]) -> "ReconciliationIndex":
+        """Reads an index written by `save()`"""
+
+        with open(path, "rb") as file:
+            data = file.read()
+
+        count = int.from_bytes(data[len(MAGIC) : HEADER_SIZE], "little")
+        keys_end = HEADER_SIZE + count * KEY_SIZE
+
+        if not data.startswith(MAGIC) or len(data) != keys_end + count * AMOUNT_SIZE:
+            raise VirtuaaliviivakoodiException("Invalid reconciliation index file.")
+
+        amounts = array("q")
+        amounts.frombytes(data[keys_end:])
+
+        if sys.byteorder == "big":
+            amounts.byteswap()
+
+        index = cls()
+        index._amounts = dict(
+            zip(
+                [
+                    data[start : start + KEY_SIZE]
+                    for start in range(HEADER_SIZE, keys_end, KEY_SIZE)
+                ],
+                amounts.tolist(),
+            )
+        )
+
+        return index
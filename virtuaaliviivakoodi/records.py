@@ -0,0 +1,49 @@
+"""Parsing of invoice records read from text formats such as CSV and NDJSON."""
+
+import decimal
+from datetime import date
+from typing import Any, Dict, Mapping, Optional
+
+from virtuaaliviivakoodi.exceptions import (
+    InvalidDueDateException,
+    InvalidEuroAmountException,
+)
+
+
+def _parse_euro_amount(euro_amount: Any) -> Any:
+    if isinstance(euro_amount, (int, float, decimal.Decimal)):
+        return euro_amount
+
+    try:
+        return decimal.Decimal(euro_amount)
+    except (decimal.InvalidOperation, TypeError) as error:
+        raise InvalidEuroAmountException(
+            "Invalid euro amount. Must be a number."
+        ) from error
+
+
+def _parse_due_date(due_date: Any) -> Optional[date]:
+    if due_date in (None, ""):
+        return None
+
+    try:
+        return date.fromisoformat(due_date)
+    except (ValueError, TypeError) as error:
+        raise InvalidDueDateException(
+            "Invalid due date. Must be in YYYY-MM-DD format."
+        ) from error
+
+
+def parse_record(row: Mapping[str, Any]) -> Dict[str, Any]:
+    """Parses a row of text fields into the arguments of `virtuaaliviivakoodi()`.
+
+    The euro amount may be a number or a numeric string, and the due date
+    an ISO 8601 "YYYY-MM-DD" string or empty.
+    """
+
+    return {
+        "iban": row.get("iban"),
+        "reference": row.get("reference"),
+        "euro_amount": _parse_euro_amount(row.get("euro_amount")),
+        "due_date": _parse_due_date(row.get("due_date")),
+    }
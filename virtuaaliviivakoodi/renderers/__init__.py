@@ -0,0 +1,3 @@
+from .code128 import code128c_values, code128c_widths
+from .pbm import render_pbm
+from .svg import render_svg
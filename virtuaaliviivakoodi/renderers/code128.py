@@ -0,0 +1,61 @@
+from types import MappingProxyType
+from typing import List
+
+from virtuaaliviivakoodi.constants.code128 import (
+    CODE128_CHECKSUM_MODULUS,
+    CODE128_PATTERNS,
+    CODE128_START_C,
+    CODE128_STOP,
+)
+from virtuaaliviivakoodi.exceptions import VirtuaaliviivakoodiException
+from virtuaaliviivakoodi.validators import validate_length
+
+# Set C encodes each pair of digits "00" ... "99" as the symbol of the same value
+PAIR_VALUES = MappingProxyType({f"{value:02d}": value for value in range(100)})
+
+START_C_PATTERN = CODE128_PATTERNS[CODE128_START_C]
+STOP_PATTERN = CODE128_PATTERNS[CODE128_STOP]
+
+
+def validate_digits(virtuaaliviivakoodi: str) -> None:
+    validate_length(virtuaaliviivakoodi)
+
+    if not (virtuaaliviivakoodi.isascii() and virtuaaliviivakoodi.isdigit()):
+        raise VirtuaaliviivakoodiException(
+            "Invalid virtuaaliviivakoodi. Must contain only digits."
+        )
+
+
+def code128c_values(virtuaaliviivakoodi: str) -> List[int]:
+    """Encodes a virtuaaliviivakoodi into Code 128 set C symbol values.
+
+    :return: Start C, one value per pair of digits, the checksum and stop
+    """
+
+    validate_digits(virtuaaliviivakoodi)
+
+    values = [CODE128_START_C]
+    checksum = CODE128_START_C
+
+    for position in range(1, 28):
+        value = PAIR_VALUES[virtuaaliviivakoodi[2 * position - 2 : 2 * position]]
+        values.append(value)
+        checksum += position * value
+
+    values.append(checksum % CODE128_CHECKSUM_MODULUS)
+    values.append(CODE128_STOP)
+
+    return values
+
+
+def code128c_widths(virtuaaliviivakoodi: str) -> str:
+    """Encodes a virtuaaliviivakoodi into the bar and space widths of its
+    Code 128 barcode, without quiet zones.
+
+    :return: Widths in modules, one digit per bar or space, starting with a bar.
+    E.g. "211232..." for the start symbol.
+    """
+
+    return "".join(
+        CODE128_PATTERNS[value] for value in code128c_values(virtuaaliviivakoodi)
+    )
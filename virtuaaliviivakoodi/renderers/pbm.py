@@ -0,0 +1,68 @@
+from functools import lru_cache
+from typing import Tuple
+
+from virtuaaliviivakoodi.constants.code128 import (
+    CODE128_PATTERNS,
+    CODE128_QUIET_ZONE_MODULES,
+)
+
+from .code128 import code128c_values
+from .svg import BARCODE_MODULES
+
+
+@lru_cache(maxsize=16)
+def pbm_template(
+    module_width: int, height: int, quiet_zone: int
+) -> Tuple[bytes, Tuple[str, ...], str, str]:
+    """Builds the parts shared by every PBM barcode of the same geometry.
+
+    :return: Image header, the pixels of every Code 128 symbol value as a string of
+    "1" (black) and "0" (white), and the pixels before and after the symbols
+    """
+
+    width = (BARCODE_MODULES + 2 * quiet_zone) * module_width
+    symbols = tuple(
+        "".join(
+            ("0" if index % 2 else "1") * int(modules) * module_width
+            for index, modules in enumerate(pattern)
+        )
+        for pattern in CODE128_PATTERNS
+    )
+    margin = "0" * quiet_zone * module_width
+
+    # Rows of a binary PBM are padded to whole bytes
+    return (
+        f"P4\n{width} {height}\n".encode("ascii"),
+        symbols,
+        margin,
+        margin + "0" * (-width % 8),
+    )
+
+
+def render_pbm(
+    virtuaaliviivakoodi: str,
+    module_width: int = 2,
+    height: int = 100,
+    quiet_zone: int = CODE128_QUIET_ZONE_MODULES,
+) -> bytes:
+    """Renders a virtuaaliviivakoodi as a Code 128 barcode in a binary PBM image.
+
+    Every row of the image is identical, so one row is built from the cached symbol
+    pixels and repeated.
+
+    :param virtuaaliviivakoodi: Virtuaaliviivakoodi to render
+    :param module_width: Width of the narrowest bar in pixels
+    :param height: Height of the image in pixels
+    :param quiet_zone: Width of the empty margins in modules
+
+    :return: PBM image
+    """
+
+    header, symbols, left, right = pbm_template(module_width, height, quiet_zone)
+    row = (
+        left
+        + "".join([symbols[value] for value in code128c_values(virtuaaliviivakoodi)])
+        + right
+    )
+
+    return header + int(row, 2).to_bytes(len(row) // 8, "big") * height
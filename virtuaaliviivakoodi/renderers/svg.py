@@ -0,0 +1,93 @@
+from functools import lru_cache
+from typing import Tuple
+
+from virtuaaliviivakoodi.constants.code128 import (
+    CODE128_PATTERNS,
+    CODE128_QUIET_ZONE_MODULES,
+    CODE128_STOP_MODULES,
+    CODE128_SYMBOL_MODULES,
+)
+
+from .code128 import code128c_values
+
+# Start C, 27 pairs of digits and the checksum, followed by the stop pattern
+BARCODE_MODULES = 29 * CODE128_SYMBOL_MODULES + CODE128_STOP_MODULES
+
+
+def _number(value: float) -> str:
+    return f"{value:g}"
+
+
+def _fragment(pattern: str, module_width: float, height: float) -> str:
+    # Draws the bars of one symbol with relative path commands, so the fragment of
+    # a symbol is the same wherever the symbol is in the barcode
+    commands = []
+
+    for index in range(0, len(pattern), 2):
+        bar_width = int(pattern[index]) * module_width
+        space = (
+            int(pattern[index + 1]) * module_width if index + 1 < len(pattern) else 0
+        )
+        commands.append(
+            f"h{_number(bar_width)}v{_number(height)}h{_number(-bar_width)}z"
+            f"m{_number(bar_width + space)},0"
+        )
+
+    return "".join(commands)
+
+
+@lru_cache(maxsize=16)
+def svg_template(
+    module_width: float, height: float, quiet_zone: int, unit: str
+) -> Tuple[str, Tuple[str, ...], str]:
+    """Builds the parts shared by every SVG barcode of the same geometry.
+
+    :return: Document prefix, the path fragment of every Code 128 symbol value and
+    the document suffix
+    """
+
+    width = _number((BARCODE_MODULES + 2 * quiet_zone) * module_width)
+    height_ = _number(height)
+    prefix = (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}{unit}" '
+        f'height="{height_}{unit}" viewBox="0 0 {width} {height_}" '
+        f'shape-rendering="crispEdges">'
+        f'<rect width="{width}" height="{height_}" fill="#fff"/>'
+        f'<path d="M{_number(quiet_zone * module_width)},0'
+    )
+    fragments = tuple(
+        _fragment(pattern, module_width, height) for pattern in CODE128_PATTERNS
+    )
+
+    return prefix, fragments, '"/></svg>'
+
+
+def render_svg(
+    virtuaaliviivakoodi: str,
+    module_width: float = 1,
+    height: float = 50,
+    quiet_zone: int = CODE128_QUIET_ZONE_MODULES,
+    unit: str = "",
+) -> str:
+    """Renders a virtuaaliviivakoodi as a Code 128 barcode in an SVG document.
+
+    The document is assembled from a template cached per geometry, so rendering
+    many barcodes of the same size only joins precomputed strings.
+
+    :param virtuaaliviivakoodi: Virtuaaliviivakoodi to render
+    :param module_width: Width of the narrowest bar
+    :param height: Height of the bars
+    :param quiet_zone: Width of the empty margins in modules
+    :param unit: Unit of the document width and height, e.g. "mm". By default the
+    size is in user units (pixels).
+
+    :return: SVG document
+    """
+
+    prefix, fragments, suffix = svg_template(module_width, height, quiet_zone, unit)
+
+    return (
+        prefix
+        + "".join([fragments[value] for value in code128c_values(virtuaaliviivakoodi)])
+        + suffix
+    )
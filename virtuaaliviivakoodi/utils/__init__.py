@@ -1,3 +1,13 @@
 from .detect_symbol_version import detect_symbol_version
+from .due_date_codec import (
+    decode_due_date,
+    decode_due_date_ordinal,
+    encode_due_date,
+    encode_due_date_ordinal,
+    is_valid_due_date,
+)
+from .euro_amount_to_cents import euro_amount_to_cents
+from .mod97 import mod97
+from .reference_check_digit import finnish_reference_check_digit
 from .remove_whitespace import remove_whitespace
 from .split_euros_and_cents import split_euros_and_cents
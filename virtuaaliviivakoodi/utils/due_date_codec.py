@@ -0,0 +1,74 @@
+from datetime import date
+from functools import lru_cache
+from typing import Optional
+
+from virtuaaliviivakoodi.exceptions import InvalidDueDateException
+
+EMPTY_DUE_DATE = "000000"
+
+# Two digit years below the pivot are in the 2000s, the rest in the 1900s.
+# Due dates of virtuaaliviivakoodi's are always in the 2000s.
+CENTURY_PIVOT = 100
+
+
+@lru_cache(maxsize=8192)
+def decode_due_date(due_date: str, pivot: int = CENTURY_PIVOT) -> Optional[date]:
+    """Decodes a "yymmdd" due date into a date object.
+
+    The digits are converted with integer arithmetic instead of `strptime()`, and
+    decoded dates are cached, as the due dates of a batch fall in a narrow window.
+
+    :param due_date: Due date in "yymmdd" format, "000000" if not defined
+    :param pivot: Two digit years below the pivot are in the 2000s, others in the 1900s
+
+    :return: Due date, or None if not defined
+    """
+
+    if not (len(due_date) == 6 and due_date.isascii() and due_date.isdigit()):
+        raise InvalidDueDateException("Invalid due date. Must be in yymmdd format.")
+
+    if due_date == EMPTY_DUE_DATE:
+        return None
+
+    year, month_and_day = divmod(int(due_date), 10000)
+    month, day = divmod(month_and_day, 100)
+
+    try:
+        return date((2000 if year < pivot else 1900) + year, month, day)
+    except ValueError as error:
+        raise InvalidDueDateException("Invalid due date") from error
+
+
+@lru_cache(maxsize=8192)
+def is_valid_due_date(due_date: str, pivot: int = CENTURY_PIVOT) -> bool:
+    """Checks that a "yymmdd" due date can be decoded, without raising"""
+
+    try:
+        decode_due_date(due_date, pivot)
+    except InvalidDueDateException:
+        return False
+
+    return True
+
+
+def decode_due_date_ordinal(due_date: str, pivot: int = CENTURY_PIVOT) -> int:
+    """Decodes a "yymmdd" due date into `date.toordinal()`, 0 if not defined"""
+
+    decoded = decode_due_date(due_date, pivot)
+
+    return decoded.toordinal() if decoded else 0
+
+
+def encode_due_date(due_date: Optional[date]) -> str:
+    """Encodes a due date into "yymmdd" format, "000000" if not defined"""
+
+    if due_date is None:
+        return EMPTY_DUE_DATE
+
+    return f"{due_date.year % 100:02d}{due_date.month:02d}{due_date.day:02d}"
+
+
+def encode_due_date_ordinal(ordinal: int) -> str:
+    """Encodes a `date.toordinal()` due date into "yymmdd" format, 0 if not defined"""
+
+    return encode_due_date(date.fromordinal(ordinal) if ordinal else None)
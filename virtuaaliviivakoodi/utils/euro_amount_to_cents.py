@@ -0,0 +1,27 @@
+import decimal
+from typing import Union
+
+
+def euro_amount_to_cents(euro_amount: Union[float, int, decimal.Decimal]) -> int:
+    """Converts a euro amount into whole cents.
+
+    Integers and decimals are converted exactly. Decimals with more than two
+    decimals are rounded to the nearest cent with halves away from zero, like
+    `decimal.ROUND_HALF_UP`. Floats are rounded to the nearest cent with `round()`.
+    """
+
+    if isinstance(euro_amount, int):
+        return euro_amount * 100
+
+    if isinstance(euro_amount, decimal.Decimal):
+        numerator, denominator = euro_amount.as_integer_ratio()
+        if 100 % denominator == 0:
+            return numerator * (100 // denominator)
+
+        cents, remainder = divmod(abs(numerator) * 100, denominator)
+        if 2 * remainder >= denominator:
+            cents += 1
+
+        return cents if numerator >= 0 else -cents
+
+    return int(round(euro_amount * 100))
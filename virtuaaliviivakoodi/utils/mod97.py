@@ -0,0 +1,20 @@
+# 10 ** n % 97 for chunk lengths 0-9
+POWERS_OF_TEN_MOD_97 = tuple(10**n % 97 for n in range(10))
+
+CHUNK_SIZE = 9
+
+
+def mod97(digits: str) -> int:
+    """Returns the ISO 7064 mod-97 remainder of a digit string.
+
+    The string is processed in 9 digit chunks that fit a machine integer,
+    instead of converting the whole string into a big integer.
+    """
+
+    remainder = 0
+
+    for start in range(0, len(digits), CHUNK_SIZE):
+        chunk = digits[start : start + CHUNK_SIZE]
+        remainder = (remainder * POWERS_OF_TEN_MOD_97[len(chunk)] + int(chunk)) % 97
+
+    return remainder
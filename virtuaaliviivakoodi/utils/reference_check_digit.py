@@ -0,0 +1,21 @@
+# Weighted sum of every 3 digit group "abc" with the Finnish 7-3-1 weights.
+# Groups are aligned from the right, so the weights are 1, 3 and 7 from left to right.
+GROUP_WEIGHTED_SUMS = tuple(
+    (group // 100) + (group // 10 % 10) * 3 + (group % 10) * 7 for group in range(1000)
+)
+
+
+def finnish_reference_check_digit(base: str) -> int:
+    """Calculates the check digit of a Finnish reference using the 7-3-1 method.
+
+    :param base: Digits of the reference without the check digit
+    """
+
+    number = int(base)
+    total = 0
+
+    while number:
+        number, group = divmod(number, 1000)
+        total += GROUP_WEIGHTED_SUMS[group]
+
+    return -total % 10
@@ -1,12 +1,10 @@
 import decimal
-import math
 from typing import Tuple, Union
 
+from .euro_amount_to_cents import euro_amount_to_cents
+
 
 def split_euros_and_cents(
-    euro_amount: Union[float, int, decimal.Decimal]
+    euro_amount: Union[float, int, decimal.Decimal],
 ) -> Tuple[int, int]:
-    cents_as_float, euros_as_float = math.modf(euro_amount)
-    full_cents = int(round(cents_as_float * 100))
-    full_euros = int(euros_as_float)
-    return full_euros, full_cents
+    return divmod(euro_amount_to_cents(euro_amount), 100)
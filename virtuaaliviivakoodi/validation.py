@@ -0,0 +1,248 @@
+"""Validation of generation inputs and virtuaaliviivakoodi's without raising exceptions.
+
+Invalid rows are reported with a shared `FieldError` instance holding an `ErrorCode`
+and the name of the failing field, so validating a batch with many invalid rows costs
+about the same as validating a batch of valid rows.
+"""
+
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional
+
+from virtuaaliviivakoodi.constants import ErrorCode
+from virtuaaliviivakoodi.constants.virtuaaliviivakoodi_slice import (
+    VirtuaaliviivakoodiSlice,
+)
+from virtuaaliviivakoodi.dataclasses import FieldError
+from virtuaaliviivakoodi.engine import (
+    amount_cents_segment,
+    due_date_segment,
+    euro_amount_segment,
+    iban_segment,
+    reference_segment,
+    reference_segment_checksum_ok,
+)
+from virtuaaliviivakoodi.utils import is_valid_due_date
+from virtuaaliviivakoodi.validators.iban import iban_checksum_ok
+
+INVALID_VIRTUAALIVIIVAKOODI = FieldError(
+    ErrorCode.INVALID_VIRTUAALIVIIVAKOODI, "virtuaaliviivakoodi"
+)
+INVALID_LENGTH = FieldError(ErrorCode.INVALID_LENGTH, "virtuaaliviivakoodi")
+INVALID_SYMBOL = FieldError(ErrorCode.INVALID_SYMBOL, "symbol")
+INVALID_IBAN = FieldError(ErrorCode.INVALID_IBAN, "iban")
+INVALID_REFERENCE = FieldError(ErrorCode.INVALID_REFERENCE, "reference")
+INVALID_EURO_AMOUNT = FieldError(ErrorCode.INVALID_EURO_AMOUNT, "euro_amount")
+INVALID_AMOUNT_CENTS = FieldError(ErrorCode.INVALID_EURO_AMOUNT, "amount_cents")
+INVALID_DUE_DATE = FieldError(ErrorCode.INVALID_DUE_DATE, "due_date")
+
+
+def validate(  # pylint: disable=too-many-arguments
+    iban: Any,
+    reference: Any,
+    euro_amount: Any = None,
+    due_date: Any = None,
+    *,
+    strict: bool = False,
+    amount_cents: Any = None,
+) -> Optional[FieldError]:
+    """Validates the arguments of `virtuaaliviivakoodi()` without raising.
+
+    :return: None if `virtuaaliviivakoodi()` would succeed with the arguments,
+    otherwise the error of the first invalid field in the order they are processed
+    """
+
+    if iban_segment(iban) is None:
+        return INVALID_IBAN
+
+    segment = reference_segment(reference)
+
+    if segment is None or (strict and not reference_segment_checksum_ok(*segment)):
+        return INVALID_REFERENCE
+
+    if amount_cents is None:
+        if euro_amount_segment(euro_amount) is None:
+            return INVALID_EURO_AMOUNT
+    elif euro_amount is not None or amount_cents_segment(amount_cents) is None:
+        return INVALID_AMOUNT_CENTS
+
+    if due_date_segment(due_date) is None:
+        return INVALID_DUE_DATE
+
+    return None
+
+
+def is_valid(  # pylint: disable=too-many-arguments
+    iban: Any,
+    reference: Any,
+    euro_amount: Any = None,
+    due_date: Any = None,
+    *,
+    strict: bool = False,
+    amount_cents: Any = None,
+) -> bool:
+    """Checks whether `virtuaaliviivakoodi()` would succeed with the arguments"""
+
+    return (
+        validate(
+            iban,
+            reference,
+            euro_amount,
+            due_date,
+            strict=strict,
+            amount_cents=amount_cents,
+        )
+        is None
+    )
+
+
+def validate_many(
+    ibans: Iterable[Any],
+    references: Iterable[Any],
+    euro_amounts: Iterable[Any],
+    due_dates: Iterable[Any] = None,
+    *,
+    strict: bool = False,
+) -> List[Optional[FieldError]]:
+    """Validates columns of `virtuaaliviivakoodi_many()` arguments without raising.
+
+    IBANs and due dates are validated once per distinct value.
+
+    :return: None for each valid row and a `FieldError` for each invalid row,
+    in input order
+    """
+
+    if due_dates is None:
+        rows: Iterable = (
+            (iban, reference, euro_amount, None)
+            for iban, reference, euro_amount in zip(
+                ibans, references, euro_amounts, strict=True
+            )
+        )
+    else:
+        rows = zip(ibans, references, euro_amounts, due_dates, strict=True)
+
+    iban_cache: Dict[Any, bool] = {}
+    due_date_cache: Dict[Any, bool] = {None: True}
+    results: List[Optional[FieldError]] = []
+    append = results.append
+
+    for iban, reference, euro_amount, due_date in rows:
+        try:
+            iban_ok = iban_cache[iban]
+        except KeyError:
+            iban_ok = iban_cache[iban] = iban_segment(iban) is not None
+        except TypeError:
+            iban_ok = False
+
+        if not iban_ok:
+            append(INVALID_IBAN)
+            continue
+
+        segment = reference_segment(reference)
+
+        if segment is None or (strict and not reference_segment_checksum_ok(*segment)):
+            append(INVALID_REFERENCE)
+            continue
+
+        if euro_amount_segment(euro_amount) is None:
+            append(INVALID_EURO_AMOUNT)
+            continue
+
+        try:
+            due_date_ok = due_date_cache[due_date]
+        except KeyError:
+            due_date_ok = due_date_cache[due_date] = isinstance(due_date, date)
+        except TypeError:
+            due_date_ok = False
+
+        append(None if due_date_ok else INVALID_DUE_DATE)
+
+    return results
+
+
+def validate_virtuaaliviivakoodi(
+    virtuaaliviivakoodi: Any, strict: bool = False
+) -> Optional[FieldError]:
+    """Validates a virtuaaliviivakoodi like `deconstruct_many()` without raising.
+
+    Every field must consist of digits, and a field with other characters is reported
+    as invalid.
+
+    :param virtuaaliviivakoodi: Virtuaaliviivakoodi to validate
+    :param strict: Validate the IBAN checksum and the check digits of the reference
+
+    :return: None if the virtuaaliviivakoodi is valid, otherwise the error of
+    the first invalid field
+    """
+
+    if not isinstance(virtuaaliviivakoodi, str):
+        return INVALID_VIRTUAALIVIIVAKOODI
+
+    if len(virtuaaliviivakoodi) != 54:
+        return INVALID_LENGTH
+
+    symbol = virtuaaliviivakoodi[0]
+
+    if symbol not in "45":
+        return INVALID_SYMBOL
+
+    if not (virtuaaliviivakoodi.isascii() and virtuaaliviivakoodi.isdigit()):
+        return _non_digit_field(virtuaaliviivakoodi)
+
+    if strict:
+        error = _checksum_error(virtuaaliviivakoodi)
+
+        if error is not None:
+            return error
+
+    return None if is_valid_due_date(virtuaaliviivakoodi[48:54]) else INVALID_DUE_DATE
+
+
+def _checksum_error(virtuaaliviivakoodi: str) -> Optional[FieldError]:
+    if not iban_checksum_ok(virtuaaliviivakoodi[1:17]):
+        return INVALID_IBAN
+
+    if not reference_segment_checksum_ok(
+        virtuaaliviivakoodi[0], virtuaaliviivakoodi[25:48]
+    ):
+        return INVALID_REFERENCE
+
+    return None
+
+
+def _non_digit_field(virtuaaliviivakoodi: str) -> FieldError:
+    for field, error in (
+        (VirtuaaliviivakoodiSlice.IBAN, INVALID_IBAN),
+        (VirtuaaliviivakoodiSlice.AMOUNT, INVALID_EURO_AMOUNT),
+        (VirtuaaliviivakoodiSlice.REFERENCE, INVALID_REFERENCE),
+        (VirtuaaliviivakoodiSlice.DATE, INVALID_DUE_DATE),
+    ):
+        digits = virtuaaliviivakoodi[field]
+
+        if not (digits.isascii() and digits.isdigit()):
+            return error
+
+    return INVALID_VIRTUAALIVIIVAKOODI
+
+
+def is_valid_virtuaaliviivakoodi(
+    virtuaaliviivakoodi: Any, strict: bool = False
+) -> bool:
+    """Checks whether a virtuaaliviivakoodi is valid, without raising"""
+
+    return validate_virtuaaliviivakoodi(virtuaaliviivakoodi, strict) is None
+
+
+def validate_virtuaaliviivakoodi_many(
+    virtuaaliviivakoodit: Iterable[Any], strict: bool = False
+) -> List[Optional[FieldError]]:
+    """Validates many virtuaaliviivakoodi's without raising.
+
+    :return: None for each valid virtuaaliviivakoodi and a `FieldError` for each
+    invalid one, in input order
+    """
+
+    return [
+        validate_virtuaaliviivakoodi(virtuaaliviivakoodi, strict)
+        for virtuaaliviivakoodi in virtuaaliviivakoodit
+    ]
@@ -1,5 +1,11 @@
+from .amount_cents import validate_amount_cents
 from .due_date import validate_due_date
 from .euro_amount import validate_euro_amount
 from .iban import validate_iban
 from .length import validate_length
 from .reference import validate_reference
+from .reference_checksum import (
+    is_valid_reference_checksum,
+    validate_reference_checksum,
+    validate_reference_checksums,
+)
@@ -0,0 +1,16 @@
+from virtuaaliviivakoodi.exceptions import InvalidEuroAmountException
+
+
+def validate_amount_cents(amount_cents: int) -> None:
+    if not isinstance(amount_cents, int) or isinstance(amount_cents, bool):
+        raise InvalidEuroAmountException("Amount in cents must be integer")
+
+    if amount_cents < 0:
+        raise InvalidEuroAmountException(
+            "Invalid amount in cents. Amount must be positive."
+        )
+
+    if amount_cents > 99999999:
+        raise InvalidEuroAmountException(
+            "Invalid amount in cents. Max value is 99999999"
+        )
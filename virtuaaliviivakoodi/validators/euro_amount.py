@@ -1,4 +1,5 @@
 import decimal
+import math
 from typing import Union
 
 from virtuaaliviivakoodi.exceptions import InvalidEuroAmountException
@@ -10,6 +11,14 @@ def validate_euro_amount(euro_amount: Union[float, int, decimal.Decimal]) -> Non
             "Euro amount must be float, integer or decimal value"
         )
 
+    # NaN cannot be compared, and signaling NaN raises decimal.InvalidOperation
+    if (
+        euro_amount.is_nan()
+        if isinstance(euro_amount, decimal.Decimal)
+        else isinstance(euro_amount, float) and math.isnan(euro_amount)
+    ):
+        raise InvalidEuroAmountException("Invalid euro amount. Must be a number.")
+
     if euro_amount < 0:
         raise InvalidEuroAmountException(
             "Invalid euro amount. Amount must be positive."
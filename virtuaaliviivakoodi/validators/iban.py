@@ -1,10 +1,29 @@
 import re
+from functools import lru_cache
 
 from virtuaaliviivakoodi.exceptions import InvalidIBANException
-from virtuaaliviivakoodi.utils import remove_whitespace
+from virtuaaliviivakoodi.utils import mod97, remove_whitespace
 
 FI_IBAN_REGEX = r"^FI\d{16}$"
 
+# "FI" with letters converted to numbers according to ISO 13616 (F = 15, I = 18),
+# appended to the BBAN together with the check digits: bban + "1518" + kk
+FI_SUFFIX = 151800
+FI_SHIFT = 10**6 % 97
+
+# Payee IBANs repeat across invoices, so checksum results are memoized
+IBAN_CHECKSUM_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=IBAN_CHECKSUM_CACHE_SIZE)
+def iban_checksum_ok(account: str) -> bool:
+    """Checks the ISO 13616 mod-97 checksum of a Finnish IBAN.
+
+    :param account: The 16 digits of the IBAN following the country code
+    """
+
+    return (mod97(account[2:]) * FI_SHIFT + FI_SUFFIX + int(account[:2])) % 97 == 1
+
 
 def validate_iban(iban: str) -> None:
     if not isinstance(iban, str):
@@ -15,5 +34,8 @@ def validate_iban(iban: str) -> None:
     if not iban_.startswith("FI"):
         raise InvalidIBANException("IBAN must be Finnish")
 
-    if not re.match(FI_IBAN_REGEX, iban_):
+    if not re.match(FI_IBAN_REGEX, iban_, re.ASCII):
         raise InvalidIBANException("Invalid IBAN")
+
+    if not iban_checksum_ok(iban_[2:]):
+        raise InvalidIBANException("Invalid IBAN checksum")
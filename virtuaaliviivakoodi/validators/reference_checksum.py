@@ -0,0 +1,68 @@
+from typing import Iterable, List, Union
+
+from virtuaaliviivakoodi.exceptions import InvalidReferenceException
+from virtuaaliviivakoodi.utils import finnish_reference_check_digit, mod97
+
+# "RF" with letters converted to numbers according to ISO 11649 (R = 27, F = 15),
+# appended to the reference body together with the check digits: body + "2715" + kk
+RF_SUFFIX = 271500
+RF_SHIFT = 10**6 % 97
+
+
+def rf_checksum_ok(body: str, check_digits: str) -> bool:
+    """Checks ISO 11649 check digits against the digits of an RF reference body"""
+
+    return (mod97(body) * RF_SHIFT + RF_SUFFIX + int(check_digits)) % 97 == 1
+
+
+def is_valid_finnish_reference_checksum(reference: str) -> bool:
+    """Checks the 7-3-1 check digit of a whitespace-free Finnish reference"""
+
+    return (
+        len(reference) >= 2
+        and reference.isascii()
+        and reference.isdigit()
+        and finnish_reference_check_digit(reference[:-1]) == int(reference[-1])
+    )
+
+
+def is_valid_rf_reference_checksum(reference: str) -> bool:
+    """Checks the ISO 11649 mod-97 check digits of a whitespace-free RF reference"""
+
+    return (
+        len(reference) >= 5
+        and reference.startswith("RF")
+        and reference.isascii()
+        and reference[2:].isdigit()
+        and rf_checksum_ok(reference[4:], reference[2:4])
+    )
+
+
+def is_valid_reference_checksum(reference: Union[str, int]) -> bool:
+    if not isinstance(reference, (str, int)):
+        return False
+
+    reference_ = "".join(str(reference).split())
+
+    if reference_.startswith("RF"):
+        return is_valid_rf_reference_checksum(reference_)
+
+    return is_valid_finnish_reference_checksum(reference_)
+
+
+def validate_reference_checksum(reference: Union[str, int]) -> None:
+    """Validates the check digits of a Finnish or RF reference"""
+
+    if not is_valid_reference_checksum(reference):
+        raise InvalidReferenceException(
+            "Invalid reference. Check digit does not match."
+        )
+
+
+def validate_reference_checksums(references: Iterable[Union[str, int]]) -> List[bool]:
+    """Checks the check digits of many references without raising.
+
+    :return: List telling whether each reference has valid check digits, in input order
+    """
+
+    return [is_valid_reference_checksum(reference) for reference in references]
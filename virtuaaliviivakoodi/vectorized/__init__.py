@@ -0,0 +1,45 @@
+from typing import Any, Optional
+
+from virtuaaliviivakoodi.dataclasses import VirtuaaliviivakoodiColumns
+
+from .python_backend import decode_python
+
+try:
+    from .numpy_backend import decode_numpy
+except ImportError:  # NumPy is an optional dependency
+    decode_numpy = None
+
+HAS_NUMPY = decode_numpy is not None
+
+
+def decode_virtuaaliviivakoodi_array(
+    virtuaaliviivakoodit: Any, backend: Optional[str] = None
+) -> VirtuaaliviivakoodiColumns:
+    """Decodes a whole array of virtuaaliviivakoodi's at once.
+
+    Every row is validated: it must be 54 digits, the symbol version must be 4 or 5
+    and the due date must be either a valid date or "000000". Invalid rows are marked
+    in the `valid` column instead of raising.
+
+    :param virtuaaliviivakoodit: Sequence of `str` or `bytes`, or with NumPy also an
+    `S54`/`U54` array or a (rows, 54) `uint8` array of character codes
+    :param backend: "numpy" or "python". By default NumPy is used when installed.
+
+    :return: VirtuaaliviivakoodiColumns with NumPy arrays for the "numpy" backend and
+    lists for the "python" backend
+    """
+
+    if backend is None:
+        backend = "numpy" if HAS_NUMPY else "python"
+
+    if backend == "numpy":
+        if decode_numpy is None:
+            raise ImportError(
+                "NumPy backend requires numpy. Install virtuaaliviivakoodi[numpy]."
+            )
+        return decode_numpy(virtuaaliviivakoodit)
+
+    if backend == "python":
+        return decode_python(virtuaaliviivakoodit)
+
+    raise ValueError("Invalid backend. Must be numpy or python.")
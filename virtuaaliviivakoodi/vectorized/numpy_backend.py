@@ -0,0 +1,79 @@
+from typing import Any
+
+import numpy as np
+
+from virtuaaliviivakoodi.dataclasses import VirtuaaliviivakoodiColumns
+
+WIDTH = 54
+
+AMOUNT_WEIGHTS = 10 ** np.arange(7, -1, -1, dtype=np.int64)
+AMOUNT_WEIGHTS.flags.writeable = False
+
+
+def _as_code_matrix(virtuaaliviivakoodit: Any) -> np.ndarray:
+    """Returns the virtuaaliviivakoodi's as a (rows, 55) matrix of character codes.
+
+    The extra column is non-zero only for inputs longer than 54 characters.
+    """
+
+    array = np.asarray(virtuaaliviivakoodit)
+
+    if array.dtype == np.uint8 and array.ndim == 2:
+        matrix = np.zeros((array.shape[0], WIDTH + 1), dtype=np.uint8)
+        matrix[:, : min(array.shape[1], WIDTH + 1)] = array[:, : WIDTH + 1]
+        return matrix
+
+    if array.dtype.kind not in "SU":
+        array = array.astype(str)
+
+    array = array.reshape(-1).astype(f"{array.dtype.kind}{WIDTH + 1}")
+    code_type = np.uint8 if array.dtype.kind == "S" else np.uint32
+
+    return array.view(code_type).reshape(array.shape[0], WIDTH + 1)
+
+
+def _days_in_month(month_starts: np.ndarray) -> np.ndarray:
+    return (
+        (month_starts + 1).astype("datetime64[D]")
+        - month_starts.astype("datetime64[D]")
+    ).astype(np.int64)
+
+
+def decode_numpy(virtuaaliviivakoodit: Any) -> VirtuaaliviivakoodiColumns:
+    """NumPy implementation of `decode_virtuaaliviivakoodi_array()`"""
+
+    codes = _as_code_matrix(virtuaaliviivakoodit)
+    digits = codes[:, :WIDTH] - codes.dtype.type(48)
+
+    valid = (codes[:, WIDTH] == 0) & (digits <= 9).all(axis=1)
+    digits = digits.astype(np.uint8)
+    valid &= (digits[:, 0] == 4) | (digits[:, 0] == 5)
+    digits[~valid] = 0
+
+    due_date_digits = digits[:, 48:].astype(np.int64)
+    years = 2000 + due_date_digits[:, 0] * 10 + due_date_digits[:, 1]
+    months = due_date_digits[:, 2] * 10 + due_date_digits[:, 3]
+    days = due_date_digits[:, 4] * 10 + due_date_digits[:, 5]
+    has_due_date = (months != 0) | (days != 0) | (years != 2000)
+
+    month_valid = (months >= 1) & (months <= 12)
+    month_starts = ((years - 1970) * 12 + np.where(month_valid, months, 1) - 1).astype(
+        "datetime64[M]"
+    )
+    day_valid = (days >= 1) & (days <= _days_in_month(month_starts))
+    valid &= ~has_due_date | (month_valid & day_valid)
+
+    due_dates = month_starts.astype("datetime64[D]") + (days - 1)
+    due_dates[~(valid & has_due_date)] = np.datetime64("NaT")
+
+    digits[~valid] = 0
+    characters = digits + np.where(valid, np.uint8(48), np.uint8(0))[:, None]
+
+    return VirtuaaliviivakoodiColumns(
+        valid=valid,
+        symbols=digits[:, 0].copy(),
+        euro_cents=digits[:, 17:25].astype(np.int64) @ AMOUNT_WEIGHTS,
+        due_dates=due_dates,
+        ibans=np.ascontiguousarray(characters[:, 1:17]).view("S16").reshape(-1),
+        references=np.ascontiguousarray(characters[:, 25:48]).view("S23").reshape(-1),
+    )
@@ -0,0 +1,67 @@
+from datetime import date
+from typing import Iterable, List, Optional, Union
+
+from virtuaaliviivakoodi.constants.virtuaaliviivakoodi_slice import (
+    VirtuaaliviivakoodiSlice,
+)
+from virtuaaliviivakoodi.dataclasses import VirtuaaliviivakoodiColumns
+from virtuaaliviivakoodi.exceptions import InvalidDueDateException
+from virtuaaliviivakoodi.utils import decode_due_date
+
+
+def decode_python(
+    virtuaaliviivakoodit: Iterable[Union[str, bytes]],
+) -> VirtuaaliviivakoodiColumns:
+    """Pure Python implementation of `decode_virtuaaliviivakoodi_array()`"""
+
+    valid: List[bool] = []
+    symbols: List[int] = []
+    euro_cents: List[int] = []
+    due_dates: List[Optional[date]] = []
+    ibans: List[bytes] = []
+    references: List[bytes] = []
+
+    for virtuaaliviivakoodi in virtuaaliviivakoodit:
+        if isinstance(virtuaaliviivakoodi, str):
+            virtuaaliviivakoodi = virtuaaliviivakoodi.encode("utf-8")
+
+        row_valid = (
+            len(virtuaaliviivakoodi) == 54
+            and virtuaaliviivakoodi.isdigit()
+            and virtuaaliviivakoodi[:1] in (b"4", b"5")
+        )
+
+        due_date: Optional[date] = None
+
+        if row_valid:
+            try:
+                due_date = decode_due_date(
+                    virtuaaliviivakoodi[VirtuaaliviivakoodiSlice.DATE].decode("ascii")
+                )
+            except InvalidDueDateException:
+                row_valid = False
+
+        valid.append(row_valid)
+
+        if not row_valid:
+            symbols.append(0)
+            euro_cents.append(0)
+            due_dates.append(None)
+            ibans.append(b"")
+            references.append(b"")
+            continue
+
+        symbols.append(virtuaaliviivakoodi[0] - 48)
+        euro_cents.append(int(virtuaaliviivakoodi[17:25]))
+        due_dates.append(due_date)
+        ibans.append(virtuaaliviivakoodi[VirtuaaliviivakoodiSlice.IBAN])
+        references.append(virtuaaliviivakoodi[25:48])
+
+    return VirtuaaliviivakoodiColumns(
+        valid=valid,
+        symbols=symbols,
+        euro_cents=euro_cents,
+        due_dates=due_dates,
+        ibans=ibans,
+        references=references,
+    )
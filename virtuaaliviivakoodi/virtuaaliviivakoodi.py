@@ -1,78 +1,52 @@
 import decimal
+import importlib
 from datetime import date
-from typing import Union
+from typing import Any, Optional, Union
 
-from virtuaaliviivakoodi.dataclasses import VirtuaaliviivakoodiDeconstruct
-from virtuaaliviivakoodi.deconstructors import (
-    deconstruct_amount,
-    deconstruct_date,
-    deconstruct_iban,
-    deconstruct_reference_and_version,
-)
-from virtuaaliviivakoodi.normalizers import (
-    normalize_due_date,
-    normalize_euro_amount,
-    normalize_iban,
-    normalize_reference,
-)
-from virtuaaliviivakoodi.utils import detect_symbol_version
-from virtuaaliviivakoodi.validators import (
-    validate_due_date,
-    validate_euro_amount,
-    validate_iban,
-    validate_length,
-    validate_reference,
+from virtuaaliviivakoodi.engine import (
+    prepare_amount,
+    prepare_due_date,
+    prepare_iban,
+    prepare_reference,
 )
 
 
-def virtuaaliviivakoodi(
+def virtuaaliviivakoodi(  # pylint: disable=too-many-arguments
     iban: str,
     reference: Union[int, str],
-    euro_amount: Union[float, int, decimal.Decimal],
+    euro_amount: Union[float, int, decimal.Decimal, None] = None,
     due_date: date = None,
+    *,
+    strict: bool = False,
+    amount_cents: Optional[int] = None,
 ) -> str:
     """Generates virtuaaliviivakoodi's based on Pankkiviivakoodi opas spec
     https://www.finanssiala.fi/wp-content/uploads/2021/03/Pankkiviivakoodi-opas.pdf
 
+    In strict mode the check digits of the reference are validated as well.
+    The amount is given either as `euro_amount` or as integer `amount_cents`.
     """
 
-    validate_iban(iban)
-    validate_reference(reference)
-    validate_euro_amount(euro_amount)
-    validate_due_date(due_date)
+    iban_segment = prepare_iban(iban)
+    symbol, reference_segment = prepare_reference(reference, strict)
+    euro_amount_segment = prepare_amount(euro_amount, amount_cents)
+    due_date_segment = prepare_due_date(due_date)
 
     return (
-        detect_symbol_version(reference).value
-        + normalize_iban(iban)
-        + normalize_euro_amount(euro_amount)
-        + normalize_reference(reference)
-        + normalize_due_date(due_date)
+        symbol
+        + iban_segment
+        + euro_amount_segment
+        + reference_segment
+        + due_date_segment
     )
 
 
-def deconstruct_virtuaaliviivakoodi(
-    # pylint: disable=W0621
-    virtuaaliviivakoodi: str,
-) -> VirtuaaliviivakoodiDeconstruct:
-    """Deconstructs virtuaaliviivakoodi into its parts.
-
-    :param virtuaaliviivakoodi: Virtuaaliviivakoodi to deconstruct
-
-    :return: VirtuaaliviivakoodiDeconstruct object containing
-    the deconstructed parts of the virtuaaliviivakoodi
-    """
-
-    validate_length(virtuaaliviivakoodi)
+def __getattr__(name: str) -> Any:
+    # Deconstruction lives in its own module, so that generating barcodes does not
+    # import it. It is still importable from here for backwards compatibility.
+    if name == "deconstruct_virtuaaliviivakoodi":
+        return importlib.import_module(
+            "virtuaaliviivakoodi.deconstruction"
+        ).deconstruct_virtuaaliviivakoodi
 
-    reference, symbol = deconstruct_reference_and_version(virtuaaliviivakoodi)
-    iban = deconstruct_iban(virtuaaliviivakoodi)
-    euro_amount = deconstruct_amount(virtuaaliviivakoodi)
-    due_date = deconstruct_date(virtuaaliviivakoodi)
-
-    return VirtuaaliviivakoodiDeconstruct(
-        symbol=symbol,
-        iban=iban,
-        reference=reference,
-        euro_amount=decimal.Decimal(euro_amount),
-        due_date=due_date,
-    )
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
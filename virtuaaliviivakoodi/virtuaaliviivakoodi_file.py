@@ -0,0 +1,266 @@
+import mmap
+import os
+from datetime import date
+from typing import Iterable, Iterator, List, Optional, Tuple, Union, overload
+
+from virtuaaliviivakoodi.dataclasses import (
+    VirtuaaliviivakoodiDeconstruct,
+    VirtuaaliviivakoodiView,
+)
+from virtuaaliviivakoodi.engine import prepare_iban
+from virtuaaliviivakoodi.exceptions import VirtuaaliviivakoodiException
+from virtuaaliviivakoodi.utils import encode_due_date
+from virtuaaliviivakoodi.validators import validate_length
+
+LENGTH = 54
+STRIDE = LENGTH + 1
+SCAN_CHUNK_RECORDS = 8192
+FIRST_DUE_DATE = date(2000, 1, 1)
+LAST_DUE_DATE = date(2099, 12, 31)
+
+Condition = Tuple[int, int, bytes, bytes]
+
+
+class VirtuaaliviivakoodiFile:
+    """Memory-mapped file of newline separated virtuaaliviivakoodi's.
+
+    Every record takes exactly 55 bytes, so record `n` starts at byte `55 * n` and can
+    be read without scanning the file. Records are returned as
+    `VirtuaaliviivakoodiView` objects, which decode their fields on demand.
+
+    Use `VirtuaaliviivakoodiFile.write()` to create or extend a file. Records can be
+    read from several threads at once, but the file must not be closed while other
+    threads are reading it.
+
+    :param path: Path of the file
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        self.path = path
+        self.closed = False
+
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+
+            # The newline of the last record is optional
+            if size % STRIDE not in (0, LENGTH):
+                raise VirtuaaliviivakoodiException(
+                    "Invalid virtuaaliviivakoodi file. "
+                    "Records must be 54 characters followed by a newline."
+                )
+
+            self._length = (size + 1) // STRIDE
+            self._mmap = (
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+            )
+
+    def __enter__(self) -> "VirtuaaliviivakoodiFile":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+        self.closed = True
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _check_open(self) -> None:
+        if self.closed:
+            raise ValueError("I/O operation on closed virtuaaliviivakoodi file")
+
+    @overload
+    def __getitem__(self, index: int) -> VirtuaaliviivakoodiView: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[VirtuaaliviivakoodiView]: ...
+
+    def __getitem__(self, index):
+        self._check_open()
+
+        if isinstance(index, slice):
+            return [self._view(i) for i in range(self._length)[index]]
+
+        if index < 0:
+            index += self._length
+
+        if not 0 <= index < self._length:
+            raise IndexError("Record index out of range")
+
+        return self._view(index)
+
+    def __iter__(self) -> Iterator[VirtuaaliviivakoodiView]:
+        return self.scan()
+
+    def _view(self, index: int) -> VirtuaaliviivakoodiView:
+        start = index * STRIDE
+
+        # A 54 byte copy keeps views valid after the file is closed
+        return VirtuaaliviivakoodiView(self._mmap[start : start + LENGTH])
+
+    def deconstruct(
+        self, index: int, amount_cents: bool = False
+    ) -> VirtuaaliviivakoodiDeconstruct:
+        """Returns record `index` as a `VirtuaaliviivakoodiDeconstruct`"""
+
+        return self[index].to_deconstruct(amount_cents)
+
+    def scan(
+        self,
+        iban: Optional[str] = None,
+        due_date_from: Optional[date] = None,
+        due_date_to: Optional[date] = None,
+        min_amount_cents: Optional[int] = None,
+        max_amount_cents: Optional[int] = None,
+    ) -> Iterator[VirtuaaliviivakoodiView]:
+        """Iterates over the records matching all of the given filters.
+
+        The filters are compared against the raw digits of each record, so records
+        that do not match are never decoded. Records without a due date do not match
+        a due date filter.
+
+        :param iban: IBAN of the payee
+        :param due_date_from: First accepted due date
+        :param due_date_to: Last accepted due date
+        :param min_amount_cents: Smallest accepted amount in cents
+        :param max_amount_cents: Largest accepted amount in cents
+
+        :return: Iterator of matching records in file order
+        """
+
+        self._check_open()
+        conditions: List[Condition] = []
+
+        if due_date_from is not None or due_date_to is not None:
+            # "yymmdd" digits of due dates in the 2000s sort in date order
+            conditions.append(
+                (
+                    48,
+                    54,
+                    encode_due_date(
+                        max(due_date_from or FIRST_DUE_DATE, FIRST_DUE_DATE)
+                    ).encode("ascii"),
+                    encode_due_date(
+                        min(due_date_to or LAST_DUE_DATE, LAST_DUE_DATE)
+                    ).encode("ascii"),
+                )
+            )
+
+        if min_amount_cents is not None or max_amount_cents is not None:
+            conditions.append(
+                (
+                    17,
+                    25,
+                    f"{max(min_amount_cents or 0, 0):08d}".encode("ascii"),
+                    (
+                        f"{min(max_amount_cents, 99999999):08d}".encode("ascii")
+                        if max_amount_cents is not None
+                        else b"99999999"
+                    ),
+                )
+            )
+
+        if self._mmap is None:
+            return iter(())
+
+        if iban is not None:
+            return self._scan_iban(
+                prepare_iban(iban).encode("ascii"), tuple(conditions)
+            )
+
+        return self._scan(tuple(conditions))
+
+    def _scan(
+        self, conditions: Tuple[Condition, ...]
+    ) -> Iterator[VirtuaaliviivakoodiView]:
+        chunk_size = SCAN_CHUNK_RECORDS * STRIDE
+
+        for chunk_start in range(0, self._length * STRIDE, chunk_size):
+            chunk = self._mmap[chunk_start : chunk_start + chunk_size]
+
+            for start in range(0, len(chunk), STRIDE):
+                for field_start, field_end, low, high in conditions:
+                    if not (
+                        low <= chunk[start + field_start : start + field_end] <= high
+                    ):
+                        break
+                else:
+                    yield VirtuaaliviivakoodiView(chunk[start : start + LENGTH])
+
+    def _scan_iban(
+        self, iban: bytes, conditions: Tuple[Condition, ...]
+    ) -> Iterator[VirtuaaliviivakoodiView]:
+        # The IBAN field is searched with mmap.find(), which skips non-matching
+        # records in C, and only hits at the IBAN offset of a record are accepted.
+        position = self._mmap.find(iban, 1)
+
+        while position != -1:
+            start = position - 1
+
+            if start % STRIDE == 0:
+                record = self._mmap[start : start + LENGTH]
+
+                for field_start, field_end, low, high in conditions:
+                    if not low <= record[field_start:field_end] <= high:
+                        break
+                else:
+                    yield VirtuaaliviivakoodiView(record)
+
+                position = self._mmap.find(iban, start + STRIDE + 1)
+            else:
+                position = self._mmap.find(iban, position + 1)
+
+    @staticmethod
+    def write(
+        path: Union[str, os.PathLike],
+        virtuaaliviivakoodit: Iterable[str],
+        append: bool = False,
+    ) -> int:
+        """Writes virtuaaliviivakoodi's into a file, one 55 byte record per line.
+
+        :param path: Path of the file
+        :param virtuaaliviivakoodit: Virtuaaliviivakoodi's to write
+        :param append: Append to an existing file instead of overwriting it
+
+        :return: Number of written records
+        :raises VirtuaaliviivakoodiException: if a virtuaaliviivakoodi is invalid.
+        The records before it may already be written.
+        """
+
+        count = 0
+
+        with open(path, "ab" if append else "wb") as file:
+            records: List[bytes] = []
+
+            # Terminate a last record written without a newline
+            if append and file.tell() % STRIDE == LENGTH:
+                records.append(b"\n")
+
+            for virtuaaliviivakoodi in virtuaaliviivakoodit:
+                validate_length(virtuaaliviivakoodi)
+
+                if not (
+                    virtuaaliviivakoodi.isascii()
+                    and virtuaaliviivakoodi.isdigit()
+                    and virtuaaliviivakoodi[0] in "45"
+                ):
+                    raise VirtuaaliviivakoodiException(
+                        "Invalid virtuaaliviivakoodi. Must contain only digits "
+                        "and start with symbol version 4 or 5."
+                    )
+
+                records.append(virtuaaliviivakoodi.encode("ascii") + b"\n")
+                count += 1
+
+                if len(records) == SCAN_CHUNK_RECORDS:
+                    file.write(b"".join(records))
+                    records.clear()
+
+            file.write(b"".join(records))
+
+        return count